@@ -19,6 +19,14 @@ from typing import Dict, List, Optional
 import asyncio
 from dotenv import load_dotenv
 
+# libjpeg-turbo directly for the MJPEG streams — cv2.imencode only uses it
+# if OpenCV was built against it
+try:
+    from turbojpeg import TurboJPEG, TJSAMP_420
+    _tj = TurboJPEG()
+except Exception:
+    _tj = None
+
 # Load environment variables
 load_dotenv()
 
@@ -849,8 +857,7 @@ def gen_video_frames(camera_id: str):
     if cap is None:
         # Return placeholder frame
         placeholder = create_placeholder_frame(camera_id)
-        _, buffer = cv2.imencode('.jpg', placeholder)
-        frame_bytes = buffer.tobytes()
+        frame_bytes = encode_jpeg(placeholder)
         yield (b'--frame\r\n' b'Content-Type: image/jpeg\r\n\r\n' + frame_bytes + b'\r\n')
         return
     
@@ -878,8 +885,7 @@ def gen_video_frames(camera_id: str):
                         cv2.rectangle(frame, (x1, y1), (x2, y2), (0, 0, 255), 2)
                 break
         
-        ret, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 80])
-        frame_bytes = buffer.tobytes()
+        frame_bytes = encode_jpeg(frame, quality=80)
         yield (b'--frame\r\n' b'Content-Type: image/jpeg\r\n\r\n' + frame_bytes + b'\r\n')
         
         time.sleep(0.033)  # ~30 FPS
@@ -887,6 +893,14 @@ def gen_video_frames(camera_id: str):
     cap.release()
 
 
+def encode_jpeg(frame, quality: int = 95) -> bytes:
+    """JPEG-encode a BGR frame (TurboJPEG when available, else OpenCV)."""
+    if _tj is not None:
+        return _tj.encode(frame, quality=quality, jpeg_subsample=TJSAMP_420)
+    _, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    return buffer.tobytes()
+
+
 def create_placeholder_frame(camera_id: str):
     """Create a placeholder frame when no video source is available."""
     # Create dark placeholder
@@ -9,14 +9,35 @@ Three detector classes used across ALL zones:
 All detectors are stateless per-frame — they just take a frame, run
 inference, and return structured results. Temporal logic stays in
 zone processors.
+
+Every detect() also accepts an optional frame_prep.PreparedFrame: the
+frame already letterboxed and uploaded once for all models.
+
+Every camera thread shares the same detector instances, so each model is
+wrapped in a BatchedModel: one thread owns the model and runs requests
+that arrive together from different cameras as a single batch.
 """
 
 import os
+import queue
 import logging
+import threading
 import traceback
 import numpy as np
+from concurrent.futures import Future
+from contextlib import nullcontext
 from typing import List, Dict, Any, Optional
 
+try:
+    import torch
+    TORCH_CUDA = torch.cuda.is_available()
+except ImportError:
+    torch = None
+    TORCH_CUDA = False
+
+from fast_ops import nms
+from frame_prep import predict
+
 
 # ============================================================================
 # MODEL AVAILABILITY FLAGS (checked once at module load)
@@ -25,6 +46,124 @@ _FIRE_SMOKE_MODEL_CHECKED = False
 _FIRE_SMOKE_MODEL_AVAILABLE = False
 
 
+# Compact per-detection record returned by WeaponDetector.detect_array()
+DETECTION_DTYPE = np.dtype([
+    ("class_id",   np.int32),
+    ("confidence", np.float32),
+    ("bbox",       np.int32, (4,)),
+])
+_EMPTY_DETECTIONS = np.empty(0, dtype=DETECTION_DTYPE)
+
+# Max frames per cross-camera batch; 1 calls the models directly
+SHARED_BATCH_MAX = int(os.getenv("SHARED_BATCH_MAX", "8"))
+
+
+def _build_class_filter(class_map: Dict[int, str], id_by_name: Dict[str, int]):
+    """Return (sorted allowed ids, lookup array mapping model id → unified id)."""
+    allowed = np.array(sorted(class_map), dtype=np.int32)
+    lookup  = np.full(max(class_map) + 1, -1, dtype=np.int32)
+    for cls_id, name in class_map.items():
+        lookup[cls_id] = id_by_name[name]
+    return allowed, lookup
+
+
+# ============================================================================
+# CROSS-CAMERA BATCHING
+# ============================================================================
+
+class BatchedModel:
+    """
+    Serialises calls to one shared YOLO model and batches across cameras.
+
+    ultralytics predictors are not thread-safe, yet every CameraWorker
+    thread calls the same weapon / gun / fire / pose model. Callers still
+    use model(source, **kwargs) and block for their own result; a collector
+    thread takes whatever requests are queued (same kwargs and input shape,
+    up to max_batch), runs one batched predict and hands each caller a
+    one-element result list. A lone camera never waits for a batch to fill
+    — requests queue up while the previous batch is running.
+    """
+
+    def __init__(self, model: Any, name: str, max_batch: int = SHARED_BATCH_MAX):
+        self.model     = model
+        self.max_batch = max_batch
+        self._queue    = queue.Queue()
+        self._thread   = threading.Thread(target=self._collect, name=f"batch-{name}", daemon=True)
+        self._thread.start()
+
+    def __getattr__(self, attr):
+        return getattr(self.model, attr)
+
+    def __call__(self, source: Any, **kwargs) -> Any:
+        future = Future()
+        self._queue.put((source, kwargs, future))
+        return future.result()
+
+    @staticmethod
+    def _batch_key(source: Any, kwargs: Dict[str, Any]) -> tuple:
+        return type(source), tuple(source.shape), repr(sorted(kwargs.items()))
+
+    def _collect(self):
+        stream  = torch.cuda.Stream() if TORCH_CUDA else None
+        pending = []
+        while True:
+            if not pending:
+                pending.append(self._queue.get())
+            while len(pending) < self.max_batch * 4:
+                try:
+                    pending.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            key = self._batch_key(pending[0][0], pending[0][1])
+            batch, rest = [], []
+            for request in pending:
+                if len(batch) < self.max_batch and self._batch_key(request[0], request[1]) == key:
+                    batch.append(request)
+                else:
+                    rest.append(request)
+            pending = rest
+            self._run(batch, stream)
+
+    def _run(self, batch: list, stream: Any):
+        sources = [source for source, _, _ in batch]
+        try:
+            with torch.cuda.stream(stream) if stream is not None else nullcontext():
+                if len(sources) == 1:
+                    results = self.model(sources[0], **batch[0][1])
+                elif isinstance(sources[0], np.ndarray):
+                    results = self.model(sources, **batch[0][1])
+                else:
+                    results = self.model(torch.cat(sources), **batch[0][1])
+            if stream is not None:
+                # Callers post-process on their own streams
+                stream.synchronize()
+        except Exception as e:
+            for _, _, future in batch:
+                future.set_exception(e)
+            return
+
+        if len(batch) == 1:
+            batch[0][2].set_result(results)
+        else:
+            for (_, _, future), result in zip(batch, results):
+                future.set_result([result])
+
+
+_batched_models: Dict[int, BatchedModel] = {}
+_batched_lock = threading.Lock()
+
+
+def batched(model: Any, name: str) -> Any:
+    """Return the BatchedModel for a shared model (one per model object); None stays None."""
+    if model is None or SHARED_BATCH_MAX <= 1:
+        return model
+    with _batched_lock:
+        if id(model) not in _batched_models:
+            _batched_models[id(model)] = BatchedModel(model, name)
+        return _batched_models[id(model)]
+
+
 # ============================================================================
 # WEAPON DETECTOR
 # ============================================================================
@@ -58,6 +197,17 @@ class WeaponDetector:
         0: "gun",
     }
 
+    # Unified class-id space for detect_array(): gun_model hits map onto
+    # the matching WEAPON_CLASS_MAP id by name.
+    _WEAPON_ID_BY_NAME = {name: cls_id for cls_id, name in WEAPON_CLASS_MAP.items()}
+
+    # Per-model (allowed class ids, model id → weapon id lookup) for
+    # vectorized filtering in _run_model. Keyed by id() of the class map.
+    _CLASS_FILTERS = {
+        id(WEAPON_CLASS_MAP): _build_class_filter(WEAPON_CLASS_MAP, _WEAPON_ID_BY_NAME),
+        id(GUN_CLASS_MAP):    _build_class_filter(GUN_CLASS_MAP, _WEAPON_ID_BY_NAME),
+    }
+
     MAX_CONSECUTIVE_FAILURES = 3
     
     # ─── FALSE POSITIVE FILTERS ───────────────────────────────────────────────
@@ -74,8 +224,8 @@ class WeaponDetector:
         - weapon_model: catches guns, knives, blades, scissors
         - gun_model: specialized high-precision gun detection
         """
-        self._weapon_model = registry.get_weapon_model()
-        self._gun_model = registry.get_gun_model()
+        self._weapon_model = batched(registry.get_weapon_model(), "weapon")
+        self._gun_model = batched(registry.get_gun_model(), "gun")
         self._config = registry.get_shared_config("weapon")
         self._consecutive_failures = 0
         self._disabled = False
@@ -96,10 +246,22 @@ class WeaponDetector:
         else:
             logging.info("WeaponDetector: gun model loaded (specialized gun detection)")
 
-    def detect(self, frame: np.ndarray) -> List[Dict[str, Any]]:
+    def detect(self, frame: np.ndarray, prepared: Any = None) -> List[Dict[str, Any]]:
         """
         Run weapon detection on a frame using BOTH models (ensemble approach).
-        
+
+        Thin dict wrapper around detect_array() for zone processors.
+
+        Returns:
+            List of dicts: [{class_name, confidence, bbox, class_id}, ...]
+            Empty list if models not loaded, disabled, or no weapons found.
+        """
+        return self._to_dicts(self.detect_array(frame, prepared))
+
+    def detect_array(self, frame: np.ndarray, prepared: Any = None) -> np.ndarray:
+        """
+        Run weapon detection and return a DETECTION_DTYPE structured array.
+
         Strategy:
         - weapon_model: general detection of guns, knives, blades, scissors
         - gun_model: specialized gun detection (higher precision for guns)
@@ -107,15 +269,14 @@ class WeaponDetector:
         - Deduplicate overlapping detections from both models
         - Apply false positive filters: area, confidence, max count
 
-        Returns:
-            List of dicts: [{class_name, confidence, bbox}, ...]
-            Empty list if models not loaded, disabled, or no weapons found.
+        class_id is always in WEAPON_CLASS_MAP id space (gun_model hits are
+        remapped by name), so callers can aggregate with np.bincount.
         """
         if self._disabled:
-            return []
-        
+            return _EMPTY_DETECTIONS
+
         if self._weapon_model is None and self._gun_model is None:
-            return []
+            return _EMPTY_DETECTIONS
 
         # Use higher threshold to reduce false positives (override via env if needed)
         min_conf = float(os.getenv("WEAPON_MIN_CONFIDENCE", str(self.MIN_CONFIDENCE_THRESHOLD)))
@@ -129,27 +290,31 @@ class WeaponDetector:
         frame_area = frame_h * frame_w
         max_box_area = frame_area * self.MAX_BOX_AREA_RATIO
         
-        detections = []
+        parts = []
 
         try:
             # ──── Run weapon_model.pt (catches all weapon types) ────
             if self._weapon_model:
-                detections.extend(
-                    self._run_model(self._weapon_model, frame, self.WEAPON_CLASS_MAP, conf_thresh, max_box_area)
+                parts.append(
+                    self._run_model(self._weapon_model, frame, self.WEAPON_CLASS_MAP, conf_thresh,
+                                    max_box_area, prepared)
                 )
             
             # ──── Run gun_model.pt (specialized, high-precision gun detection) ────
             if self._gun_model:
-                gun_detections = self._run_model(self._gun_model, frame, self.GUN_CLASS_MAP, conf_thresh, max_box_area)
-                detections.extend(gun_detections)
+                parts.append(
+                    self._run_model(self._gun_model, frame, self.GUN_CLASS_MAP, conf_thresh,
+                                    max_box_area, prepared)
+                )
+
+            detections = np.concatenate(parts) if len(parts) > 1 else parts[0]
             
             # ──── Deduplicate: remove overlapping detections from same class ────
+            # Output is sorted by confidence (highest first)
             detections = self._deduplicate_detections(detections)
             
             # ──── Limit max weapons per frame (prevent flooding) ────
             if len(detections) > self.MAX_WEAPONS_PER_FRAME:
-                # Keep highest confidence detections
-                detections.sort(key=lambda x: x["confidence"], reverse=True)
                 detections = detections[:self.MAX_WEAPONS_PER_FRAME]
                 logging.debug(f"WeaponDetector: capped to {self.MAX_WEAPONS_PER_FRAME} detections")
             
@@ -171,7 +336,7 @@ class WeaponDetector:
                     "Zone processors will use COCO fallback."
                 )
             
-            return []
+            return _EMPTY_DETECTIONS
     
     def _run_model(
         self,
@@ -180,105 +345,98 @@ class WeaponDetector:
         class_map: Dict[int, str],
         conf_thresh: float,
         max_box_area: float = None,
-    ) -> List[Dict[str, Any]]:
-        """Run a single model and extract detections with area filtering."""
-        detections = []
-        results = model(frame, verbose=False)
+        prepared: Any = None,
+    ) -> np.ndarray:
+        """
+        Run a single model and extract detections with area filtering.
+
+        Confidence and class filters are passed into the model call so they
+        are applied inside ultralytics' NMS; the survivors are copied to the
+        CPU once per result instead of once per box.
+        """
+        parts = []
+        allowed_ids, to_weapon_id = self._CLASS_FILTERS[id(class_map)]
+        results = predict(model, frame, prepared,
+                          verbose=False, conf=conf_thresh, classes=allowed_ids.tolist())
         
         for result in results:
             boxes = result.boxes
-            if boxes is None:
+            if boxes is None or len(boxes) == 0:
                 continue
-            for i in range(len(boxes)):
-                cls_id = int(boxes.cls[i].item())
-                conf = float(boxes.conf[i].item())
-                xyxy = boxes.xyxy[i].cpu().numpy().astype(int).tolist()
-                
-                class_name = class_map.get(cls_id)
-                if class_name is None:
-                    continue
-                if conf < conf_thresh:
-                    continue
-                
-                # ─── AREA FILTER: Discard suspiciously large boxes ───
-                if max_box_area is not None:
-                    x1, y1, x2, y2 = xyxy
-                    box_area = (x2 - x1) * (y2 - y1)
-                    if box_area > max_box_area:
-                        logging.debug(
-                            f"WeaponDetector: discarding {class_name} box - "
-                            f"area {box_area:.0f} > max {max_box_area:.0f} (full-frame false positive)"
-                        )
-                        continue
-                
-                detections.append({
-                    "class_name": class_name,
-                    "confidence": conf,
-                    "bbox": xyxy,
-                    "class_id": cls_id,
-                })
-        
-        return detections
+
+            cls_ids = boxes.cls.cpu().numpy().astype(np.int32)
+            confs   = boxes.conf.cpu().numpy().astype(np.float32)
+            xyxy    = boxes.xyxy.cpu().numpy().astype(np.int32)
+
+            # Re-check on CPU in case the backend ignored the kwargs
+            keep = (confs >= conf_thresh) & np.isin(cls_ids, allowed_ids)
+
+            # ─── AREA FILTER: Discard suspiciously large boxes ───
+            if max_box_area is not None:
+                areas = (xyxy[:, 2] - xyxy[:, 0]) * (xyxy[:, 3] - xyxy[:, 1])
+                too_big = keep & (areas > max_box_area)
+                if too_big.any():
+                    logging.debug(
+                        f"WeaponDetector: discarding {int(too_big.sum())} box(es) - "
+                        f"area > max {max_box_area:.0f} (full-frame false positive)"
+                    )
+                keep &= ~too_big
+
+            n = int(keep.sum())
+            if n == 0:
+                continue
+
+            dets = np.empty(n, dtype=DETECTION_DTYPE)
+            dets["class_id"]   = to_weapon_id[cls_ids[keep]]
+            dets["confidence"] = confs[keep]
+            dets["bbox"]       = xyxy[keep]
+            parts.append(dets)
+
+        if not parts:
+            return _EMPTY_DETECTIONS
+        return np.concatenate(parts) if len(parts) > 1 else parts[0]
     
-    def _deduplicate_detections(self, detections: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _deduplicate_detections(self, detections: np.ndarray) -> np.ndarray:
         """
         Remove duplicate/overlapping detections from same class.
         
-        If two detections of the same class overlap, keep the higher confidence one.
+        Per-class greedy NMS (IoU > 0.3): if two detections of the same class
+        overlap, keep the higher confidence one.
+        Returns the kept detections sorted by confidence (highest first).
         """
-        if not detections:
-            return []
-        
-        # Group by class
-        by_class = {}
-        for det in detections:
-            cls = det["class_name"]
-            if cls not in by_class:
-                by_class[cls] = []
-            by_class[cls].append(det)
-        
-        # Deduplicate within each class
-        dedup = []
-        for cls, dets in by_class.items():
-            # Sort by confidence (highest first)
-            dets.sort(key=lambda x: x["confidence"], reverse=True)
-            
-            # Keep high-confidence detections, skip overlapping lower-confidence ones
-            for det in dets:
-                # Check if this detection overlaps significantly with any kept detection
-                overlaps = False
-                for kept_det in dedup:
-                    if kept_det["class_name"] == cls:
-                        iou = self._compute_iou(det["bbox"], kept_det["bbox"])
-                        if iou > 0.3:  # Significant overlap threshold
-                            overlaps = True
-                            break
-                
-                if not overlaps:
-                    dedup.append(det)
-        
-        return dedup
-    
-    def _compute_iou(self, box1: List[int], box2: List[int]) -> float:
-        """Compute IoU between two bounding boxes."""
-        x1_min, y1_min, x1_max, y1_max = box1
-        x2_min, y2_min, x2_max, y2_max = box2
-        
-        inter_xmin = max(x1_min, x2_min)
-        inter_ymin = max(y1_min, y2_min)
-        inter_xmax = min(x1_max, x2_max)
-        inter_ymax = min(y1_max, y2_max)
-        
-        if inter_xmax < inter_xmin or inter_ymax < inter_ymin:
-            return 0.0
-        
-        inter_area = (inter_xmax - inter_xmin) * (inter_ymax - inter_ymin)
-        box1_area = (x1_max - x1_min) * (y1_max - y1_min)
-        box2_area = (x2_max - x2_min) * (y2_max - y2_min)
-        union_area = box1_area + box2_area - inter_area
-        
-        return inter_area / union_area if union_area > 0 else 0.0
+        if len(detections) == 0:
+            return detections
+
+        kept = []
+        for cls_id in np.unique(detections["class_id"]):
+            idx = np.flatnonzero(detections["class_id"] == cls_id)
+            keep = nms(
+                detections["bbox"][idx].astype(np.float32),
+                detections["confidence"][idx],
+                0.3,
+            )
+            kept.append(idx[keep])
 
+        kept = np.concatenate(kept)
+        detections = detections[kept]
+        return detections[np.argsort(-detections["confidence"], kind="stable")]
+
+    def _to_dicts(self, detections: np.ndarray) -> List[Dict[str, Any]]:
+        """Materialise a DETECTION_DTYPE array as zone-processor dicts."""
+        return [
+            {
+                "class_name": self.WEAPON_CLASS_MAP[cls_id],
+                "confidence": conf,
+                "bbox":       bbox,
+                "class_id":   cls_id,
+            }
+            for cls_id, conf, bbox in zip(
+                detections["class_id"].tolist(),
+                detections["confidence"].tolist(),
+                detections["bbox"].tolist(),
+            )
+        ]
+    
     @property
     def is_available(self) -> bool:
         return (self._weapon_model is not None or self._gun_model is not None) and not self._disabled
@@ -349,7 +507,7 @@ class FireSmokeDetector:
         model_available = _check_fire_smoke_model_once(registry)
         
         if model_available:
-            self._model  = registry.get_fire_smoke_model()
+            self._model  = batched(registry.get_fire_smoke_model(), "fire-smoke")
             self._config = registry.get_shared_config("fire_smoke")
             if self._model:
                 logging.info("FireSmokeDetector: fire/smoke model loaded")
@@ -358,7 +516,7 @@ class FireSmokeDetector:
             self._config = None
             # No warning here — already logged by _check_fire_smoke_model_once
 
-    def detect(self, frame: np.ndarray) -> List[Dict[str, Any]]:
+    def detect(self, frame: np.ndarray, prepared: Any = None) -> List[Dict[str, Any]]:
         """
         Run fire/smoke detection on a frame.
 
@@ -371,7 +529,7 @@ class FireSmokeDetector:
         conf_thresh = self._config.confidence_threshold if self._config else 0.45
 
         try:
-            results    = self._model(frame, verbose=False)
+            results    = predict(self._model, frame, prepared, verbose=False)
             detections = []
 
             for result in results:
@@ -432,7 +590,7 @@ class PoseDetector:
     """
 
     def __init__(self, registry):
-        self._model  = registry.get_pose_model()
+        self._model  = batched(registry.get_pose_model(), "pose")
         self._config = registry.get_shared_config("pose")
 
         if self._model is None:
@@ -443,7 +601,7 @@ class PoseDetector:
         else:
             logging.info("PoseDetector: pose model loaded")
 
-    def detect(self, frame: np.ndarray) -> List[Dict[str, Any]]:
+    def detect(self, frame: np.ndarray, prepared: Any = None) -> List[Dict[str, Any]]:
         """
         Run pose estimation on a frame.
 
@@ -465,7 +623,7 @@ class PoseDetector:
         conf_thresh = self._config.confidence_threshold if self._config else 0.50
 
         try:
-            results = self._model(frame, verbose=False)
+            results = predict(self._model, frame, prepared, verbose=False)
             poses   = []
 
             for result in results:
@@ -12,6 +12,7 @@ This checks:
 import os
 import sys
 import cv2
+import numpy as np
 from pathlib import Path
 
 # Add parent directory to path
@@ -37,6 +38,13 @@ def analyze_video(video_path: str, weapon_detector: WeaponDetector, max_frames:
         "confidence_samples": [],
     }
     
+    class_names = WeaponDetector.WEAPON_CLASS_MAP
+    class_counts = np.zeros(max(class_names) + 1, dtype=np.int64)
+    
+    # First 20 confidences, rounded once at the end
+    samples = np.empty(20, dtype=np.float64)
+    n_samples = 0
+    
     frame_count = 0
     while frame_count < max_frames:
         ret, frame = cap.read()
@@ -45,32 +53,35 @@ def analyze_video(video_path: str, weapon_detector: WeaponDetector, max_frames:
         
         results["total_frames"] += 1
         
-        # Run weapon detection
-        detections = weapon_detector.detect(frame)
+        # Run weapon detection (structured array: class_id / confidence / bbox)
+        detections = weapon_detector.detect_array(frame)
         
-        if detections:
+        if len(detections):
+            scores = detections["confidence"]
             results["frames_with_weapons"] += 1
             results["total_detections"] += len(detections)
             
-            for det in detections:
-                class_name = det.get("class_name", "unknown")
-                conf = det.get("confidence", 0.0)
-                
-                # Track by class
-                if class_name not in results["detections_by_class"]:
-                    results["detections_by_class"][class_name] = 0
-                results["detections_by_class"][class_name] += 1
-                
-                # Track max confidence
-                if conf > results["max_confidence"]:
-                    results["max_confidence"] = conf
-                
-                # Sample some confidence values
-                if len(results["confidence_samples"]) < 20:
-                    results["confidence_samples"].append(round(conf, 2))
+            # Track by class
+            class_counts += np.bincount(detections["class_id"], minlength=len(class_counts))
+            
+            # Track max confidence
+            results["max_confidence"] = max(results["max_confidence"], float(scores.max()))
+            
+            # Sample some confidence values
+            take = min(len(samples) - n_samples, len(scores))
+            if take > 0:
+                samples[n_samples:n_samples + take] = scores[:take]
+                n_samples += take
         
         frame_count += 1
     
+    results["confidence_samples"] = np.round(samples[:n_samples], 2).tolist()
+    results["detections_by_class"] = {
+        class_names[cls_id]: int(count)
+        for cls_id, count in enumerate(class_counts)
+        if count and cls_id in class_names
+    }
+    
     cap.release()
     
     # Compute rate
@@ -1,94 +1,128 @@
 # download_models.py
 # Run from your ai_worker/ directory
 # python download_models.py
+#
+# All downloads are network-bound and independent, so they run in a
+# thread pool and report as they finish.
 
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from ultralytics import YOLO
 from huggingface_hub import hf_hub_download
 
-os.makedirs("models", exist_ok=True)
+MODELS_DIR = "models"
+MAX_WORKERS = 4
+
+os.makedirs(MODELS_DIR, exist_ok=True)
+
 
 # ─────────────────────────────────────────────
-# 1. Standard YOLO base models (auto-downloads via ultralytics)
+# Download helpers
 # ─────────────────────────────────────────────
-print("Downloading base YOLO models...")
-for model_name in ["yolov8n.pt", "yolov8s.pt", "yolov8m.pt", "yolov8n-pose.pt"]:
+def fetch_yolo(model_name):
+    """Standard YOLO base model (auto-downloads via ultralytics)."""
     m = YOLO(model_name)  # downloads to ~/.ultralytics cache
-    src = m.ckpt_path
-    dst = f"models/{model_name}"
-    shutil.copy(src, dst)
-    print(f"  ✓ {model_name}")
+    shutil.copy(m.ckpt_path, os.path.join(MODELS_DIR, model_name))
+    return model_name
 
-# ─────────────────────────────────────────────
-# 2. Fire + Smoke model (public, no auth required)
-#    Repo: Notacodinggeek/yolov8n-fire-smoke
-#    Classes: fire, smoke
-# ─────────────────────────────────────────────
-print("\nDownloading fire/smoke model...")
-try:
-    path = hf_hub_download(
-        repo_id="Notacodinggeek/yolov8n-fire-smoke",
-        filename="best.pt"
-    )
-    shutil.copy(path, "models/fire_smoke_model.pt")
-    print("  ✓ fire_smoke_model.pt")
-except Exception as e:
-    print(f"  ✗ Primary failed: {e}")
-    print("  Trying fallback: touati-kamel/yolov8s-forest-fire-detection ...")
+
+def link_or_copy(src, dst):
+    """Hard-link `src` to `dst` (no second copy of the weights); copy across filesystems."""
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        return    # already linked by an earlier run
+    tmp = dst + ".tmp"
+    if os.path.exists(tmp):
+        os.remove(tmp)
     try:
-        path = hf_hub_download(
-            repo_id="touati-kamel/yolov8s-forest-fire-detection",
-            filename="best.pt"
-        )
-        shutil.copy(path, "models/fire_smoke_model.pt")
-        print("  ✓ fire_smoke_model.pt (fallback)")
-    except Exception as e2:
-        print(f"  ✗ Fallback also failed: {e2}")
-        print("  ⚠ Will use COCO-based heuristic fallback in fire_smoke_detector")
+        os.link(src, tmp)
+    except OSError:
+        shutil.copy(src, tmp)
+    os.replace(tmp, dst)
+
+
+def fetch_hf(sources, dst_name):
+    """
+    Download the first available (repo_id, filename) in `sources`.
+
+    hf_hub_download keeps its default cache (~/.cache/huggingface), so
+    re-runs skip weights that are already up to date; the cached file is
+    then hard-linked into models/.
+    """
+    last_error = None
+    for repo_id, filename in sources:
+        try:
+            path = hf_hub_download(repo_id=repo_id, filename=filename)
+            # The cache entry is a symlink into blobs/; link the real file
+            link_or_copy(os.path.realpath(path), os.path.join(MODELS_DIR, dst_name))
+            return f"{dst_name}  (from {repo_id})"
+        except Exception as e:
+            print(f"  ✗ {repo_id} failed: {e}")
+            last_error = e
+    raise last_error
+
 
 # ─────────────────────────────────────────────
-# 3. Weapon model — GUN detection
+# Download plan
+#
+# Fire + Smoke model (public, no auth required)
+#    Repo: Notacodinggeek/yolov8n-fire-smoke
+#    Classes: fire, smoke
+#    Fallback: touati-kamel/yolov8s-forest-fire-detection
+#
+# Weapon model — GUN detection
 #    Repo: Subh775/Firearm_Detection_Yolov8n
 #    Public, no auth. mAP@0.5 = 89%
 #    Classes: Gun
-# ─────────────────────────────────────────────
-print("\nDownloading gun/firearm model...")
-try:
-    path = hf_hub_download(
-        repo_id="Subh775/Firearm_Detection_Yolov8n",
-        filename="weights/best.pt"
-    )
-    shutil.copy(path, "models/gun_model.pt")
-    print("  ✓ gun_model.pt  (89% mAP, detects: Gun)")
-except Exception as e:
-    print(f"  ✗ Failed: {e}")
-
-# ─────────────────────────────────────────────
-# 4. Threat model — GUN + GRENADE (broader)
+#
+# Threat model — GUN + GRENADE (broader)
 #    Repo: Subh775/Threat-Detection-YOLOv8n
 #    Public, no auth. Gun: 96.7%, Grenade: 93.1%
 #    Classes: Gun, Grenade, Knife (multi-class)
 # ─────────────────────────────────────────────
-print("\nDownloading multi-threat model (gun+knife+grenade)...")
-try:
-    path = hf_hub_download(
-        repo_id="Subh775/Threat-Detection-YOLOv8n",
-        filename="weights/best.pt"
-    )
-    shutil.copy(path, "models/weapon_model.pt")
-    print("  ✓ weapon_model.pt  (Gun 96.7%, Grenade 93.1%)")
-except Exception as e:
-    print(f"  ✗ Failed: {e}")
-    print("  ⚠ Will fall back to COCO knife(43)+scissors(76) only")
+TASKS = [
+    (fetch_yolo, ("yolov8n.pt",), None),
+    (fetch_yolo, ("yolov8s.pt",), None),
+    (fetch_yolo, ("yolov8m.pt",), None),
+    (fetch_yolo, ("yolov8n-pose.pt",), None),
+    (
+        fetch_hf,
+        ([("Notacodinggeek/yolov8n-fire-smoke", "best.pt"),
+          ("touati-kamel/yolov8s-forest-fire-detection", "best.pt")],
+         "fire_smoke_model.pt"),
+        "Will use COCO-based heuristic fallback in fire_smoke_detector",
+    ),
+    (
+        fetch_hf,
+        ([("Subh775/Firearm_Detection_Yolov8n", "weights/best.pt")], "gun_model.pt"),
+        None,
+    ),
+    (
+        fetch_hf,
+        ([("Subh775/Threat-Detection-YOLOv8n", "weights/best.pt")], "weapon_model.pt"),
+        "Will fall back to COCO knife(43)+scissors(76) only",
+    ),
+]
+
+print(f"Downloading {len(TASKS)} models ({MAX_WORKERS} parallel)...")
+with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+    futures = {pool.submit(fn, *args): (args, note) for fn, args, note in TASKS}
+    for future in as_completed(futures):
+        args, note = futures[future]
+        try:
+            print(f"  ✓ {future.result()}")
+        except Exception as e:
+            print(f"  ✗ {args[-1]} failed: {e}")
+            if note:
+                print(f"  ⚠ {note}")
 
 # ─────────────────────────────────────────────
 # Summary
 # ─────────────────────────────────────────────
 print("\n─── models/ contents ───")
-for f in sorted(os.listdir("models")):
-    size_mb = os.path.getsize(f"models/{f}") / 1e6
+for f in sorted(os.listdir(MODELS_DIR)):
+    size_mb = os.path.getsize(f"{MODELS_DIR}/{f}") / 1e6
     print(f"  {f:<30} {size_mb:.1f} MB")
 
 print("\nDone! Verify each model with:")
-print("  python -c \"from ultralytics import YOLO; m=YOLO('models/weapon_model.pt'); print(m.names)\"")
\ No newline at end of file
+print("  python -c \"from ultralytics import YOLO; m=YOLO('models/weapon_model.pt'); print(m.names)\"")
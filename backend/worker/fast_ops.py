@@ -0,0 +1,300 @@
+"""
+Numba-accelerated box geometry kernels for SentinelAI.
+
+Shared by the tracker (class-consistency gating) and detector
+post-processing:
+- iou_matrix(a, b)             : (N,4) × (M,4) xyxy boxes → (N,M) IoU
+- nms(boxes, scores, iou_thr)  : greedy NMS → kept indices, best score first
+- hsv_hist_1024(hsv, out)      : 16×8×8 HSV colour histogram (Re-ID fallback)
+- gemv_i8(mat, vec, n)         : int8 (N,D) · (D,) → int32, first n rows (Re-ID gallery)
+- first_overlap_pair / overlap_pairs / first_inside_pair
+                               : pair searches for the legacy event helpers in worker.py
+
+Kernels are compiled with cache=True, so the object code is written to
+__pycache__ once and reused across runs. warmup() is called from
+ModelRegistry.__init__ so the first real frame doesn't pay for JIT.
+
+If numba is not installed the same functions run as plain Python —
+correct but slow, fine for the handful of boxes seen per frame. The
+legacy pair searches are swapped for NumPy-broadcast versions then, since
+they are called on every legacy frame.
+"""
+
+import time
+import logging
+import numpy as np
+from typing import Optional
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+# ============================================================================
+# KERNELS  (expect float32 arrays of xyxy boxes)
+# ============================================================================
+
+@njit(cache=True, nogil=True)
+def iou_matrix(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Pairwise IoU between every box in `a` (N,4) and every box in `b` (M,4)."""
+    n = a.shape[0]
+    m = b.shape[0]
+    out = np.zeros((n, m), dtype=np.float32)
+    for i in range(n):
+        ax1, ay1, ax2, ay2 = a[i, 0], a[i, 1], a[i, 2], a[i, 3]
+        area_a = (ax2 - ax1) * (ay2 - ay1)
+        for j in range(m):
+            iw = min(ax2, b[j, 2]) - max(ax1, b[j, 0])
+            if iw <= 0:
+                continue
+            ih = min(ay2, b[j, 3]) - max(ay1, b[j, 1])
+            if ih <= 0:
+                continue
+            inter = iw * ih
+            union = area_a + (b[j, 2] - b[j, 0]) * (b[j, 3] - b[j, 1]) - inter
+            if union > 0:
+                out[i, j] = inter / union
+    return out
+
+
+@njit(cache=True, nogil=True)
+def nms(boxes: np.ndarray, scores: np.ndarray, iou_thr: float) -> np.ndarray:
+    """
+    Greedy non-maximum suppression.
+
+    A box is dropped if its IoU with an already-kept, higher-scoring box
+    is greater than iou_thr. Returns kept indices in descending score order.
+    """
+    order = np.argsort(-scores)
+    n = order.shape[0]
+    suppressed = np.zeros(n, dtype=np.bool_)
+    keep = np.empty(n, dtype=np.int64)
+    k = 0
+    for oi in range(n):
+        i = order[oi]
+        if suppressed[i]:
+            continue
+        keep[k] = i
+        k += 1
+        x1, y1, x2, y2 = boxes[i, 0], boxes[i, 1], boxes[i, 2], boxes[i, 3]
+        area_i = (x2 - x1) * (y2 - y1)
+        for oj in range(oi + 1, n):
+            j = order[oj]
+            if suppressed[j]:
+                continue
+            iw = min(x2, boxes[j, 2]) - max(x1, boxes[j, 0])
+            ih = min(y2, boxes[j, 3]) - max(y1, boxes[j, 1])
+            if iw <= 0 or ih <= 0:
+                continue
+            inter = iw * ih
+            union = area_i + (boxes[j, 2] - boxes[j, 0]) * (boxes[j, 3] - boxes[j, 1]) - inter
+            if union > 0 and inter / union > iou_thr:
+                suppressed[j] = True
+    return keep[:k]
+
+
+@njit("void(uint8[::1], float32[::1])", cache=True, nogil=True)
+def hsv_hist_1024(hsv_flat: np.ndarray, out: np.ndarray):
+    """
+    Accumulate a 16×8×8 histogram of packed HSV pixels into `out` (1024,).
+
+    `hsv_flat` is a contiguous HSV uint8 image viewed as 1-D (H,S,V,H,S,V,...).
+    Bin layout matches a flattened cv2.calcHist([hsv], [0,1,2], None,
+    [16,8,8], [0,180,0,256,0,256]). `out` is added to, not cleared.
+    """
+    for i in range(hsv_flat.shape[0] // 3):
+        h = np.int32(hsv_flat[3 * i])
+        s = np.int32(hsv_flat[3 * i + 1])
+        v = np.int32(hsv_flat[3 * i + 2])
+        hb = (h * 16) // 180 if h < 180 else 15
+        out[(hb << 6) | ((s >> 5) << 3) | (v >> 5)] += 1.0
+
+
+@njit(cache=True, nogil=True, fastmath=True)
+def gemv_i8(mat: np.ndarray, vec: np.ndarray, n: int) -> np.ndarray:
+    """
+    Dot product of each of the first `n` int8 rows of `mat` with int8 `vec`,
+    accumulated in int32 (NumPy has no fast integer GEMV).
+    """
+    d   = mat.shape[1]
+    out = np.empty(n, dtype=np.int32)
+    for i in range(n):
+        acc = np.int32(0)
+        for j in range(d):
+            acc += np.int32(mat[i, j]) * np.int32(vec[j])
+        out[i] = acc
+    return out
+
+
+# ============================================================================
+# LEGACY EVENT KERNELS  (float64 xyxy boxes + per-box confidences)
+# ============================================================================
+
+@njit(cache=True, nogil=True)
+def _disjoint(a: np.ndarray, i: int, b: np.ndarray, j: int) -> bool:
+    # No positive-area overlap ⇒ IoU is 0; lets callers skip the division
+    return (a[i, 2] <= b[j, 0] or b[j, 2] <= a[i, 0]
+            or a[i, 3] <= b[j, 1] or b[j, 3] <= a[i, 1])
+
+
+@njit(cache=True, nogil=True)
+def _areas(boxes: np.ndarray) -> np.ndarray:
+    # Once per call, so the pair loops below never recompute an area
+    return (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+
+
+@njit(cache=True, nogil=True)
+def _pair_iou(a: np.ndarray, i: int, b: np.ndarray, j: int,
+              area_a: np.ndarray, area_b: np.ndarray) -> float:
+    iw = min(a[i, 2], b[j, 2]) - max(a[i, 0], b[j, 0])
+    ih = min(a[i, 3], b[j, 3]) - max(a[i, 1], b[j, 1])
+    inter = max(0.0, iw) * max(0.0, ih)
+    union = area_a[i] + area_b[j] - inter
+    return inter / union if union > 0 else 0.0
+
+
+@njit(cache=True, nogil=True)
+def first_overlap_pair(a, conf_a, b, conf_b, iou_thr, dist_thr, min_avg):
+    """
+    First (i, j) in row-major order where a[i] and b[j] overlap — IoU above
+    iou_thr or integer box centres closer than dist_thr — and their mean
+    confidence is at least min_avg. (-1, -1) if none.
+    """
+    area_a = _areas(a)
+    area_b = _areas(b)
+    for i in range(a.shape[0]):
+        cax = (a[i, 0] + a[i, 2]) // 2
+        cay = (a[i, 1] + a[i, 3]) // 2
+        for j in range(b.shape[0]):
+            if (conf_a[i] + conf_b[j]) / 2 < min_avg:
+                continue
+            if not _disjoint(a, i, b, j) and _pair_iou(a, i, b, j, area_a, area_b) > iou_thr:
+                return i, j
+            dx = cax - (b[j, 0] + b[j, 2]) // 2
+            dy = cay - (b[j, 1] + b[j, 3]) // 2
+            if np.sqrt(dx * dx + dy * dy) < dist_thr:
+                return i, j
+    return -1, -1
+
+
+@njit(cache=True, nogil=True)
+def overlap_pairs(boxes, conf, iou_thr, min_avg):
+    """All i < j (row-major) with IoU above iou_thr and mean confidence >= min_avg → (K,2)."""
+    n = boxes.shape[0]
+    areas = _areas(boxes)
+    out = np.empty((max(0, n * (n - 1) // 2), 2), dtype=np.int64)
+    k = 0
+    for i in range(n):
+        for j in range(i + 1, n):
+            # Cheapest rejections first: confidence, then axis-disjoint boxes
+            if (conf[i] + conf[j]) / 2 < min_avg or _disjoint(boxes, i, boxes, j):
+                continue
+            if _pair_iou(boxes, i, boxes, j, areas, areas) > iou_thr:
+                out[k, 0] = i
+                out[k, 1] = j
+                k += 1
+    return out[:k]
+
+
+@njit(cache=True, nogil=True)
+def first_inside_pair(outer, conf_o, inner, conf_i, min_avg):
+    """
+    First (i, j) in row-major order where box inner[j] lies entirely within
+    outer[i] and their mean confidence is at least min_avg. (-1, -1) if none.
+    """
+    for i in range(outer.shape[0]):
+        for j in range(inner.shape[0]):
+            if (inner[j, 0] >= outer[i, 0] and inner[j, 1] >= outer[i, 1]
+                    and inner[j, 2] <= outer[i, 2] and inner[j, 3] <= outer[i, 3]
+                    and (conf_o[i] + conf_i[j]) / 2 >= min_avg):
+                return i, j
+    return -1, -1
+
+
+def _pairwise_iou(a: np.ndarray, b: np.ndarray, area_a: Optional[np.ndarray] = None,
+                  area_b: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    (N,4) × (M,4) xyxy boxes → (N,M) IoU by broadcasting (same maths as
+    _pair_iou). Pass precomputed _areas() to reuse them across calls.
+    """
+    tl    = np.maximum(a[:, None, :2], b[None, :, :2])
+    br    = np.minimum(a[:, None, 2:], b[None, :, 2:])
+    inter = np.prod(np.clip(br - tl, 0, None), axis=2)
+    if area_a is None:
+        area_a = _areas(a)
+    if area_b is None:
+        area_b = _areas(b)
+    union = area_a[:, None] + area_b[None, :] - inter
+    return np.divide(inter, union, out=np.zeros_like(inter), where=union > 0)
+
+
+def _first_overlap_pair_np(a, conf_a, b, conf_b, iou_thr, dist_thr, min_avg):
+    """NumPy first_overlap_pair, for when numba is unavailable."""
+    ca = (a[:, :2] + a[:, 2:]) // 2
+    cb = (b[:, :2] + b[:, 2:]) // 2
+    d  = ca[:, None, :] - cb[None, :, :]
+    dist = np.sqrt(d[..., 0] * d[..., 0] + d[..., 1] * d[..., 1])
+    hit = (((conf_a[:, None] + conf_b[None, :]) / 2 >= min_avg)
+           & ((_pairwise_iou(a, b) > iou_thr) | (dist < dist_thr)))
+    flat = np.flatnonzero(hit)
+    if flat.size == 0:
+        return -1, -1
+    i, j = divmod(int(flat[0]), b.shape[0])
+    return i, j
+
+
+def _overlap_pairs_np(boxes, conf, iou_thr, min_avg):
+    """NumPy overlap_pairs, for when numba is unavailable."""
+    areas = _areas(boxes)
+    hit = (_pairwise_iou(boxes, boxes, areas, areas) > iou_thr) & ((conf[:, None] + conf[None, :]) / 2 >= min_avg)
+    return np.argwhere(np.triu(hit, 1))
+
+
+def _first_inside_pair_np(outer, conf_o, inner, conf_i, min_avg):
+    """NumPy first_inside_pair, for when numba is unavailable."""
+    hit = (np.all(inner[None, :, :2] >= outer[:, None, :2], axis=2)
+           & np.all(inner[None, :, 2:] <= outer[:, None, 2:], axis=2)
+           & ((conf_o[:, None] + conf_i[None, :]) / 2 >= min_avg))
+    flat = np.flatnonzero(hit)
+    if flat.size == 0:
+        return -1, -1
+    i, j = divmod(int(flat[0]), inner.shape[0])
+    return i, j
+
+
+if not NUMBA_AVAILABLE:
+    first_overlap_pair = _first_overlap_pair_np
+    overlap_pairs      = _overlap_pairs_np
+    first_inside_pair  = _first_inside_pair_np
+
+
+# ============================================================================
+# WARMUP
+# ============================================================================
+
+def warmup():
+    """Compile (or load cached) kernels for the signatures used at runtime."""
+    start = time.perf_counter()
+    boxes  = np.array([[0, 0, 10, 10], [5, 5, 15, 15]], dtype=np.float32)
+    scores = np.array([0.9, 0.8], dtype=np.float32)
+    iou_matrix(boxes, boxes)
+    nms(boxes, scores, 0.5)
+    emb = np.zeros((2, 8), dtype=np.int8)
+    gemv_i8(emb, emb[0], 2)
+    none = np.empty((0, 4), dtype=np.float64)
+    conf = np.empty(0, dtype=np.float64)
+    first_overlap_pair(none, conf, none, conf, 0.1, 100.0, 0.5)
+    overlap_pairs(none, conf, 0.15, 0.6)
+    first_inside_pair(none, conf, none, conf, 0.4)
+    logging.info(
+        f"fast_ops ready (numba={'✓' if NUMBA_AVAILABLE else '✗'}, "
+        f"{(time.perf_counter() - start) * 1000:.0f} ms)"
+    )
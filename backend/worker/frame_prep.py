@@ -0,0 +1,100 @@
+"""
+One-per-frame preprocessing shared by every YOLO model for SentinelAI.
+
+Every ultralytics predict() on a numpy frame letterboxes, converts
+BGR→RGB / HWC→CHW, casts and uploads it again — with four zone models and
+three shared detectors that is the same work seven times per frame.
+
+FramePreprocessor does it once:
+- letterbox exactly as ultralytics' predictor would (rect, stride 32)
+- one small host→device copy (uint8, from a reused pinned buffer), then
+  FP16 or FP32 on the device, values in [0, 1]
+
+Models are then called on PreparedFrame.tensor via predict(); ultralytics
+skips its own preprocessing for tensor input, and restore() maps boxes
+and keypoints back onto the original frame so callers see the same
+coordinates as before.
+"""
+
+import numpy as np
+from typing import Any, Optional
+
+try:
+    import torch
+    TORCH_AVAILABLE = True
+except ImportError:
+    TORCH_AVAILABLE = False
+
+
+class PreparedFrame:
+    """A frame letterboxed once into a (1, 3, H, W) device tensor."""
+
+    __slots__ = ("frame", "tensor")
+
+    def __init__(self, frame: np.ndarray, tensor: Any):
+        self.frame  = frame
+        self.tensor = tensor
+
+    def restore(self, results: Any) -> Any:
+        """Map boxes / keypoints in `results` from tensor to frame coordinates (in place)."""
+        from ultralytics.utils import ops
+
+        img_shape  = self.tensor.shape[2:]
+        orig_shape = self.frame.shape[:2]
+        # predict() returns inference tensors; they may only be edited in this mode
+        with torch.inference_mode():
+            for result in results:
+                result.orig_img   = self.frame
+                result.orig_shape = orig_shape
+                if result.boxes is not None:
+                    boxes = result.boxes.data
+                    boxes[:, :4] = ops.scale_boxes(img_shape, boxes[:, :4], orig_shape)
+                    result.boxes.orig_shape = orig_shape
+                if getattr(result, "keypoints", None) is not None:
+                    kpts = result.keypoints.data
+                    kpts[..., :2] = ops.scale_coords(img_shape, kpts[..., :2], orig_shape)
+                    result.keypoints.orig_shape = orig_shape
+        return results
+
+
+class FramePreprocessor:
+    """
+    Letterbox + upload a BGR frame once for all models.
+
+    Uses ultralytics' LetterBox with the predictor's settings (imgsz 640,
+    minimal stride-32 padding), so detections match per-model
+    preprocessing.
+    """
+
+    def __init__(self, imgsz: int = 640, half: bool = True, device: str = "cuda"):
+        from ultralytics.data.augment import LetterBox
+
+        self._letterbox = LetterBox((imgsz, imgsz), auto=True, stride=32)
+        self._device    = torch.device(device)
+        self._dtype     = torch.float16 if half else torch.float32
+        self._pinned    = None    # page-locked upload buffer, reused while the size holds
+
+    def __call__(self, frame: np.ndarray) -> PreparedFrame:
+        img = self._letterbox(image=frame)
+        chw = img[..., ::-1].transpose(2, 0, 1)
+        if self._device.type == "cuda":
+            if self._pinned is None or tuple(self._pinned.shape) != chw.shape:
+                self._pinned = torch.empty(chw.shape, dtype=torch.uint8, pin_memory=True)
+            # BGR→RGB + HWC→CHW straight into pinned memory, then a direct DMA upload
+            np.copyto(self._pinned.numpy(), chw)
+            tensor = self._pinned.to(self._device, non_blocking=True)
+        else:
+            tensor = torch.from_numpy(np.ascontiguousarray(chw))
+        tensor = tensor.to(self._dtype).div_(255).unsqueeze_(0)
+        if self._device.type == "cuda":
+            # Frees the pinned buffer for the next frame; consumers may run
+            # on other CUDA streams
+            torch.cuda.current_stream(self._device).synchronize()
+        return PreparedFrame(frame, tensor)
+
+
+def predict(model: Any, frame: np.ndarray, prepared: Optional[PreparedFrame] = None, **kwargs) -> Any:
+    """model(frame, **kwargs), or on the shared prepared tensor with results mapped back to `frame`."""
+    if prepared is None:
+        return model(frame, **kwargs)
+    return prepared.restore(model(prepared.tensor, **kwargs))
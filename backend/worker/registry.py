@@ -17,10 +17,15 @@ Model roles:
 
 import os
 import logging
+import functools
 import threading
 from typing import Dict, Optional, Any
 from dataclasses import dataclass, field
 
+import numpy as np
+
+from fast_ops import iou_matrix, warmup as warmup_fast_ops
+
 # ============================================================================
 # YOLO CLASS IDs (COCO + custom)
 # ============================================================================
@@ -39,8 +44,8 @@ COCO_CLASSES = {
 }
 
 # Weapon class IDs from COCO (used as fallback if custom weapon model unavailable)
-COCO_WEAPON_CLASSES = {43, 76}           # knife, scissors
-VEHICLE_CLASSES     = {2, 3, 5, 7}       # car, motorcycle, bus, truck
+COCO_WEAPON_CLASSES = frozenset({43, 76})        # knife, scissors
+VEHICLE_CLASSES     = frozenset({2, 3, 5, 7})    # car, motorcycle, bus, truck
 
 # Custom weapon model class IDs (weapon_model.pt)
 # These are the class IDs your fine-tuned weapon model outputs.
@@ -58,6 +63,10 @@ FIRE_SMOKE_MODEL_CLASSES = {
     1: "smoke",
 }
 
+# Sorted vehicle ids for vectorized counting on raw model output.
+# The dict above stays the source of truth (and is used for logging).
+VEHICLE_IDS = np.array(sorted(VEHICLE_CLASSES), dtype=np.int32)
+
 
 # ============================================================================
 # ZONE MODEL CONFIGURATION
@@ -136,6 +145,63 @@ SHARED_MODEL_CONFIGS: Dict[str, SharedModelConfig] = {
     ),
 }
 
+# ---- INT8 TensorRT engines (shared detectors) ----
+# school_ground runs yolov8s + weapon + gun on every frame; the two custom
+# detectors are the heaviest part and tolerate INT8 well. Fire/smoke and
+# pose (coarse spatial tasks) opt in separately via SENTINEL_INT8_SHARED,
+# e.g. "fire_smoke,pose".
+# Calibration expects <calib_dir>/<key>.yaml (falling back to calib.yaml)
+# pointing at 500-1000 real frames from school cameras — for pose, a pose
+# dataset yaml (kpt_shape) of people in frame.
+INT8_WEAPON_ENABLED = os.getenv("SENTINEL_INT8_WEAPON", "0") == "1"
+INT8_CALIB_DIR      = os.getenv("SENTINEL_INT8_CALIB_DIR", "calib")
+INT8_SHARED_KEYS    = ({"weapon", "gun"} if INT8_WEAPON_ENABLED else set()) | {
+    key.strip() for key in os.getenv("SENTINEL_INT8_SHARED", "").split(",") if key.strip()
+}
+
+# ---- FP16 TensorRT engines (zone models) ----
+# Zone models are exported once to '<name>.fp16.engine' and loaded from
+# there: fused layers on Tensor Cores instead of the PyTorch path.
+TRT_ZONES_ENABLED = os.getenv("SENTINEL_TRT_ZONES", "0") == "1"
+
+
+# ============================================================================
+# MODEL PATH RESOLUTION
+# ============================================================================
+
+@functools.lru_cache(maxsize=64)
+def _resolve_model_path(model_file: str, base_dir: str, env_dir: str = "") -> str:
+    """
+    Resolve a model filename to a path (cached — each lookup costs up to
+    four stat calls). Call _resolve_model_path.cache_clear() after adding
+    model files at runtime.
+    """
+    # 1. Check worker/models/ subfolder first
+    models_dir = os.path.join(base_dir, "models")
+    local_path = os.path.join(models_dir, model_file)
+    if os.path.exists(local_path):
+        return local_path
+
+    # 1b. Check backend/models/ (new monorepo layout)
+    parent_models_dir = os.path.abspath(os.path.join(base_dir, "..", "models"))
+    parent_path = os.path.join(parent_models_dir, model_file)
+    if os.path.exists(parent_path):
+        return parent_path
+
+    # 2. Check same directory as registry.py
+    flat_path = os.path.join(base_dir, model_file)
+    if os.path.exists(flat_path):
+        return flat_path
+
+    # 3. Check env-configured model dir
+    if env_dir:
+        env_path = os.path.join(env_dir, model_file)
+        if os.path.exists(env_path):
+            return env_path
+
+    # 4. Return bare name — ultralytics will auto-download standard models
+    return model_file
+
 
 # ============================================================================
 # MODEL REGISTRY
@@ -177,11 +243,15 @@ class ModelRegistry:
             return
 
         self._zone_models:   Dict[str, Any] = {}
+        self._by_file:       Dict[str, Any] = {}   # model_file → model (shared across zones)
         self._shared_models: Dict[str, Any] = {}
         self._fallback_model = None
         self._initialized = True
         self._load_lock = threading.Lock()
 
+        # Compile tracker/NMS kernels now rather than on the first frame
+        warmup_fast_ops()
+
         logging.info("ModelRegistry initialized (zone + shared models)")
 
     # ------------------------------------------------------------------
@@ -190,34 +260,11 @@ class ModelRegistry:
 
     def _get_model_path(self, model_file: str) -> str:
         """Resolve model file path — local > env dir > ultralytics auto-download."""
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-
-        # 1. Check worker/models/ subfolder first
-        models_dir = os.path.join(base_dir, "models")
-        local_path = os.path.join(models_dir, model_file)
-        if os.path.exists(local_path):
-            return local_path
-
-        # 1b. Check backend/models/ (new monorepo layout)
-        parent_models_dir = os.path.abspath(os.path.join(base_dir, "..", "models"))
-        parent_path = os.path.join(parent_models_dir, model_file)
-        if os.path.exists(parent_path):
-            return parent_path
-
-        # 2. Check same directory as registry.py
-        flat_path = os.path.join(base_dir, model_file)
-        if os.path.exists(flat_path):
-            return flat_path
-
-        # 3. Check env-configured model dir
-        env_dir = os.getenv("YOLO_MODEL_DIR", "")
-        if env_dir:
-            env_path = os.path.join(env_dir, model_file)
-            if os.path.exists(env_path):
-                return env_path
-
-        # 4. Return bare name — ultralytics will auto-download standard models
-        return model_file
+        return _resolve_model_path(
+            model_file,
+            os.path.dirname(os.path.abspath(__file__)),
+            os.getenv("YOLO_MODEL_DIR", ""),
+        )
 
     def _load_model(self, model_file: str, allow_missing: bool = False) -> Optional[Any]:
         """
@@ -241,6 +288,60 @@ class ModelRegistry:
             logging.error(f"Failed to load model '{model_file}': {e}")
             return None
 
+    def _maybe_export_int8(self, model_file: str, calib_dir: str,
+                           key: Optional[str] = None) -> Optional[str]:
+        """
+        Return the path of a cached INT8 TensorRT engine for `model_file`,
+        exporting it first if needed.
+
+        Calibrates on '<calib_dir>/<key>.yaml' if it exists, else on
+        '<calib_dir>/calib.yaml'. The engine is written next to the .pt as
+        '<name>.int8.engine'. Returns None if the .pt is missing or export
+        fails (no TensorRT, no GPU, no calibration set) — caller then loads
+        the .pt as usual.
+        """
+        calib_yaml = os.path.join(calib_dir, f"{key}.yaml") if key else ""
+        if not os.path.exists(calib_yaml):
+            calib_yaml = os.path.join(calib_dir, "calib.yaml")
+        return self._maybe_export_engine(model_file, "int8", int8=True, data=calib_yaml)
+
+    def _maybe_export_fp16(self, model_file: str) -> Optional[str]:
+        """Cached FP16 TensorRT engine for `model_file` ('<name>.fp16.engine'), or None."""
+        return self._maybe_export_engine(model_file, "fp16", half=True)
+
+    def _maybe_export_engine(self, model_file: str, precision: str, **export_args) -> Optional[str]:
+        """Shared export-and-cache step for the INT8 / FP16 engines above."""
+        pt_path = self._get_model_path(model_file)
+        if not os.path.exists(pt_path):
+            return None
+
+        engine_path = os.path.splitext(pt_path)[0] + f".{precision}.engine"
+        if os.path.exists(engine_path):
+            return engine_path
+
+        label = precision.upper()
+        calib_yaml = export_args.get("data")
+        if calib_yaml and not os.path.exists(calib_yaml):
+            logging.warning(f"{label} export skipped for '{model_file}': {calib_yaml} not found")
+            return None
+
+        try:
+            from ultralytics import YOLO
+            logging.info(f"Exporting {label} engine for {model_file} (one-time, may take minutes)...")
+            exported = YOLO(pt_path).export(
+                format="engine",
+                workspace=4,
+                batch=8,
+                dynamic=True,   # batch=8 is the max; single frames still run
+                **export_args,
+            )
+            os.replace(exported, engine_path)
+            logging.info(f"{label} engine cached: {engine_path}")
+            return engine_path
+        except Exception as e:
+            logging.warning(f"{label} export failed for '{model_file}' — using .pt: {e}")
+            return None
+
     # ------------------------------------------------------------------
     # Zone model access
     # ------------------------------------------------------------------
@@ -250,6 +351,13 @@ class ModelRegistry:
         Get the primary YOLO model for a zone.
 
         Falls back to yolov8n.pt if zone model unavailable.
+
+        Zones that use the same model file (corridor + school_ground both
+        run yolov8s.pt) share one loaded model — per-zone classes and
+        thresholds come from get_config(), not the model object. Its
+        ultralytics predictor is not thread-safe and keeps each call's
+        settings, so DetectionPipeline drives shared models through one
+        BatchedModel.
         """
         with self._load_lock:
             if zone in self._zone_models:
@@ -260,10 +368,21 @@ class ModelRegistry:
                 logging.warning(f"Unknown zone '{zone}' — using fallback model")
                 return self._get_fallback()
 
-            model = self._load_model(config.model_file)
+            model = self._by_file.get(config.model_file)
             if model is None:
-                logging.warning(f"Zone model failed for '{zone}' — using fallback")
-                model = self._get_fallback()
+                if TRT_ZONES_ENABLED:
+                    engine_path = self._maybe_export_fp16(config.model_file)
+                    if engine_path:
+                        model = self._load_model(engine_path, allow_missing=True)
+                if model is None:
+                    model = self._load_model(config.model_file)
+                if model is None:
+                    logging.warning(f"Zone model failed for '{zone}' — using fallback")
+                    model = self._get_fallback()
+                else:
+                    self._by_file[config.model_file] = model
+            else:
+                logging.info(f"Zone '{zone}' sharing loaded model: {config.model_file}")
 
             self._zone_models[zone] = model
             return model
@@ -325,8 +444,15 @@ class ModelRegistry:
                 logging.error(f"Unknown shared model key: '{key}'")
                 return None
 
+            model = None
+            if key in INT8_SHARED_KEYS:
+                engine_path = self._maybe_export_int8(config.model_file, INT8_CALIB_DIR, key)
+                if engine_path:
+                    model = self._load_model(engine_path, allow_missing=True)
+
             # Custom models are allowed to be missing (allow_missing=True)
-            model = self._load_model(config.model_file, allow_missing=True)
+            if model is None:
+                model = self._load_model(config.model_file, allow_missing=True)
             self._shared_models[key] = model          # Cache even if None
             return model
 
@@ -345,7 +471,12 @@ class ModelRegistry:
     def _get_fallback(self) -> Any:
         """Return (and cache) the yolov8n fallback model."""
         if self._fallback_model is None:
-            self._fallback_model = self._load_model("yolov8n.pt")
+            model = self._by_file.get("yolov8n.pt")
+            if model is None:
+                model = self._load_model("yolov8n.pt")
+                if model is not None:
+                    self._by_file["yolov8n.pt"] = model
+            self._fallback_model = model
         return self._fallback_model
 
     def preload_all_models(self):
@@ -394,16 +525,147 @@ class TrackedObjectData:
     timestamp:    float  = 0.0
 
 
+# Default frame rate used to size ByteTrack's lost-track buffer when the
+# caller doesn't know the camera's real FPS.
+DEFAULT_TRACKER_FPS = 30
+
+
+class ByteTrackAdapter:
+    """
+    supervision ByteTrack behind the SimpleTracker interface.
+
+    Converts detection dicts to ``sv.Detections`` on the way in and the
+    tracked rows back to TrackedObjectData on the way out, so
+    DetectionPipeline._run_tracking doesn't care which backend is active.
+    """
+
+    def __init__(self, frame_rate: int = DEFAULT_TRACKER_FPS):
+        self._frame_rate = frame_rate
+        self._tracker    = self._build()
+        self._centroids: Dict[int, tuple] = {}
+
+    def _build(self) -> Any:
+        from supervision import ByteTrack
+        return ByteTrack(
+            track_activation_threshold=0.25,
+            lost_track_buffer=30,
+            frame_rate=self._frame_rate,
+        )
+
+    def update(self, detections: list) -> list:
+        import time
+        import supervision as sv
+
+        now = time.time()
+
+        if detections:
+            sv_dets = sv.Detections(
+                xyxy=np.array([d["bbox"] for d in detections], dtype=np.float32),
+                confidence=np.array([d["confidence"] for d in detections], dtype=np.float32),
+                class_id=np.array([d.get("class_id", 0) for d in detections], dtype=int),
+                data={"class_name": np.array([d["class_name"] for d in detections])},
+            )
+        else:
+            sv_dets = sv.Detections.empty()
+
+        tracked = self._tracker.update_with_detections(sv_dets)
+        if tracked.tracker_id is None or len(tracked) == 0:
+            self._centroids.clear()
+            return []
+
+        names = tracked.data.get("class_name")
+        n     = len(tracked)
+        return self._objects(
+            tracked.xyxy,
+            tracked.tracker_id,
+            tracked.class_id if tracked.class_id is not None else np.zeros(n, dtype=int),
+            names if names is not None else ["unknown"] * n,
+            tracked.confidence if tracked.confidence is not None else np.zeros(n),
+            now,
+        )
+
+    def _objects(self, xyxy, ids, class_ids, names, confs, now: float) -> list:
+        """Tracked rows → TrackedObjectData, with motion from last frame's centroids."""
+        results = []
+        seen    = {}
+        for i in range(len(ids)):
+            x1, y1, x2, y2 = xyxy[i].astype(int).tolist()
+            oid  = int(ids[i])
+            nc   = ((x1 + x2) / 2, (y1 + y2) / 2)
+            prev = self._centroids.get(oid, nc)
+            seen[oid] = nc
+            results.append(TrackedObjectData(
+                object_id=oid,
+                class_id=int(class_ids[i]),
+                class_name=str(names[i]),
+                bbox=[x1, y1, x2, y2],
+                confidence=float(confs[i]),
+                motion_vector=(nc[0] - prev[0], nc[1] - prev[1]),
+                timestamp=now,
+            ))
+
+        self._centroids = seen
+        return results
+
+    def reset(self):
+        self._tracker = self._build()
+        self._centroids.clear()
+
+
+class BoxmotByteTrackAdapter(ByteTrackAdapter):
+    """
+    boxmot BYTETracker behind the SimpleTracker interface.
+
+    boxmot takes an (N,6) [x1,y1,x2,y2,conf,cls] array and returns
+    [x1,y1,x2,y2,id,conf,cls,det_ind] rows; det_ind maps each track back
+    to its input detection for the class name.
+    """
+
+    # BYTETracker ignores the image but boxmot's update() requires an ndarray
+    _NO_IMAGE = np.zeros((1, 1, 3), dtype=np.uint8)
+
+    def _build(self) -> Any:
+        from boxmot import BYTETracker
+        return BYTETracker(frame_rate=self._frame_rate)
+
+    def update(self, detections: list) -> list:
+        import time
+
+        now = time.time()
+
+        if detections:
+            dets = np.array(
+                [[*d["bbox"], d["confidence"], d.get("class_id", 0)] for d in detections],
+                dtype=np.float32,
+            )
+        else:
+            dets = np.empty((0, 6), dtype=np.float32)
+
+        tracked = self._tracker.update(dets, self._NO_IMAGE)
+        if tracked is None or len(tracked) == 0:
+            self._centroids.clear()
+            return []
+
+        det_ind = tracked[:, 7].astype(int)
+        names   = [detections[j]["class_name"] if 0 <= j < len(detections) else "unknown"
+                   for j in det_ind]
+        return self._objects(tracked[:, :4], tracked[:, 4], tracked[:, 6].astype(int),
+                             names, tracked[:, 5], now)
+
+
 class SimpleTracker:
     """
-    Centroid-based tracker — fallback when ByteTrack is unavailable.
+    Centroid-based tracker — only used when ByteTrack is unavailable and
+    SENTINEL_ALLOW_SIMPLE=1 is set.
 
     Maintains object identity across frames using:
     - Centroid distance (greedy Hungarian-lite matching)
-    - Class consistency
+    - Class consistency (a class change needs IoU >= CLASS_MISMATCH_MIN_IOU)
     - Configurable max-disappear tolerance
     """
 
+    CLASS_MISMATCH_MIN_IOU = 0.1
+
     def __init__(self, max_disappeared: int = 10, max_distance: float = 100.0):
         self._next_id       = 0
         self._objects: Dict[int, dict] = {}
@@ -412,7 +674,6 @@ class SimpleTracker:
 
     def update(self, detections: list) -> list:
         import time
-        import numpy as np
 
         now = time.time()
 
@@ -433,21 +694,28 @@ class SimpleTracker:
                 self._register(det, input_centroids[i], now)
         else:
             obj_ids        = list(self._objects.keys())
-            obj_centroids  = [self._objects[oid]["centroid"] for oid in obj_ids]
+            obj_centroids  = np.array([self._objects[oid]["centroid"] for oid in obj_ids])
+            in_centroids   = np.array(input_centroids)
 
-            D = np.zeros((len(obj_ids), len(input_centroids)))
-            for i, oc in enumerate(obj_centroids):
-                for j, ic in enumerate(input_centroids):
-                    D[i, j] = np.hypot(oc[0] - ic[0], oc[1] - ic[1])
+            D = np.hypot(
+                obj_centroids[:, None, 0] - in_centroids[None, :, 0],
+                obj_centroids[:, None, 1] - in_centroids[None, :, 1],
+            )
 
-            matched_rows, matched_cols = set(), set()
-            for idx in np.argsort(D.flatten()):
-                r, c = divmod(int(idx), len(input_centroids))
-                if r in matched_rows or c in matched_cols:
-                    continue
-                if D[r, c] > self._max_distance:
-                    continue
+            # Class-consistency gate: a detection of a different class may
+            # only continue a track if the boxes genuinely overlap.
+            obj_classes = np.array([self._objects[oid]["class_name"] for oid in obj_ids])
+            in_classes  = np.array([det["class_name"] for det in detections])
+            mismatch    = obj_classes[:, None] != in_classes[None, :]
+            if mismatch.any():
+                ious = iou_matrix(
+                    np.array([self._objects[oid]["bbox"] for oid in obj_ids], dtype=np.float32),
+                    np.array([det["bbox"] for det in detections], dtype=np.float32),
+                )
+                D[mismatch & (ious < self.CLASS_MISMATCH_MIN_IOU)] = np.inf
 
+            matched_rows, matched_cols = set(), set()
+            for r, c in self._greedy_match(D):
                 oid = obj_ids[r]
                 det = detections[c]
                 prev = self._objects[oid]["centroid"]
@@ -487,6 +755,52 @@ class SimpleTracker:
             if obj["disappeared"] == 0
         ]
 
+    def _greedy_match(self, D) -> list:
+        """
+        Greedy smallest-distance-first matching over the (objects × detections)
+        distance matrix.
+
+        Only the 2k smallest distances are partially selected and sorted
+        (k = min(rows, cols)); the full argsort is used only if that budget
+        runs out before k pairs are matched and closer pairs remain.
+        """
+        n_cols = D.shape[1]
+        k      = min(D.shape)
+        flat   = D.ravel()
+        budget = 2 * k
+
+        if budget < flat.size:
+            order = np.argpartition(flat, budget)[:budget]
+            order = order[np.argsort(flat[order])]
+        else:
+            order = np.argsort(flat)
+
+        pairs = []
+        used_rows, used_cols = set(), set()
+
+        def _consume(indices) -> bool:
+            """Walk indices in distance order; True once matching is final."""
+            for idx in indices:
+                if len(pairs) == k:
+                    return True
+                idx = int(idx)
+                if flat[idx] > self._max_distance:
+                    return True     # sorted — nothing closer remains
+                r, c = divmod(idx, n_cols)
+                if r in used_rows or c in used_cols:
+                    continue
+                pairs.append((r, c))
+                used_rows.add(r)
+                used_cols.add(c)
+            return len(pairs) == k
+
+        if not _consume(order) and budget < flat.size:
+            # Budget exhausted by conflicting pairs — resume over the full order.
+            # Already-visited pairs are skipped by the row/col checks.
+            _consume(np.argsort(flat))
+
+        return pairs
+
     def _register(self, det: dict, centroid: tuple, ts: float):
         self._objects[self._next_id] = {
             "centroid":    centroid,
@@ -510,8 +824,8 @@ class TrackerRegistry:
     Per-camera tracker registry.
 
     Each camera gets its own tracker instance so object IDs remain
-    camera-local.  ByteTrack is used when available; SimpleTracker
-    is the fallback.
+    camera-local.  ByteTrack (supervision, else boxmot) is the required
+    backend; SimpleTracker is only allowed with SENTINEL_ALLOW_SIMPLE=1.
     """
 
     _instance = None
@@ -530,54 +844,96 @@ class TrackerRegistry:
             return
 
         self._trackers: Dict[str, Any] = {}
+        self._tracker_fps: Dict[str, int] = {}
+        self._create_locks: Dict[str, threading.Lock] = {}
         self._tracker_type = self._detect_tracker_type()
         self._initialized  = True
-        self._lock         = threading.Lock()
+        # Separate from the class-level _lock (singleton construction only)
+        self._write_lock   = threading.Lock()
 
         logging.info(f"TrackerRegistry initialized (backend: {self._tracker_type})")
 
     def _detect_tracker_type(self) -> str:
+        errors = []
         try:
             from supervision import ByteTrack
             return "bytetrack_sv"
-        except ImportError:
-            pass
+        except ImportError as e:
+            errors.append(f"supervision: {e}")
         try:
             from boxmot import BYTETracker
             return "bytetrack_boxmot"
-        except ImportError:
-            pass
-        logging.warning("ByteTrack not available — using SimpleTracker")
-        return "simple"
+        except ImportError as e:
+            errors.append(f"boxmot: {e}")
+
+        if os.getenv("SENTINEL_ALLOW_SIMPLE", "0") == "1":
+            logging.warning(
+                f"ByteTrack not available ({'; '.join(errors)}) — "
+                "using SimpleTracker (SENTINEL_ALLOW_SIMPLE=1)"
+            )
+            return "simple"
+
+        raise RuntimeError(
+            f"ByteTrack not available ({'; '.join(errors)}). "
+            "Install 'supervision' or set SENTINEL_ALLOW_SIMPLE=1 to use SimpleTracker."
+        )
 
-    def _create_tracker(self) -> Any:
+    def _create_tracker(self, frame_rate: int = DEFAULT_TRACKER_FPS) -> Any:
         if self._tracker_type == "bytetrack_sv":
-            from supervision import ByteTrack
-            return ByteTrack()
+            return ByteTrackAdapter(frame_rate=frame_rate)
         if self._tracker_type == "bytetrack_boxmot":
-            from boxmot import BYTETracker
-            return BYTETracker()
+            return BoxmotByteTrackAdapter(frame_rate=frame_rate)
         return SimpleTracker()
 
-    def get_tracker(self, camera_id: str) -> Any:
-        with self._lock:
-            if camera_id not in self._trackers:
-                self._trackers[camera_id] = self._create_tracker()
-                logging.info(f"Created tracker for camera: {camera_id}")
-            return self._trackers[camera_id]
+    def get_tracker(self, camera_id: str, fps: Optional[float] = None) -> Any:
+        """
+        Get (or create) the tracker for a camera.
+
+        Args:
+            camera_id: camera identifier
+            fps:       camera frame rate — sizes ByteTrack's lost-track
+                       buffer. Only used when the tracker is first created.
+        """
+        # Fast path: dict reads are atomic under the GIL, no lock needed
+        tracker = self._trackers.get(camera_id)
+        if tracker is not None:
+            return tracker
+
+        # Slow path: per-camera lock so cameras don't wait on each other
+        # while a tracker is built; the dicts themselves are only written
+        # under _write_lock.
+        with self._create_lock(camera_id):
+            tracker = self._trackers.get(camera_id)
+            if tracker is None:
+                frame_rate = max(1, int(round(fps))) if fps else DEFAULT_TRACKER_FPS
+                tracker = self._create_tracker(frame_rate)
+                with self._write_lock:
+                    self._tracker_fps[camera_id] = frame_rate
+                    self._trackers[camera_id]    = tracker
+                logging.info(f"Created tracker for camera: {camera_id} (fps={frame_rate})")
+            return tracker
+
+    def _create_lock(self, camera_id: str) -> threading.Lock:
+        # Entries are never dropped: a lock someone may hold must stay the
+        # one every later caller for this camera gets
+        return self._create_locks.setdefault(camera_id, threading.Lock())
 
     def reset_tracker(self, camera_id: str):
-        with self._lock:
+        with self._write_lock:
             if camera_id in self._trackers:
                 t = self._trackers[camera_id]
                 if hasattr(t, "reset"):
                     t.reset()
                 else:
-                    self._trackers[camera_id] = self._create_tracker()
+                    self._trackers[camera_id] = self._create_tracker(
+                        self._tracker_fps.get(camera_id, DEFAULT_TRACKER_FPS)
+                    )
 
     def remove_tracker(self, camera_id: str):
-        with self._lock:
+        # Waits out an in-progress get_tracker() so it can't re-insert afterwards
+        with self._create_lock(camera_id), self._write_lock:
             self._trackers.pop(camera_id, None)
+            self._tracker_fps.pop(camera_id, None)
 
 
 # ============================================================================
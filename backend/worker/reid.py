@@ -20,17 +20,32 @@ Cross-camera events:
 """
 
 import os
+import math
 import time
 import logging
 import threading
 import numpy as np
-from collections import defaultdict
-from typing import Dict, List, Optional, Tuple, Any
+from collections import defaultdict, deque
+from typing import Deque, Dict, List, Optional, Tuple, Any
+
+from fast_ops import NUMBA_AVAILABLE, gemv_i8, hsv_hist_1024
 
 # ── Config ────────────────────────────────────────────────────────────────────
 REID_SIMILARITY_THRESHOLD = float(os.getenv("REID_SIMILARITY_THRESHOLD", "0.65"))
 REID_GALLERY_TTL          = float(os.getenv("REID_GALLERY_TTL",          "120"))   # seconds
 REID_CROSS_CAMERA_WINDOW  = float(os.getenv("REID_CROSS_CAMERA_WINDOW",  "30"))    # seconds
+# CPU threads for the torchreid backend (0 = torch default). With several
+# camera workers on one host, set to about cpu_count / cameras to avoid
+# oversubscription.
+REID_TORCH_THREADS        = int(os.getenv("REID_TORCH_THREADS", "0"))
+# A track's global_person_id is reused for this long before its crop is
+# embedded and matched again (which also refines the gallery EMA).
+REID_REEMBED_INTERVAL     = float(os.getenv("REID_REEMBED_INTERVAL", "2.0"))  # seconds
+
+# OpenCV 8-bit hue is 0..179 → 16 bins (calcHist range [0, 180)), stored
+# pre-shifted into bits 6..9 of the packed histogram index.
+# 256 entries so any uint8 indexes safely.
+_H_BIN_LUT = (np.minimum(np.arange(256) * 16 // 180, 15) << 6).astype(np.uint16)
 
 
 # ============================================================================
@@ -49,15 +64,26 @@ class AppearanceEmbedder:
 
     def __init__(self):
         self._backend = self._init_backend()
+
+        # Histogram scratch buffers, reused across calls. Camera worker
+        # threads share one embedder, so they are guarded by a lock.
+        self._scratch_lock = threading.Lock()
+        self._resized = np.empty((128, 64, 3), dtype=np.uint8)
+        self._hsv     = np.empty_like(self._resized)
+
         logging.info(f"AppearanceEmbedder: using {self._backend} backend")
 
     def _init_backend(self) -> str:
         try:
+            import torch
             import torchreid
             self._reid_model = torchreid.utils.FeatureExtractor(
                 model_name="osnet_x0_25",
                 device="cpu",
             )
+            self._reid_model.model.eval()
+            if REID_TORCH_THREADS > 0:
+                torch.set_num_threads(REID_TORCH_THREADS)
             return "torchreid"
         except Exception:
             pass
@@ -84,32 +110,82 @@ class AppearanceEmbedder:
             logging.debug(f"AppearanceEmbedder error: {e}")
             return None
 
+    def extract_batch(self, crops: List[np.ndarray]) -> Optional[np.ndarray]:
+        """
+        Extract embeddings for several person crops in one call.
+
+        With torchreid this is a single batched forward pass instead of one
+        per person.
+
+        Args:
+            crops: non-empty BGR person crops (any size)
+
+        Returns:
+            (len(crops), D) float32 array of unit-length rows, or None on failure
+        """
+        if not crops:
+            return None
+
+        try:
+            if self._backend == "torchreid":
+                return self._torchreid_embed_batch(crops)
+            out = np.empty((len(crops), 1024), dtype=np.float32)
+            for i, crop in enumerate(crops):
+                self._histogram_embed(crop, out=out[i])
+            return out
+        except Exception as e:
+            logging.debug(f"AppearanceEmbedder batch error: {e}")
+            return None
+
     def _torchreid_embed(self, crop: np.ndarray) -> np.ndarray:
+        return self._torchreid_embed_batch([crop])[0]
+
+    def _torchreid_embed_batch(self, crops: List[np.ndarray]) -> np.ndarray:
         import cv2
         import torch
-        resized = cv2.resize(crop, (128, 256))
-        features = self._reid_model([resized])
-        emb = features[0].cpu().numpy()
-        return emb / (np.linalg.norm(emb) + 1e-6)
-
-    def _histogram_embed(self, crop: np.ndarray) -> np.ndarray:
+        import torch.nn.functional as F
+        resized = [cv2.resize(crop, (128, 256)) for crop in crops]
+        # No autograd/version-counter bookkeeping for pure inference
+        with torch.inference_mode():
+            features = self._reid_model(resized)
+            # Normalise on-device, then one device→host copy for the whole batch
+            features = F.normalize(features, dim=1).cpu()
+        return features.numpy().astype(np.float32, copy=False)
+
+    def _histogram_embed(
+        self,
+        crop: np.ndarray,
+        out:  Optional[np.ndarray] = None,
+    ) -> np.ndarray:
         """
         HSV colour histogram embedding.
         Bins: H=16, S=8, V=8 → 1024-dim vector.
         Normalised to unit length.
+
+        Written into `out` (a 1024 float32 vector owned by the caller) when
+        given, so the only per-call allocation is the result itself.
         """
         import cv2
-        resized = cv2.resize(crop, (64, 128))
-        hsv     = cv2.cvtColor(resized, cv2.COLOR_BGR2HSV)
-        hist    = cv2.calcHist(
-            [hsv], [0, 1, 2],
-            None,
-            [16, 8, 8],
-            [0, 180, 0, 256, 0, 256],
-        )
-        hist = hist.flatten().astype(np.float32)
-        norm = np.linalg.norm(hist)
-        return hist / (norm + 1e-6)
+        hist = np.empty(1024, dtype=np.float32) if out is None else out
+        with self._scratch_lock:
+            # Nearest-neighbour is plenty for a colour histogram
+            cv2.resize(crop, (64, 128), dst=self._resized, interpolation=cv2.INTER_NEAREST)
+            cv2.cvtColor(self._resized, cv2.COLOR_BGR2HSV, dst=self._hsv)
+            hsv = self._hsv
+            if NUMBA_AVAILABLE:
+                # Single fused pass, no temporaries
+                hist.fill(0.0)
+                hsv_hist_1024(hsv.reshape(-1), hist)
+            else:
+                # Packed bin id per pixel: h_bin<<6 | s>>5<<3 | v>>5 (same
+                # layout as a flattened 16×8×8 calcHist), then one bincount.
+                sv   = (hsv[..., 1] >> 5) << 3
+                sv  |= hsv[..., 2] >> 5
+                idx  = _H_BIN_LUT[hsv[..., 0]]
+                idx |= sv
+                hist[:] = np.bincount(idx.ravel(), minlength=1024)
+        hist *= 1.0 / (math.sqrt(float(np.vdot(hist, hist))) + 1e-6)
+        return hist
 
 
 # ============================================================================
@@ -120,90 +196,191 @@ class PersonGallery:
     """
     Thread-safe gallery of known person appearances.
 
-    Each entry stores:
-    - embedding:   appearance feature vector
-    - camera_ids:  set of cameras where person was seen
-    - last_seen:   timestamp of last sighting
+    Stored column-wise (one row per person, row i ↔ _gids[i]):
+    - _embs:       (capacity, D) int8 L2-normalised embeddings, scaled by 127
+    - _last_seen:  (capacity,)   float64 timestamp of last sighting
+    - _cam_ids:    list of sets — cameras where each person was seen
+
+    Matching is a single matrix-vector product over _embs[:n]; expiry is a
+    single vectorised comparison over _last_seen[:n].
+
+    Unit-length embeddings live in [-1, 1], so symmetric int8 quantisation
+    barely moves cosine rankings while cutting gallery bytes 4× versus
+    float32 — the matmul is memory-bound.
     """
 
+    INITIAL_CAPACITY = 64
+    EMA_ALPHA        = 0.3                 # weight of the new sighting
+    _EMA_KEEP        = 1.0 - EMA_ALPHA
+    _Q_SCALE         = 127.0
+    _SIM_SCALE       = 1.0 / (127.0 * 127.0)
+
     def __init__(self, ttl: float = REID_GALLERY_TTL):
         self._ttl   = ttl
         self._lock  = threading.Lock()
         self._next_id = 1
-        # global_person_id → {embedding, camera_ids, last_seen}
-        self._gallery: Dict[int, dict] = {}
+
+        # Allocated on first register (D depends on the embedder backend)
+        self._embs:      Optional[np.ndarray] = None
+        self._last_seen  = np.empty(0, dtype=np.float64)
+        self._gids       = np.empty(0, dtype=np.int64)
+        self._cam_ids:   List[set] = []
+        self._gid_to_row: Dict[int, int] = {}
+        self._n = 0
+        # (D,) scratch vectors, used under the lock
+        self._ema_tmp: Optional[np.ndarray] = None   # float32
+        self._row_tmp: Optional[np.ndarray] = None   # float32
+        self._q_tmp:   Optional[np.ndarray] = None   # int8 quantised query
 
     def match_or_register(
         self,
         embedding:  np.ndarray,
         camera_id:  str,
         threshold:  float = REID_SIMILARITY_THRESHOLD,
-    ) -> Tuple[int, float]:
+        now:        Optional[float] = None,
+    ) -> Tuple[int, float, List[str]]:
         """
         Find the best matching person in the gallery or register a new one.
 
+        `now` is a time.monotonic() timestamp (read here if not given).
+
         Returns:
-            (global_person_id, similarity_score)
-            If new person: similarity_score = 0.0
+            (global_person_id, similarity_score, cameras_seen)
+            If new person: similarity_score = 0.0, cameras_seen = [camera_id]
         """
+        if now is None:
+            now = time.monotonic()
         with self._lock:
-            self._expire()
-
-            best_id    = None
-            best_sim   = 0.0
-
-            for gid, entry in self._gallery.items():
-                sim = float(np.dot(embedding, entry["embedding"]))
-                if sim > best_sim:
-                    best_sim = sim
-                    best_id  = gid
-
-            if best_id is not None and best_sim >= threshold:
-                # Update existing entry
-                entry = self._gallery[best_id]
-                # Exponential moving average of embedding
-                alpha = 0.3
-                entry["embedding"] = (
-                    alpha * embedding + (1 - alpha) * entry["embedding"]
-                )
-                entry["embedding"] /= (np.linalg.norm(entry["embedding"]) + 1e-6)
-                entry["camera_ids"].add(camera_id)
-                entry["last_seen"] = time.time()
-                return best_id, best_sim
-            else:
-                # Register new person
-                new_id = self._next_id
-                self._next_id += 1
-                self._gallery[new_id] = {
-                    "embedding":  embedding.copy(),
-                    "camera_ids": {camera_id},
-                    "last_seen":  time.time(),
-                }
-                return new_id, 0.0
+            self._expire(now)
+
+            if self._n:
+                sims     = self._similarities(embedding)
+                best_row = int(np.argmax(sims))
+                best_sim = float(sims[best_row]) * self._SIM_SCALE
+
+                if best_sim > 0.0 and best_sim >= threshold:
+                    # Exponential moving average of embedding, done in float
+                    # on the dequantised row: keep*row + alpha*emb, renormalise
+                    row = self._row_tmp
+                    np.multiply(self._embs[best_row], self._EMA_KEEP / self._Q_SCALE, out=row)
+                    np.multiply(embedding, self.EMA_ALPHA, out=self._ema_tmp)
+                    row += self._ema_tmp
+                    row *= 1.0 / (math.sqrt(float(np.vdot(row, row))) + 1e-6)
+                    self._quantize(row, self._embs[best_row])
+                    cams = self._cam_ids[best_row]
+                    cams.add(camera_id)
+                    self._last_seen[best_row] = now
+                    return int(self._gids[best_row]), best_sim, list(cams)
+
+            # Register new person
+            new_id = self._next_id
+            self._next_id += 1
+            self._append_row(new_id, embedding, camera_id, now)
+            return new_id, 0.0, [camera_id]
+
+    def touch(
+        self,
+        global_person_id: int,
+        camera_id:        str,
+        now:              Optional[float] = None,
+    ) -> Optional[List[str]]:
+        """
+        Record a sighting of an already-identified person without matching.
+
+        Returns cameras_seen, or None if the person has expired meanwhile.
+        """
+        with self._lock:
+            row = self._gid_to_row.get(global_person_id)
+            if row is None:
+                return None
+            cams = self._cam_ids[row]
+            cams.add(camera_id)
+            self._last_seen[row] = time.monotonic() if now is None else now
+            return list(cams)
 
     def get_cameras(self, global_person_id: int) -> List[str]:
         """Get all cameras where this person has been seen."""
         with self._lock:
-            entry = self._gallery.get(global_person_id)
-            return list(entry["camera_ids"]) if entry else []
+            row = self._gid_to_row.get(global_person_id)
+            return list(self._cam_ids[row]) if row is not None else []
 
     def get_last_seen(self, global_person_id: int) -> Optional[float]:
+        """Wall-clock (time.time()) timestamp of the last sighting."""
         with self._lock:
-            entry = self._gallery.get(global_person_id)
-            return entry["last_seen"] if entry else None
+            row = self._gid_to_row.get(global_person_id)
+            if row is None:
+                return None
+            age = time.monotonic() - float(self._last_seen[row])
+        return time.time() - age
 
-    def _expire(self):
+    def _expire(self, now: float):
         """Remove stale gallery entries (called under lock)."""
-        now    = time.time()
-        stale  = [gid for gid, e in self._gallery.items()
-                  if now - e["last_seen"] > self._ttl]
-        for gid in stale:
-            del self._gallery[gid]
+        n = self._n
+        if not n:
+            return
+        stale = self._last_seen[:n] < now - self._ttl
+        if not stale.any():
+            return
+
+        # Compact surviving rows to the front in one pass
+        keep = ~stale
+        k    = int(keep.sum())
+        self._embs[:k]      = self._embs[:n][keep]
+        self._last_seen[:k] = self._last_seen[:n][keep]
+        self._gids[:k]      = self._gids[:n][keep]
+        self._cam_ids       = [c for c, alive in zip(self._cam_ids, keep.tolist()) if alive]
+        self._gid_to_row    = {gid: row for row, gid in enumerate(self._gids[:k].tolist())}
+        self._n = k
+
+    def _append_row(self, gid: int, embedding: np.ndarray, camera_id: str, now: float):
+        """Store a new person as the next row, growing 2× when full."""
+        if self._embs is None:
+            cap = self.INITIAL_CAPACITY
+            dim = embedding.shape[0]
+            self._embs      = np.empty((cap, dim), dtype=np.int8)
+            self._last_seen = np.empty(cap, dtype=np.float64)
+            self._gids      = np.empty(cap, dtype=np.int64)
+            self._ema_tmp   = np.empty(dim, dtype=np.float32)
+            self._row_tmp   = np.empty(dim, dtype=np.float32)
+            self._q_tmp     = np.empty(dim, dtype=np.int8)
+        elif self._n == self._embs.shape[0]:
+            self._embs      = self._grow(self._embs)
+            self._last_seen = self._grow(self._last_seen)
+            self._gids      = self._grow(self._gids)
+
+        row = self._n
+        self._quantize(embedding, self._embs[row])
+        self._last_seen[row] = now
+        self._gids[row]      = gid
+        self._cam_ids.append({camera_id})
+        self._gid_to_row[gid] = row
+        self._n += 1
+
+    def _quantize(self, vec: np.ndarray, out: np.ndarray):
+        """Symmetric int8 quantisation of a unit vector into `out` (under lock)."""
+        tmp = self._ema_tmp          # callers never pass _ema_tmp as `vec`
+        np.multiply(vec, self._Q_SCALE, out=tmp)
+        np.rint(tmp, out=tmp)
+        np.clip(tmp, -127, 127, out=tmp)
+        out[:] = tmp
+
+    def _similarities(self, embedding: np.ndarray) -> np.ndarray:
+        """Raw int32 dot products of the quantised query with every row."""
+        self._quantize(embedding, self._q_tmp)
+        if NUMBA_AVAILABLE:
+            return gemv_i8(self._embs, self._q_tmp, self._n)
+        return self._embs[:self._n].astype(np.int32) @ self._q_tmp.astype(np.int32)
+
+    def _grow(self, arr: np.ndarray) -> np.ndarray:
+        """Return a copy of `arr` with twice the rows (first _n rows kept)."""
+        grown = np.empty((2 * arr.shape[0],) + arr.shape[1:], dtype=arr.dtype)
+        grown[:self._n] = arr[:self._n]
+        return grown
 
     @property
     def size(self) -> int:
         with self._lock:
-            return len(self._gallery)
+            return self._n
 
 
 # ============================================================================
@@ -227,9 +404,14 @@ class ReidManager:
         self._embedder = AppearanceEmbedder()
         self._gallery  = PersonGallery(ttl=REID_GALLERY_TTL)
 
-        # camera_id → [(global_person_id, timestamp)]
-        self._camera_sightings: Dict[str, List[Tuple[int, float]]] = defaultdict(list)
-        self._lock = threading.Lock()
+        # camera_id → deque[(global_person_id, timestamp)], oldest on the left
+        self._camera_sightings: Dict[str, Deque[Tuple[int, float]]] = defaultdict(deque)
+        # Each camera only writes its own deque, so each gets its own lock
+        self._cam_locks: Dict[str, threading.Lock] = defaultdict(threading.Lock)
+
+        # (camera_id, object_id) → (global_person_id, similarity, embedded_at)
+        # Lets a live track skip embedding + matching between re-embeds.
+        self._track_to_gid: Dict[Tuple[str, int], Tuple[int, float, float]] = {}
 
         logging.info("ReidManager ready")
 
@@ -262,82 +444,158 @@ class ReidManager:
         # Build a map: object_id → TrackedObject (for crop extraction)
         obj_map = {obj.object_id: obj for obj in tracked_objects}
 
+        # Monotonic: cheap, and immune to wall-clock jumps that would
+        # otherwise make the whole gallery look stale (or immortal)
+        now = time.monotonic()
+        self._prune_track_cache(now)
+
+        new_sightings: List[Tuple[int, float]] = []
+
+        # Locals for the per-event loops (skip repeated attribute lookups)
+        gallery        = self._gallery
+        track_to_gid   = self._track_to_gid
+        add_sighting   = new_sightings.append
+        apply_identity = self._apply_identity
+
+        # Pass 1: find the person behind each event and cut its crop
+        pending: List[Tuple[Dict, Any, Optional[np.ndarray]]] = []
         for event in events:
-            person_id = event.get("metadata", {}).get("person_id")
+            metadata  = event.get("metadata", {})
+            person_id = metadata.get("person_id")
             if person_id is None:
                 # Try to infer from person_ids list (fight events)
-                person_ids = event.get("metadata", {}).get("person_ids", [])
+                person_ids = metadata.get("person_ids", [])
                 person_id  = person_ids[0] if person_ids else None
 
-            if person_id is None:
-                event.setdefault("global_person_id", None)
-                event.setdefault("cross_camera", False)
-                event.setdefault("seen_in_cameras", [camera_id])
+            tracked_obj = obj_map.get(person_id) if person_id is not None else None
+            if tracked_obj is None:
+                self._mark_unidentified(event, camera_id)
                 continue
 
-            tracked_obj = obj_map.get(person_id)
-            embedding   = self._get_embedding(frame, tracked_obj)
+            # Track identified recently → reuse its global id, no embedding
+            cached = track_to_gid.get((camera_id, person_id))
+            if cached is not None and now - cached[2] < REID_REEMBED_INTERVAL:
+                cameras_seen = gallery.touch(cached[0], camera_id, now)
+                if cameras_seen is not None:
+                    apply_identity(event, cached[0], cached[1], cameras_seen)
+                    add_sighting((cached[0], now))
+                    continue
+
+            pending.append((event, tracked_obj, self._get_crop(frame, tracked_obj)))
+
+        # One embedder call for all crops in this frame
+        crops = [crop for _, _, crop in pending if crop is not None]
+        batch = self._embedder.extract_batch(crops) if crops else None
+
+        # Pass 2: match each embedding against the gallery
+        batch_idx = 0
+        for event, tracked_obj, crop in pending:
+            if crop is None:
+                embedding = self._bbox_embedding(tracked_obj)
+            else:
+                embedding = batch[batch_idx] if batch is not None else None
+                batch_idx += 1
 
             if embedding is None:
-                event.setdefault("global_person_id", None)
-                event.setdefault("cross_camera", False)
-                event.setdefault("seen_in_cameras", [camera_id])
+                self._mark_unidentified(event, camera_id)
                 continue
 
-            global_id, sim = self._gallery.match_or_register(embedding, camera_id)
-            cameras_seen   = self._gallery.get_cameras(global_id)
-            cross_camera   = len(cameras_seen) > 1
-
-            event["global_person_id"] = global_id
-            event["cross_camera"]     = cross_camera
-            event["seen_in_cameras"]  = cameras_seen
-
-            if cross_camera:
-                logging.info(
-                    f"Re-ID: global_person_id={global_id} seen in "
-                    f"{cameras_seen} (sim={sim:.2f})"
-                )
-                event["severity_score"] = min(
-                    1.0, event.get("severity_score", event["confidence"]) * 1.3
-                )
-
-            # Record sighting
-            with self._lock:
-                self._camera_sightings[camera_id].append((global_id, time.time()))
-                # Trim old sightings
-                cutoff = time.time() - REID_CROSS_CAMERA_WINDOW
-                self._camera_sightings[camera_id] = [
-                    (gid, ts) for gid, ts in self._camera_sightings[camera_id]
-                    if ts > cutoff
-                ]
+            # One dtype/layout into the gallery (quantised from float32)
+            embedding = np.ascontiguousarray(embedding, dtype=np.float32)
+
+            global_id, sim, cameras_seen = gallery.match_or_register(
+                embedding, camera_id, now=now
+            )
+            track_to_gid[(camera_id, tracked_obj.object_id)] = (global_id, sim, now)
+            apply_identity(event, global_id, sim, cameras_seen)
+            add_sighting((global_id, now))
+
+        if new_sightings:
+            self._record_sightings(camera_id, new_sightings, now)
 
         return events
 
-    def _get_embedding(
+    def _apply_identity(
+        self,
+        event:        Dict,
+        global_id:    int,
+        sim:          float,
+        cameras_seen: List[str],
+    ):
+        """Write Re-ID fields into the event."""
+        cross_camera = len(cameras_seen) > 1
+
+        event["global_person_id"] = global_id
+        event["cross_camera"]     = cross_camera
+        event["seen_in_cameras"]  = cameras_seen
+
+        if cross_camera:
+            logging.info(
+                f"Re-ID: global_person_id={global_id} seen in "
+                f"{cameras_seen} (sim={sim:.2f})"
+            )
+            event["severity_score"] = min(
+                1.0, event.get("severity_score", event["confidence"]) * 1.3
+            )
+
+    def _record_sightings(
+        self,
+        camera_id:     str,
+        new_sightings: List[Tuple[int, float]],
+        now:           float,
+    ):
+        """Append one frame's sightings and trim the window (one lock, one trim)."""
+        with self._cam_locks[camera_id]:
+            sightings = self._camera_sightings[camera_id]
+            sightings.extend(new_sightings)
+            # Trim old sightings (time-ordered, so only from the left)
+            cutoff = now - REID_CROSS_CAMERA_WINDOW
+            while sightings and sightings[0][1] <= cutoff:
+                sightings.popleft()
+
+    def _prune_track_cache(self, now: float, max_entries: int = 4096):
+        """Drop cache entries for tracks not re-embedded recently (bounded size)."""
+        if len(self._track_to_gid) <= max_entries:
+            return
+        cutoff = now - REID_REEMBED_INTERVAL
+        self._track_to_gid = {
+            key: val for key, val in self._track_to_gid.items() if val[2] >= cutoff
+        }
+
+    @staticmethod
+    def _mark_unidentified(event: Dict, camera_id: str):
+        """Fill Re-ID fields for an event with no usable person embedding."""
+        event.setdefault("global_person_id", None)
+        event.setdefault("cross_camera", False)
+        event.setdefault("seen_in_cameras", [camera_id])
+
+    def _get_crop(
         self,
         frame:       Optional[np.ndarray],
-        tracked_obj: Optional[Any],
+        tracked_obj: Any,
     ) -> Optional[np.ndarray]:
-        """Extract embedding from person crop."""
-        if tracked_obj is None:
+        """Cut the person crop out of the frame (None if unavailable/empty)."""
+        if frame is None:
+            return None
+        try:
+            h, w = frame.shape[:2]
+            x1, y1, x2, y2 = np.clip(
+                tracked_obj.bbox, (0, 0, 0, 0), (w, h, w, h)
+            ).astype(np.int32).tolist()
+            if x2 <= x1 or y2 <= y1:
+                return None
+            return frame[y1:y2, x1:x2]
+        except Exception:
             return None
 
-        if frame is not None:
-            try:
-                x1, y1, x2, y2 = tracked_obj.bbox
-                x1, y1 = max(0, x1), max(0, y1)
-                x2 = min(frame.shape[1], x2)
-                y2 = min(frame.shape[0], y2)
-                crop = frame[y1:y2, x1:x2]
-                if crop.size > 0:
-                    return self._embedder.extract(crop)
-            except Exception:
-                pass
-
-        # Fallback: embed the bbox coordinates as a position feature
-        # (weaker but better than nothing when frame not available)
+    @staticmethod
+    def _bbox_embedding(tracked_obj: Any) -> np.ndarray:
+        """
+        Fallback: embed the bbox coordinates as a position feature
+        (weaker but better than nothing when frame not available).
+        """
         bbox = np.array(tracked_obj.bbox, dtype=np.float32)
-        bbox /= (np.linalg.norm(bbox) + 1e-6)
+        bbox *= 1.0 / (math.sqrt(float(np.vdot(bbox, bbox))) + 1e-6)
         return bbox
 
     def get_cross_camera_persons(
@@ -354,16 +612,26 @@ class ReidManager:
             last_seen:        float,
         }
         """
-        now    = time.time()
+        now    = time.monotonic()
         result = []
 
-        with self._lock:
-            # Build recent sightings across cameras
-            recent_by_person: Dict[int, set] = defaultdict(set)
-            for cam_id, sightings in self._camera_sightings.items():
-                for gid, ts in sightings:
-                    if now - ts <= window_seconds:
-                        recent_by_person[gid].add(cam_id)
+        # Snapshot each camera's recent sightings under that camera's lock
+        snapshots = []
+        for cam_id, sightings in list(self._camera_sightings.items()):
+            with self._cam_locks[cam_id]:
+                recent = []
+                # Newest first; stop at the first sighting outside the window
+                for gid, ts in reversed(sightings):
+                    if now - ts > window_seconds:
+                        break
+                    recent.append(gid)
+            snapshots.append((cam_id, recent))
+
+        # Build recent sightings across cameras (no lock held)
+        recent_by_person: Dict[int, set] = defaultdict(set)
+        for cam_id, gids in snapshots:
+            for gid in gids:
+                recent_by_person[gid].add(cam_id)
 
         for gid, cams in recent_by_person.items():
             if len(cams) > 1:
@@ -2,7 +2,7 @@
 Test Worker for SentinelAI - Zone-based Video Processing with New Pipeline
 
 Usage:
-    python test_worker.py <zone> <video_path> [camera_id] [--no-preview] [--legacy]
+    python test_worker.py <zone> <video_path> [camera_id] [--no-preview] [--legacy] [--fp32]
     
 Zones:
     - all: Run ALL detectors simultaneously (multi-zone mode)
@@ -23,14 +23,23 @@ New Architecture:
 Flags:
     --no-preview  : Run without video preview window
     --legacy      : Use legacy detection (bypasses new pipeline)
+    --fp32        : Run zone models in FP32 instead of FP16 (GPU A/B check)
 """
 
 import os
+import re
 import sys
+import json
 import cv2
 import time
+import queue
+import signal
 import logging
+import itertools
+import threading
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Optional, List, Dict
 
 # Add worker and backend root directories to path for imports
@@ -46,6 +55,7 @@ from worker import (
     DetectionPipeline,
     CameraWorker,
     MultiZonePipeline,
+    StaticFrameGate,
     # Legacy functions
     load_yolov8,
     run_inference,
@@ -55,18 +65,55 @@ from worker import (
     ZONE_TYPES,
 )
 
+try:
+    import torch
+except ImportError:
+    torch = None
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import decord
+    HAS_DECORD = True
+except ImportError:
+    HAS_DECORD = False
+
 # Import registry for model info
 try:
-    from registry import get_model_registry, ZONE_MODEL_CONFIGS
+    from registry import get_model_registry, ZONE_MODEL_CONFIGS, VEHICLE_IDS
     HAS_REGISTRY = True
 except ImportError:
     HAS_REGISTRY = False
     ZONE_MODEL_CONFIGS = {}
+    VEHICLE_IDS = np.array([2, 3, 5, 7], dtype=np.int32)   # car, motorcycle, bus, truck
+
+# Per-zone (model config, event types), resolved once at import
+_ZONE_CACHE = {
+    zone: (ZONE_MODEL_CONFIGS.get(zone) if HAS_REGISTRY else None, tuple(events))
+    for zone, events in ZONE_TYPES.items()
+}
+VALID_ZONES = tuple(_ZONE_CACHE) + ("all",)
 
 # Config
 FRAME_FPS = int(os.getenv("FRAME_FPS", 5))
+PREFETCH = int(os.getenv("PREFETCH", 4))
+MAX_STRIDE = int(os.getenv("MAX_STRIDE", 8))   # adaptive frame skip ceiling
+VIDEO_DECODER = os.getenv("VIDEO_DECODER", "auto").lower()   # auto | gstreamer | ffmpeg | decord | cpu
+GST_DECODER = os.getenv("GST_DECODER", "nvv4l2decoder")       # nvh264dec on desktop GPUs
+DECORD_BATCH = int(os.getenv("DECORD_BATCH", 32))             # frames decoded per get_batch call
+PREVIEW_SINK = os.getenv("PREVIEW_SINK", "highgui").lower()   # highgui | gstreamer | shm
+PREVIEW_SHM_PATH = os.getenv("PREVIEW_SHM_PATH", "/tmp/sentinel-preview")
+KEY_POLL_EVERY = max(1, int(os.getenv("KEY_POLL_EVERY", 2)))   # HighGUI waitKey every N shown frames
 BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:8000/event")
 TENANT_ID = os.getenv("TENANT_ID", "school1")
+EVENT_QUEUE_SIZE = int(os.getenv("EVENT_QUEUE_SIZE", 256))
+PIN_THREADS = os.getenv("PIN_THREADS", "1") == "1"   # fixed core budget for inference vs I/O
+
+HAS_GSTREAMER = bool(re.search(r"GStreamer:\s+YES", cv2.getBuildInformation()))
 
 # Setup colored logging
 class ColoredFormatter(logging.Formatter):
@@ -92,10 +139,32 @@ handler.setFormatter(ColoredFormatter(
 logging.basicConfig(level=logging.INFO, handlers=[handler])
 
 
-def send_event(event: dict):
-    """Send event to backend."""
+# Keep-alive connection pool: events reuse one socket instead of a new
+# TCP handshake per POST.
+_session = requests.Session()
+_session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# Events are delivered by a background thread so a slow or unreachable
+# backend (5s timeout) never stalls the frame loop.
+_event_q: "queue.Queue[dict]" = queue.Queue(maxsize=EVENT_QUEUE_SIZE)
+_event_seq = itertools.count()
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _encode_event(event: dict) -> bytes:
+    """Event → JSON bytes (orjson when installed: ~5-10× faster, handles numpy scalars)."""
+    if HAS_ORJSON:
+        return orjson.dumps(event, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(event).encode()
+
+
+def _post_event(event: dict):
+    """POST one event to the backend."""
     try:
-        resp = requests.post(BACKEND_URL, json=event, timeout=5)
+        resp = _session.post(BACKEND_URL, data=_encode_event(event), headers=_JSON_HEADERS, timeout=5)
         if resp.status_code == 200:
             logging.info(f"✓ Event sent successfully -> {event['event_type']}")
         else:
@@ -108,7 +177,490 @@ def send_event(event: dict):
         logging.error(f"✗ Failed to send event: {e}")
 
 
-def process_video(zone: str, video_path: str, camera_id: str = "cam1", show_preview: bool = True, use_legacy: bool = False):
+def _event_sender():
+    while True:
+        event = _event_q.get()
+        try:
+            _post_event(event)
+        finally:
+            _event_q.task_done()
+
+
+threading.Thread(target=_event_sender, name="event-sender", daemon=True).start()
+
+
+def send_event(event: dict):
+    """Queue event for delivery to backend (drops it if the queue is full)."""
+    try:
+        _event_q.put_nowait(event)
+    except queue.Full:
+        logging.error(f"✗ Event queue full - dropped {event['event_type']}")
+
+
+def flush_events(timeout: float = 10.0):
+    """Wait up to `timeout` seconds for queued events to be delivered."""
+    deadline = time.monotonic() + timeout
+    while _event_q.unfinished_tasks and time.monotonic() < deadline:
+        time.sleep(0.05)
+    if _event_q.unfinished_tasks:
+        logging.warning(f"⚠ {_event_q.unfinished_tasks} event(s) not delivered before exit")
+
+
+# OpenCV writes into these through its GStreamer appsrc; no Gst bindings needed.
+# The shm sink is read by a separate viewer process, e.g.
+#   gst-launch-1.0 shmsrc socket-path=/tmp/sentinel-preview ! video/x-raw,format=I420,width=W,height=H,framerate=F/1 ! videoconvert ! autovideosink
+PREVIEW_PIPELINES = {
+    "gstreamer": "appsrc ! videoconvert ! autovideosink sync=false",
+    "shm":       ("appsrc ! videoconvert ! video/x-raw,format=I420 ! "
+                  "shmsink socket-path={path} sync=false wait-for-connection=false shm-size=33554432"),
+}
+
+
+def open_preview_sink(size, fps: float, sink: str = PREVIEW_SINK):
+    """cv2.VideoWriter feeding a GStreamer display/shm pipeline, or None for HighGUI."""
+    if sink not in PREVIEW_PIPELINES:
+        return None
+    if not HAS_GSTREAMER:
+        logging.warning(f"PREVIEW_SINK={sink} needs OpenCV built with GStreamer — using cv2.imshow")
+        return None
+    pipeline = PREVIEW_PIPELINES[sink].format(path=PREVIEW_SHM_PATH)
+    out = cv2.VideoWriter(pipeline, cv2.CAP_GSTREAMER, 0, fps, size)
+    if not out.isOpened():
+        logging.warning(f"Could not open preview pipeline '{pipeline}' — using cv2.imshow")
+        return None
+    logging.info(f"  Preview: {sink} (Ctrl+C to quit)")
+    return out
+
+
+def event_boxes(events: List[Dict]) -> np.ndarray:
+    """All 4-element bounding boxes of `events` as one (N,4) int32 xyxy array."""
+    boxes = [bbox for event in events
+             for bbox in event.get("bounding_boxes", []) if len(bbox) == 4]
+    return np.asarray(boxes, dtype=np.int32).reshape(-1, 4)
+
+
+def draw_boxes(img: np.ndarray, boxes: np.ndarray, color, thickness: int = 2):
+    """Draw (N,4) xyxy boxes with a single cv2.polylines call (same pixels as cv2.rectangle)."""
+    if len(boxes) == 0:
+        return
+    x1, y1, x2, y2 = boxes.T
+    corners = np.stack([x1, y1, x2, y1, x2, y2, x1, y2], axis=1).reshape(-1, 4, 2)
+    cv2.polylines(img, corners, True, color, thickness)
+
+
+class StaticOverlay:
+    """
+    Preview decoration rendered once and blended onto every frame.
+
+    draw(img, key) is rendered on black and on white: the difference gives
+    per-pixel coverage, so anti-aliased text blends exactly like a direct
+    draw (±1 rounding). Only the covered bounding box is touched per frame,
+    and it is re-rendered only when `key` or the frame size changes.
+    """
+
+    _UNSET = object()
+
+    def __init__(self, draw):
+        self._draw  = draw
+        self._key   = self._UNSET
+        self._shape = None
+        self._patch = None     # colour premultiplied by coverage
+        self._keep  = None     # 255 - coverage (background weight)
+        self._rect  = None     # x, y, w, h of the covered area
+
+    def _render(self, shape, key):
+        lo = np.zeros(shape, dtype=np.uint8)
+        hi = np.full(shape, 255, dtype=np.uint8)
+        self._draw(lo, key)
+        self._draw(hi, key)
+        keep = (hi.astype(np.int16) - lo).clip(0, 255).astype(np.uint8)
+        x, y, w, h = cv2.boundingRect((keep != 255).any(axis=2).astype(np.uint8))
+        self._patch = lo[y:y + h, x:x + w].copy()
+        self._keep  = keep[y:y + h, x:x + w].copy()
+        self._rect  = (x, y, w, h)
+        self._key, self._shape = key, shape
+
+    def apply(self, img: np.ndarray, key=None):
+        if key != self._key or img.shape != self._shape:
+            self._render(img.shape, key)
+        x, y, w, h = self._rect
+        if w == 0 or h == 0:
+            return
+        roi = img[y:y + h, x:x + w]
+        cv2.multiply(roi, self._keep, dst=roi, scale=1 / 255)
+        cv2.add(roi, self._patch, dst=roi)
+
+
+def configure_threads(concurrent_models: int = 1) -> Optional[set]:
+    """
+    Give inference a fixed core budget instead of letting OpenMP, OpenCV
+    and torch defaults oversubscribe every core.
+
+    One core is kept for the reader/writer threads and the rest are pinned
+    to the calling (inference) thread; torch gets an equal share of them
+    per model that runs concurrently. Returns the I/O core set for
+    ThreadedVideoPipeline, or None when pinning is off or unsupported.
+    """
+    cv2.setNumThreads(1)
+    if not PIN_THREADS or not hasattr(os, "sched_setaffinity"):
+        return None
+
+    cores = sorted(os.sched_getaffinity(0))
+    if len(cores) < 3:
+        return None
+    io_cores, infer_cores = {cores[0]}, set(cores[1:])
+
+    os.sched_setaffinity(0, infer_cores)   # pid 0 → calling thread only
+    if torch is not None:
+        torch.set_num_threads(max(1, len(infer_cores) // max(1, concurrent_models)))
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            pass   # only settable before the first inter-op parallel call
+    logging.info(
+        f"  Threads: inference cores={sorted(infer_cores)} io cores={sorted(io_cores)} "
+        f"torch={torch.get_num_threads() if torch is not None else '-'}"
+    )
+    return io_cores
+
+
+class DecordCapture:
+    """
+    Buffered decord.VideoReader behind the cv2.VideoCapture calls we use.
+
+    Frames are decoded DECORD_BATCH at a time with one get_batch() call and
+    served from that buffer. Skipping (grab) only advances the index, and
+    rewinding is random access — no reopen needed.
+    """
+
+    def __init__(self, path: str, batch: int = DECORD_BATCH):
+        self.vr     = decord.VideoReader(path, ctx=decord.cpu(0))
+        self.batch  = max(1, batch)
+        self.pos    = 0          # next frame index to return
+        self._start = 0          # index of _buf[0]
+        self._buf   = None       # (B, H, W, 3) BGR
+
+    def isOpened(self) -> bool:
+        return self.vr is not None
+
+    def grab(self) -> bool:
+        if self.pos >= len(self.vr):
+            return False
+        self.pos += 1
+        return True
+
+    def read(self):
+        if self.pos >= len(self.vr):
+            return False, None
+        offset = self.pos - self._start
+        if self._buf is None or not 0 <= offset < len(self._buf):
+            end = min(self.pos + self.batch, len(self.vr))
+            rgb = self.vr.get_batch(list(range(self.pos, end))).asnumpy()
+            self._buf, self._start, offset = rgb[..., ::-1], self.pos, 0
+        self.pos += 1
+        # copy: the caller annotates frames in place
+        return True, np.ascontiguousarray(self._buf[offset])
+
+    def get(self, prop: int) -> float:
+        if prop == cv2.CAP_PROP_FPS:
+            return self.vr.get_avg_fps()
+        if prop == cv2.CAP_PROP_FRAME_COUNT:
+            return float(len(self.vr))
+        if prop == cv2.CAP_PROP_POS_FRAMES:
+            return float(self.pos)
+        return 0.0
+
+    def set(self, prop: int, value: float) -> bool:
+        if prop != cv2.CAP_PROP_POS_FRAMES:
+            return False
+        self.pos = int(value)
+        return True
+
+    def release(self):
+        self.vr   = None
+        self._buf = None
+
+
+class VideoSource:
+    """
+    cv2.VideoCapture opened on the fastest decoder available.
+
+    Backends, tried in order for VIDEO_DECODER=auto:
+    - gstreamer : NVDEC through a GStreamer pipeline (needs OpenCV built
+                  with GStreamer and the NVIDIA plugins, e.g. Jetson)
+    - ffmpeg    : OpenCV's FFmpeg backend with hardware acceleration
+    - decord    : batched decord.VideoReader (DecordCapture)
+    - cpu       : plain cv2.VideoCapture
+    Frames are always BGR numpy arrays, as the pipeline expects.
+
+    For looping, a standby capture on the same file is opened in the
+    background; a fresh capture already sits at frame 0, so rewind() is a
+    swap instead of a libavformat seek (or a GStreamer pipeline rebuild).
+    decord seeks by index, so it rewinds in place without a standby.
+    """
+
+    BACKENDS = ("gstreamer", "ffmpeg", "decord", "cpu")
+
+    def __init__(self, path: str, decoder: str = VIDEO_DECODER):
+        self.path    = path
+        self.backend = None
+        self.cap     = None
+        self._standby        = None
+        self._standby_thread = None
+        order = self.BACKENDS if decoder == "auto" else (decoder, "cpu")
+        for backend in order:
+            cap = self._open(backend)
+            if cap is not None and cap.isOpened():
+                self.cap, self.backend = cap, backend
+                break
+            if cap is not None:
+                cap.release()
+        if self.cap is None:
+            self.cap = cv2.VideoCapture(path)
+        elif self.backend != "decord":
+            self._prepare_standby()
+        logging.info(f"  Decoder: {self.backend or 'none'}")
+
+    def _open(self, backend: str):
+        if backend == "gstreamer":
+            if not HAS_GSTREAMER:
+                return None
+            pipeline = (
+                f'filesrc location="{self.path}" ! qtdemux ! h264parse ! {GST_DECODER} ! '
+                "nvvidconv ! video/x-raw,format=BGRx ! videoconvert ! "
+                "video/x-raw,format=BGR ! appsink sync=false"
+            )
+            return cv2.VideoCapture(pipeline, cv2.CAP_GSTREAMER)
+        if backend == "ffmpeg":
+            if not hasattr(cv2, "CAP_PROP_HW_ACCELERATION"):
+                return None
+            cap = cv2.VideoCapture(self.path, cv2.CAP_FFMPEG,
+                                   [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY])
+            if cap.isOpened() and cap.get(cv2.CAP_PROP_HW_ACCELERATION) == cv2.VIDEO_ACCELERATION_NONE:
+                cap.release()   # no hw device: let the cpu backend take it
+                return None
+            return cap
+        if backend == "decord":
+            if not HAS_DECORD:
+                return None
+            try:
+                return DecordCapture(self.path)
+            except Exception as e:      # decord raises DECORDError on unreadable files
+                logging.warning(f"decord could not open {self.path}: {e}")
+                return None
+        if backend == "cpu":
+            return cv2.VideoCapture(self.path)
+        logging.warning(f"Unknown VIDEO_DECODER '{backend}', using cpu")
+        return None
+
+    def _prepare_standby(self):
+        def open_standby():
+            self._standby = self._open(self.backend)
+
+        self._standby = None
+        self._standby_thread = threading.Thread(target=open_standby, name="video-standby", daemon=True)
+        self._standby_thread.start()
+
+    def rewind(self):
+        """Continue from the first frame by swapping in the standby capture."""
+        standby = None
+        if self._standby_thread is not None:
+            self._standby_thread.join()
+            standby = self._standby
+        if standby is not None and standby.isOpened():
+            self.cap.release()
+            self.cap = standby
+            self._prepare_standby()
+        elif self.backend == "gstreamer":
+            # GStreamer appsinks can't seek, so reopen
+            self.cap.release()
+            self.cap = self._open("gstreamer")
+        else:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+
+    def release(self):
+        if self._standby_thread is not None:
+            self._standby_thread.join()
+            if self._standby is not None:
+                self._standby.release()
+            self._standby_thread = None
+        self.cap.release()
+
+    def __getattr__(self, name):
+        # read / grab / get / isOpened go straight to the capture
+        return getattr(self.cap, name)
+
+
+class ThreadedVideoPipeline:
+    """
+    Reader thread → compute (caller) → writer thread, over bounded queues.
+
+    The reader decodes ahead into read_q so inference never waits on
+    cap.read(). The caller keeps every pipeline call on the main thread, so
+    tracker/temporal state needs no locking. The writer renders, shows and
+    paces output at `fps` on a monotonic clock; all HighGUI calls
+    (imshow/waitKey/destroyAllWindows) happen on that one thread.
+    None on either queue means shutdown.
+
+    When processing falls behind the 1/fps budget the reader skips frames
+    with cap.grab() (no BGR conversion) instead of queueing them: the
+    stride follows an EMA of the times passed to record_processing_time().
+
+    Ctrl-C stops the pipeline the same way 'q' does (frames() returns and
+    close() drains the writer); a second Ctrl-C interrupts as usual.
+
+    Usage:
+        video = ThreadedVideoPipeline(VideoSource(path), render, window)
+        for frame_idx, frame in video.frames():
+            t0 = time.monotonic()
+            events = pipeline.process_frame(frame)
+            video.record_processing_time(time.monotonic() - t0)
+            video.submit(frame, frame_idx, events)
+        video.close()
+    """
+
+    EMA_ALPHA = 0.2
+
+    def __init__(self, cap, render=None, window: str = "SentinelAI",
+                 fps: float = FRAME_FPS, prefetch: int = PREFETCH, loop: bool = True,
+                 io_cores: Optional[set] = None):
+        self.cap      = cap
+        self.io_cores = io_cores    # pin reader/writer off the inference cores
+        self.render   = render      # render(frame, *info) -> image, None = headless
+        self.window   = window
+        self.interval = 1.0 / fps if fps > 0 else 0.0
+        self.loop     = loop
+        self.stride   = 1           # read every stride-th frame; set from the main thread
+        self._ema     = None        # smoothed per-frame processing time (s)
+        self.read_q   = queue.Queue(maxsize=prefetch)
+        self.write_q  = queue.Queue(maxsize=prefetch)
+        self.stopped  = threading.Event()
+        self._reader  = threading.Thread(target=self._read_loop, name="video-reader", daemon=True)
+        self._writer  = threading.Thread(target=self._write_loop, name="video-writer", daemon=True)
+        self._prev_sigint = None
+        if threading.current_thread() is threading.main_thread():
+            self._prev_sigint = signal.signal(signal.SIGINT, self._on_sigint)
+        self._reader.start()
+        self._writer.start()
+
+    def _on_sigint(self, signum, frame):
+        logging.info("Interrupted — stopping (Ctrl-C again to abort)")
+        self.stopped.set()
+        signal.signal(signal.SIGINT, self._prev_sigint)
+
+    def _put(self, q: queue.Queue, item) -> bool:
+        """Blocking put that gives up once the pipeline is stopped."""
+        while not self.stopped.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _read_loop(self):
+        if self.io_cores:
+            os.sched_setaffinity(0, self.io_cores)
+        frame_idx = 0
+        while not self.stopped.is_set():
+            # Drop frames we can't keep up with before decoding them
+            skipped = 0
+            for _ in range(self.stride - 1):
+                if not self.cap.grab():
+                    break
+                skipped += 1
+            frame_idx += skipped
+            ret, frame = self.cap.read()
+            if not ret:
+                if not self.loop or frame_idx == 0:
+                    break
+                # Loop video for continuous testing
+                self.cap.rewind()
+                frame_idx = 0
+                continue
+            if not self._put(self.read_q, (frame_idx, frame)):
+                break
+            frame_idx += 1
+        self._put(self.read_q, None)
+
+    def record_processing_time(self, seconds: float):
+        """Feed one frame's processing time; adapts the reader's stride."""
+        self._ema = seconds if self._ema is None else (
+            self.EMA_ALPHA * seconds + (1.0 - self.EMA_ALPHA) * self._ema
+        )
+        if self.interval > 0:
+            self.stride = min(MAX_STRIDE, max(1, int(self._ema / self.interval)))
+
+    def _write_loop(self):
+        if self.io_cores:
+            os.sched_setaffinity(0, self.io_cores)
+        next_due = time.monotonic()
+        sink     = None        # GStreamer preview writer, opened on the first frame
+        highgui  = PREVIEW_SINK not in PREVIEW_PIPELINES
+        shown    = 0
+        while True:
+            item = self.write_q.get()
+            if item is None:
+                break
+            if self.render is not None:
+                annotated = self.render(*item)
+                if not highgui and sink is None:
+                    h, w = annotated.shape[:2]
+                    sink = open_preview_sink((w, h), 1.0 / self.interval if self.interval else 30.0)
+                    highgui = sink is None
+                if sink is not None:
+                    sink.write(annotated)
+                else:
+                    cv2.imshow(self.window, annotated)
+                    shown += 1
+                    # waitKey pumps the window system (~1 ms); every frame isn't needed
+                    if shown % KEY_POLL_EVERY == 0 and cv2.waitKey(1) & 0xFF == ord('q'):
+                        self.stopped.set()
+                        break
+            next_due += self.interval
+            delay = next_due - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_due = time.monotonic()   # behind schedule: don't burst to catch up
+        if sink is not None:
+            sink.release()
+        elif self.render is not None and highgui:
+            cv2.destroyAllWindows()
+
+    def frames(self):
+        """Yield (frame_idx, frame) until the source ends or 'q' is pressed."""
+        while not self.stopped.is_set():
+            try:
+                item = self.read_q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if item is None:
+                return
+            yield item
+
+    def submit(self, frame, *info):
+        """Hand a processed frame to the writer; `info` is passed to render()."""
+        self._put(self.write_q, (frame, *info))
+
+    def close(self):
+        """Drain the writer, stop the reader and release the capture."""
+        while self._writer.is_alive():     # not _put: may already be stopped (Ctrl-C)
+            try:
+                self.write_q.put(None, timeout=0.1)
+                break
+            except queue.Full:
+                continue
+        self._writer.join()
+        self.stopped.set()
+        self._reader.join()
+        self.cap.release()
+        if self._prev_sigint is not None and signal.getsignal(signal.SIGINT) == self._on_sigint:
+            signal.signal(signal.SIGINT, self._prev_sigint)
+
+
+def process_video(zone: str, video_path: str, camera_id: str = "cam1", show_preview: bool = True, use_legacy: bool = False,
+                  precision: Optional[str] = None):
     """
     Process a video file for zone-based detection.
     
@@ -118,24 +670,27 @@ def process_video(zone: str, video_path: str, camera_id: str = "cam1", show_prev
         camera_id: Camera identifier
         show_preview: Whether to show OpenCV preview window
         use_legacy: If True, use legacy detection; else use new pipeline
+        precision: Zone-model precision, "fp16" or "fp32" (default: YOLO_PRECISION)
     """
     if zone.lower() == "all":
         # Multi-zone mode - process ALL detectors
-        process_video_multizone(video_path, camera_id, show_preview)
+        process_video_multizone(video_path, camera_id, show_preview, precision)
     elif use_legacy:
         process_video_legacy(zone, video_path, camera_id, show_preview)
     else:
-        process_video_new_pipeline(zone, video_path, camera_id, show_preview)
+        process_video_new_pipeline(zone, video_path, camera_id, show_preview, precision)
+    flush_events()
 
 
-def process_video_new_pipeline(zone: str, video_path: str, camera_id: str = "cam1", show_preview: bool = True):
+def process_video_new_pipeline(zone: str, video_path: str, camera_id: str = "cam1", show_preview: bool = True,
+                               precision: Optional[str] = None):
     """
     Process video using the NEW detection pipeline architecture.
     
     Pipeline: YOLO → Tracker → Zone Processor → Temporal Buffer → Events
     """
-    if zone not in ZONE_TYPES:
-        logging.error(f"Invalid zone '{zone}'. Valid zones: {list(ZONE_TYPES.keys())}")
+    if zone not in _ZONE_CACHE:
+        logging.error(f"Invalid zone '{zone}'. Valid zones: {list(_ZONE_CACHE)}")
         return
     
     if not os.path.exists(video_path):
@@ -143,7 +698,7 @@ def process_video_new_pipeline(zone: str, video_path: str, camera_id: str = "cam
         return
     
     # Get model info
-    model_config = ZONE_MODEL_CONFIGS.get(zone) if HAS_REGISTRY else None
+    model_config, event_types = _ZONE_CACHE[zone]
     model_file = model_config.model_file if model_config else "yolov8n.pt"
     
     logging.info("="*60)
@@ -153,7 +708,7 @@ def process_video_new_pipeline(zone: str, video_path: str, camera_id: str = "cam
     logging.info(f"📹 Video: {os.path.basename(video_path)}")
     logging.info(f"🎯 Camera ID: {camera_id}")
     logging.info(f"🤖 Model: {model_file}")
-    logging.info(f"🔍 Events to detect: {', '.join(ZONE_TYPES[zone])}")
+    logging.info(f"🔍 Events to detect: {', '.join(event_types)}")
     logging.info(f"🔗 Backend: {BACKEND_URL}")
     logging.info("="*60)
     logging.info("Pipeline: YOLO → Tracker → Zone Processor → Temporal Buffer → Events")
@@ -161,7 +716,7 @@ def process_video_new_pipeline(zone: str, video_path: str, camera_id: str = "cam
     
     # Create detection pipeline
     try:
-        pipeline = DetectionPipeline(camera_id, zone)
+        pipeline = DetectionPipeline(camera_id, zone, precision=precision)
     except Exception as e:
         logging.error(f"Failed to create pipeline: {e}")
         logging.info("Falling back to legacy mode...")
@@ -169,7 +724,7 @@ def process_video_new_pipeline(zone: str, video_path: str, camera_id: str = "cam
         return
     
     # Open video
-    cap = cv2.VideoCapture(video_path)
+    cap = VideoSource(video_path)
     if not cap.isOpened():
         logging.error(f"Failed to open video: {video_path}")
         return
@@ -178,73 +733,67 @@ def process_video_new_pipeline(zone: str, video_path: str, camera_id: str = "cam
     total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
     logging.info(f"  Video FPS: {fps:.1f}, Total frames: {total_frames}")
     
-    frame_idx = 0
     events_detected = 0
     
-    while True:
-        ret, frame = cap.read()
-        if not ret:
-            # Loop video for continuous testing
-            cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-            frame_idx = 0
-            continue
-        
-        # Process frame through the full pipeline
-        events = pipeline.process_frame(frame)
-        
-        # Log detection counts periodically
-        if frame_idx % 30 == 0:
-            summary = pipeline.get_detections_summary(frame)
-            if summary:
-                logging.info(f"📈 Frame {frame_idx}: {summary}")
+    # Zone and model info never change: render once, blend per frame
+    banner = StaticOverlay(lambda img, _: cv2.putText(
+        img, f"Zone: {zone} | Model: {model_file}", (10, 30),
+        cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2))
+    
+    def render(frame, frame_idx, events, events_detected):
+        # Draw in place: each frame is a fresh cap.read() buffer that
+        # nothing downstream keeps once it has been submitted
+        annotated = frame
         
-        # Send detected events
-        for event in events:
-            logging.warning(f"🚨 EVENT DETECTED: {event['event_type']} (confidence={event['confidence']:.2f})")
-            send_event(event)
-            events_detected += 1
+        # Draw zone and model info
+        banner.apply(annotated)
         
-        # Show preview with annotations
-        if show_preview:
-            annotated = frame.copy()
-            
-            # Draw zone and model info
-            cv2.putText(annotated, f"Zone: {zone} | Model: {model_file}", (10, 30),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+        # Draw event indicator
+        if events:
+            cv2.putText(annotated, "EVENT DETECTED!", (10, 70),
+                       cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 0, 255), 2)
             
-            # Draw event indicator
-            if events:
-                cv2.putText(annotated, "EVENT DETECTED!", (10, 70),
-                           cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 0, 255), 2)
-                
-                # Draw bounding boxes
-                for event in events:
-                    for bbox in event.get("bounding_boxes", []):
-                        if len(bbox) == 4:
-                            cv2.rectangle(annotated, 
-                                         (bbox[0], bbox[1]), (bbox[2], bbox[3]),
-                                         (0, 0, 255), 2)
+            # Draw bounding boxes
+            draw_boxes(annotated, event_boxes(events), (0, 0, 255), 2)
+        
+        # Status bar
+        status = f"Frame: {frame_idx} | Events: {events_detected} | Press 'q' to quit"
+        cv2.putText(annotated, status, (10, annotated.shape[0] - 20),
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+        return annotated
+    
+    io_cores = configure_threads()
+    video = ThreadedVideoPipeline(cap, render if show_preview else None,
+                                  f"SentinelAI - {zone} ({camera_id})", io_cores=io_cores)
+    try:
+        for frame_idx, frame in video.frames():
+            # Process frame through the full pipeline (main thread only)
+            t0 = time.monotonic()
+            events = pipeline.process_frame(frame)
+            video.record_processing_time(time.monotonic() - t0)
             
-            # Status bar
-            status = f"Frame: {frame_idx} | Events: {events_detected} | Press 'q' to quit"
-            cv2.putText(annotated, status, (10, annotated.shape[0] - 20),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+            # Log detection counts periodically
+            if frame_idx % 30 == 0:
+                summary = pipeline.get_last_summary()
+                if summary:
+                    logging.info(f"📈 Frame {frame_idx}: {summary}")
             
-            cv2.imshow(f"SentinelAI - {zone} ({camera_id})", annotated)
+            # Send detected events
+            for event in events:
+                logging.warning(f"🚨 EVENT DETECTED: {event['event_type']} (confidence={event['confidence']:.2f})")
+                send_event(event)
+                events_detected += 1
             
-            key = cv2.waitKey(1) & 0xFF
-            if key == ord('q'):
-                break
-        
-        frame_idx += 1
-        time.sleep(1.0 / FRAME_FPS)
+            # Preview / pacing happens on the writer thread
+            video.submit(frame, frame_idx, events, events_detected)
+    finally:
+        video.close()
     
-    cap.release()
-    cv2.destroyAllWindows()
     logging.info(f"Processing complete. Total events detected: {events_detected}")
 
 
-def process_video_multizone(video_path: str, camera_id: str = "cam1", show_preview: bool = True):
+def process_video_multizone(video_path: str, camera_id: str = "cam1", show_preview: bool = True,
+                            precision: Optional[str] = None):
     """
     Process video using ALL zone detectors simultaneously.
     
@@ -268,13 +817,13 @@ def process_video_multizone(video_path: str, camera_id: str = "cam1", show_previ
     
     # Create multi-zone pipeline
     try:
-        pipeline = MultiZonePipeline(camera_id)
+        pipeline = MultiZonePipeline(camera_id, precision=precision)
     except Exception as e:
         logging.error(f"Failed to create multi-zone pipeline: {e}")
         return
     
     # Open video
-    cap = cv2.VideoCapture(video_path)
+    cap = VideoSource(video_path)
     if not cap.isOpened():
         logging.error(f"Failed to open video: {video_path}")
         return
@@ -283,7 +832,6 @@ def process_video_multizone(video_path: str, camera_id: str = "cam1", show_previ
     total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
     logging.info(f"  Video FPS: {fps:.1f}, Total frames: {total_frames}")
     
-    frame_idx = 0
     events_detected = 0
     zone_event_counts = {"outgate": 0, "corridor": 0, "school_ground": 0, "classroom": 0}
     
@@ -295,83 +843,88 @@ def process_video_multizone(video_path: str, camera_id: str = "cam1", show_previ
         "classroom": (255, 0, 255),       # Magenta
     }
     
-    while True:
-        ret, frame = cap.read()
-        if not ret:
-            cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-            frame_idx = 0
-            continue
-        
-        # Process frame through ALL zone pipelines
-        events = pipeline.process_frame(frame)
-        
-        # Log detection counts periodically
-        if frame_idx % 30 == 0:
-            summary = pipeline.get_detections_summary(frame)
-            if summary:
-                logging.info(f"📈 Frame {frame_idx}: {summary}")
+    def draw_legend(img, counts):
+        y_offset = 90
+        for zone, color in zone_colors.items():
+            cv2.rectangle(img, (10, y_offset), (25, y_offset + 15), color, -1)
+            cv2.putText(img, f"{zone}: {counts[zone]}", (30, y_offset + 12),
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 255), 1)
+            y_offset += 20
+    
+    # Header and legend are pre-rendered; the legend re-renders only when a count changes
+    header = StaticOverlay(lambda img, _: cv2.putText(
+        img, "MULTI-ZONE DETECTION (ALL)", (10, 30),
+        cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2))
+    legend = StaticOverlay(lambda img, counts: draw_legend(img, dict(zip(zone_colors, counts))))
+    
+    def render(frame, frame_idx, events, events_detected, zone_event_counts):
+        # Draw in place: each frame is a fresh cap.read() buffer that
+        # nothing downstream keeps once it has been submitted
+        annotated = frame
         
-        # Send detected events
-        for event in events:
-            detected_zone = event.get("detected_by_zone", "unknown")
-            logging.warning(f"🚨 [{detected_zone.upper()}] {event['event_type']} (conf={event['confidence']:.2f})")
-            send_event(event)
-            events_detected += 1
-            if detected_zone in zone_event_counts:
-                zone_event_counts[detected_zone] += 1
+        # Header
+        header.apply(annotated)
         
-        # Show preview with multi-zone annotations
-        if show_preview:
-            annotated = frame.copy()
+        # Draw events with zone-specific colors
+        if events:
+            zones_hit = set(e.get("detected_by_zone", "unknown") for e in events)
+            cv2.putText(annotated, f"EVENTS: {', '.join(zones_hit)}", (10, 60),
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 255), 2)
             
-            # Header
-            cv2.putText(annotated, "MULTI-ZONE DETECTION (ALL)", (10, 30),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
+            # One box batch per zone colour; labels stay per box (putText has no batch form)
+            by_zone: Dict[str, List[Dict]] = {}
+            for event in events:
+                by_zone.setdefault(event.get("detected_by_zone", "unknown"), []).append(event)
             
-            # Draw events with zone-specific colors
-            if events:
-                zones_hit = set(e.get("detected_by_zone", "unknown") for e in events)
-                cv2.putText(annotated, f"EVENTS: {', '.join(zones_hit)}", (10, 60),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 255), 2)
+            for detected_zone, zone_events in by_zone.items():
+                color = zone_colors.get(detected_zone, (0, 0, 255))
+                draw_boxes(annotated, event_boxes(zone_events), color, 2)
                 
-                for event in events:
-                    detected_zone = event.get("detected_by_zone", "unknown")
-                    color = zone_colors.get(detected_zone, (0, 0, 255))
-                    
+                for event in zone_events:
+                    label = f"{detected_zone}: {event['event_type']}"
                     for bbox in event.get("bounding_boxes", []):
                         if len(bbox) == 4:
-                            cv2.rectangle(annotated, 
-                                         (bbox[0], bbox[1]), (bbox[2], bbox[3]),
-                                         color, 2)
-                            label = f"{detected_zone}: {event['event_type']}"
                             cv2.putText(annotated, label, (bbox[0], bbox[1] - 5),
                                        cv2.FONT_HERSHEY_SIMPLEX, 0.4, color, 1)
+        
+        # Zone legend
+        legend.apply(annotated, tuple(zone_event_counts[z] for z in zone_colors))
+        
+        # Status bar
+        status = f"Frame: {frame_idx} | Total Events: {events_detected} | Press 'q' to quit"
+        cv2.putText(annotated, status, (10, annotated.shape[0] - 20),
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+        return annotated
+    
+    io_cores = configure_threads(pipeline.concurrent_models)
+    video = ThreadedVideoPipeline(cap, render if show_preview else None,
+                                  f"SentinelAI - MULTI-ZONE ({camera_id})", io_cores=io_cores)
+    try:
+        for frame_idx, frame in video.frames():
+            # Process frame through ALL zone pipelines (main thread only)
+            t0 = time.monotonic()
+            events = pipeline.process_frame(frame)
+            video.record_processing_time(time.monotonic() - t0)
             
-            # Zone legend
-            y_offset = 90
-            for zone, color in zone_colors.items():
-                count = zone_event_counts[zone]
-                cv2.rectangle(annotated, (10, y_offset), (25, y_offset + 15), color, -1)
-                cv2.putText(annotated, f"{zone}: {count}", (30, y_offset + 12),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 255), 1)
-                y_offset += 20
-            
-            # Status bar
-            status = f"Frame: {frame_idx} | Total Events: {events_detected} | Press 'q' to quit"
-            cv2.putText(annotated, status, (10, annotated.shape[0] - 20),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+            # Log detection counts periodically
+            if frame_idx % 30 == 0:
+                summary = pipeline.get_last_summary()
+                if summary:
+                    logging.info(f"📈 Frame {frame_idx}: {summary}")
             
-            cv2.imshow(f"SentinelAI - MULTI-ZONE ({camera_id})", annotated)
+            # Send detected events
+            for event in events:
+                detected_zone = event.get("detected_by_zone", "unknown")
+                logging.warning(f"🚨 [{detected_zone.upper()}] {event['event_type']} (conf={event['confidence']:.2f})")
+                send_event(event)
+                events_detected += 1
+                if detected_zone in zone_event_counts:
+                    zone_event_counts[detected_zone] += 1
             
-            key = cv2.waitKey(1) & 0xFF
-            if key == ord('q'):
-                break
-        
-        frame_idx += 1
-        time.sleep(1.0 / FRAME_FPS)
-    
-    cap.release()
-    cv2.destroyAllWindows()
+            # Snapshot the counts: the writer renders this frame later
+            video.submit(frame, frame_idx, events, events_detected, dict(zone_event_counts))
+    finally:
+        video.close()
     
     logging.info("="*60)
     logging.info("📊 Multi-Zone Detection Summary")
@@ -386,8 +939,8 @@ def process_video_legacy(zone: str, video_path: str, camera_id: str = "cam1", sh
     """
     Process video using LEGACY detection functions (backward compatibility).
     """
-    if zone not in ZONE_TYPES:
-        logging.error(f"Invalid zone '{zone}'. Valid zones: {list(ZONE_TYPES.keys())}")
+    if zone not in _ZONE_CACHE:
+        logging.error(f"Invalid zone '{zone}'. Valid zones: {list(_ZONE_CACHE)}")
         return
     
     if not os.path.exists(video_path):
@@ -400,7 +953,7 @@ def process_video_legacy(zone: str, video_path: str, camera_id: str = "cam1", sh
     logging.info(f"📍 Zone: {zone}")
     logging.info(f"📹 Video: {os.path.basename(video_path)}")
     logging.info(f"🎯 Camera ID: {camera_id}")
-    logging.info(f"🔍 Events to detect: {', '.join(ZONE_TYPES[zone])}")
+    logging.info(f"🔍 Events to detect: {', '.join(_ZONE_CACHE[zone][1])}")
     logging.info(f"🔗 Backend: {BACKEND_URL}")
     logging.info("="*60)
     
@@ -408,7 +961,7 @@ def process_video_legacy(zone: str, video_path: str, camera_id: str = "cam1", sh
     model = load_yolov8()
     
     # Open video
-    cap = cv2.VideoCapture(video_path)
+    cap = VideoSource(video_path)
     if not cap.isOpened():
         logging.error(f"Failed to open video: {video_path}")
         return
@@ -417,72 +970,76 @@ def process_video_legacy(zone: str, video_path: str, camera_id: str = "cam1", sh
     total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
     logging.info(f"  Video FPS: {fps:.1f}, Total frames: {total_frames}")
     
-    frame_idx = 0
     events_detected = 0
+    event_base = {"tenant_id": TENANT_ID, "camera_id": camera_id, "zone": zone}
     
-    while True:
-        ret, frame = cap.read()
-        if not ret:
-            # Loop video for continuous testing
-            cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-            frame_idx = 0
-            continue
-        
-        # Run YOLO inference
-        detections = run_inference(model, frame)
+    def render(frame, frame_idx, detections, events, events_detected):
+        # Inference is done with this frame (each read is a fresh array): draw in place
+        annotated = annotate_frame(frame, detections, zone)
         
-        # Log detection counts periodically
-        if frame_idx % 30 == 0:
-            person_count = len(detections.get("person", []))
-            vehicle_count = sum(len(detections.get(v, [])) for v in ["car", "bus", "truck", "motorcycle"])
-            phone_count = len(detections.get("cell phone", []))
-            logging.info(f"📈 Frame {frame_idx}: persons={person_count}, vehicles={vehicle_count}, phones={phone_count}")
+        # Add event indicator if event detected this frame
+        if events:
+            cv2.putText(annotated, "EVENT DETECTED!", (10, 70),
+                       cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 0, 255), 2)
         
-        # Detect events for this zone
-        events = detect_all_events(detections, zone, camera_id)
-        
-        # Send detected events
-        for event_data in events:
-            event = {
-                "event_id": f"evt_{event_data['event_type']}_{int(time.time()*1000)}",
-                "tenant_id": TENANT_ID,
-                "camera_id": camera_id,
-                "zone": zone,
-                "event_type": event_data["event_type"],
-                "confidence": event_data["confidence"],
-                "timestamp": time.time(),
-                "bounding_boxes": event_data["bounding_boxes"],
-                "severity_score": event_data["confidence"],
-            }
-            logging.warning(f"🚨 EVENT DETECTED: {event_data['event_type']} (confidence={event_data['confidence']:.2f})")
-            send_event(event)
-            events_detected += 1
-        
-        # Show preview with annotations
-        if show_preview:
-            annotated = annotate_frame(frame, detections, zone)
+        # Status bar
+        status = f"Frame: {frame_idx} | Events: {events_detected} | Press 'q' to quit"
+        cv2.putText(annotated, status, (10, annotated.shape[0] - 20),
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+        return annotated
+    
+    io_cores = configure_threads()
+    video = ThreadedVideoPipeline(cap, render if show_preview else None,
+                                  f"SentinelAI - {zone} ({camera_id})", io_cores=io_cores)
+    # Unchanged scene → reuse the last frame's detections instead of YOLO.
+    # Off unless STATIC_SKIP_THRESHOLD > 0; events are still evaluated every frame.
+    static_gate = StaticFrameGate()
+    last_result = None
+    try:
+        for frame_idx, frame in video.frames():
+            # Run YOLO inference
+            t0 = time.monotonic()
+            if static_gate.is_static(frame):         # never true before a first result
+                detections, class_ids = last_result
+            else:
+                detections, class_ids = last_result = run_inference(model, frame, return_class_ids=True)
             
-            # Add event indicator if event detected this frame
-            if events:
-                cv2.putText(annotated, "EVENT DETECTED!", (10, 70),
-                           cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 0, 255), 2)
+            # Log detection counts periodically
+            if frame_idx % 30 == 0:
+                counts = np.bincount(class_ids, minlength=80)
+                person_count = counts[0]
+                vehicle_count = counts[VEHICLE_IDS].sum()
+                phone_count = counts[67]
+                logging.info(f"📈 Frame {frame_idx}: persons={person_count}, vehicles={vehicle_count}, "
+                             f"phones={phone_count}, static_skipped={static_gate.skipped}")
             
-            # Status bar
-            status = f"Frame: {frame_idx} | Events: {events_detected} | Press 'q' to quit"
-            cv2.putText(annotated, status, (10, annotated.shape[0] - 20),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+            # Detect events for this zone
+            events = detect_all_events(detections, zone, camera_id)
+            video.record_processing_time(time.monotonic() - t0)
             
-            cv2.imshow(f"SentinelAI - {zone} ({camera_id})", annotated)
+            # Send detected events (one clock read per frame; the sequence
+            # number keeps ids unique when several events share a millisecond)
+            if events:
+                now = time.time()
+                id_stamp = int(now * 1000)
+            for event_data in events:
+                event = {
+                    **event_base,
+                    "event_id": f"evt_{event_data['event_type']}_{id_stamp}_{next(_event_seq)}",
+                    "event_type": event_data["event_type"],
+                    "confidence": event_data["confidence"],
+                    "timestamp": now,
+                    "bounding_boxes": event_data["bounding_boxes"],
+                    "severity_score": event_data["confidence"],
+                }
+                logging.warning(f"🚨 EVENT DETECTED: {event_data['event_type']} (confidence={event_data['confidence']:.2f})")
+                send_event(event)
+                events_detected += 1
             
-            key = cv2.waitKey(1) & 0xFF
-            if key == ord('q'):
-                break
-        
-        frame_idx += 1
-        time.sleep(1.0 / FRAME_FPS)
+            video.submit(frame, frame_idx, detections, events, events_detected)
+    finally:
+        video.close()
     
-    cap.release()
-    cv2.destroyAllWindows()
     logging.info(f"Processing complete. Total events detected: {events_detected}")
 
 
@@ -491,8 +1048,7 @@ def main():
         print(__doc__)
         print("\nAvailable zones and their models:")
         print("  all: Runs ALL detectors (multi-zone detection)")
-        for zone, events in ZONE_TYPES.items():
-            config = ZONE_MODEL_CONFIGS.get(zone) if HAS_REGISTRY else None
+        for zone, (config, events) in _ZONE_CACHE.items():
             model = config.model_file if config else "yolov8n.pt"
             print(f"  {zone}: {', '.join(events)} (model: {model})")
         sys.exit(1)
@@ -502,16 +1058,16 @@ def main():
     camera_id = sys.argv[3] if len(sys.argv) > 3 and not sys.argv[3].startswith("-") else "cam1"
     
     # Validate zone
-    valid_zones = list(ZONE_TYPES.keys()) + ["all"]
-    if zone.lower() not in valid_zones:
-        print(f"Invalid zone '{zone}'. Valid options: {valid_zones}")
+    if zone.lower() not in VALID_ZONES:
+        print(f"Invalid zone '{zone}'. Valid options: {list(VALID_ZONES)}")
         sys.exit(1)
     
     # Check for flags
     show_preview = "--no-preview" not in sys.argv
     use_legacy = "--legacy" in sys.argv
+    precision = "fp32" if "--fp32" in sys.argv else None
     
-    process_video(zone, video_path, camera_id, show_preview, use_legacy)
+    process_video(zone, video_path, camera_id, show_preview, use_legacy, precision)
 
 
 if __name__ == "__main__":
@@ -36,12 +36,18 @@ New shared detectors (weapon / fire_smoke / pose):
 import os
 import cv2
 import time
+import queue
+import inspect
 import numpy as np
 import logging
 import requests
 import threading
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from functools import lru_cache, partial
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 # Ensure backend root is on sys.path for package imports (zones, models)
 import sys
@@ -60,6 +66,24 @@ CAMERA_ID   = os.getenv("CAMERA_ID",   "cam1")
 # Event flood protection config
 EVENT_COOLDOWN_SECONDS = float(os.getenv("EVENT_COOLDOWN_SECONDS", "10"))
 MAX_FPS_PER_CAMERA     = float(os.getenv("MAX_FPS_PER_CAMERA", "10"))
+EVENT_QUEUE_SIZE       = int(os.getenv("EVENT_QUEUE_SIZE", "256"))
+
+# Zone-model inference precision: fp16 halves GPU inference time at
+# near-identical mAP (ignored on CPU, where ultralytics always runs fp32)
+YOLO_PRECISION = os.getenv("YOLO_PRECISION", "fp16").lower()   # fp16 | fp32
+
+# Letterbox + upload each frame once for every model (GPU only)
+SHARED_PREPROCESS = os.getenv("SHARED_PREPROCESS", "1") == "1"
+
+# Replay all MultiZonePipeline zone models from one captured CUDA graph
+# (fixed 640×640 input; experimental, falls back to eager on any failure)
+CUDA_GRAPHS = os.getenv("CUDA_GRAPHS", "0") == "1"
+
+# Static-scene skip (off by default): frames where no block of a 32×32 grey
+# thumbnail moved by this many levels (0-255) since the last processed frame
+# reuse that frame's model outputs; at most STATIC_MAX_SKIP in a row. 0 disables.
+STATIC_SKIP_THRESHOLD = float(os.getenv("STATIC_SKIP_THRESHOLD", "0"))
+STATIC_MAX_SKIP       = int(os.getenv("STATIC_MAX_SKIP", "5"))
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 
@@ -85,7 +109,9 @@ class EventCooldownManager:
     """
     Prevents event flooding by tracking per-camera event state.
     
-    Key format: {camera_id}:{event_type}
+    State is sharded by camera: {camera_id: {event_type: (last_time, last_confidence)}}.
+    Each camera's shard is only written by that camera's worker thread, so
+    should_emit() takes no lock; the lock only guards creating/removing shards.
     
     Features:
     - Per-event-type cooldown durations (weapon=10s, vehicle=5s, etc.)
@@ -95,13 +121,20 @@ class EventCooldownManager:
     def __init__(self, default_cooldown: float = EVENT_COOLDOWN_SECONDS):
         self._default_cooldown = default_cooldown
         self._lock = threading.Lock()
-        # key -> {last_time, last_confidence}
-        self._state: Dict[str, Dict[str, float]] = {}
+        # camera_id -> event_type -> (last_time [monotonic], last_confidence)
+        self._shards: Dict[str, Dict[str, tuple]] = {}
     
     def _get_cooldown(self, event_type: str) -> float:
         """Get cooldown duration for specific event type."""
         return EVENT_TYPE_COOLDOWNS.get(event_type, self._default_cooldown)
     
+    def _shard(self, camera_id: str) -> Dict[str, tuple]:
+        shard = self._shards.get(camera_id)
+        if shard is None:
+            with self._lock:
+                shard = self._shards.setdefault(camera_id, {})
+        return shard
+    
     def should_emit(
         self, 
         camera_id: str, 
@@ -117,53 +150,46 @@ class EventCooldownManager:
         - Cooldown expired (per-event-type duration)
         - Confidence increased by more than threshold (default 10%)
         """
-        key = f"{camera_id}:{event_type}"
-        now = time.time()
-        cooldown = self._get_cooldown(event_type)
+        shard = self._shard(camera_id)
+        now   = time.monotonic()
+        prev  = shard.get(event_type)
         
-        with self._lock:
-            if key not in self._state:
-                # First occurrence — emit and record
-                self._state[key] = {"last_time": now, "last_confidence": confidence}
-                return True
-            
-            state = self._state[key]
-            elapsed = now - state["last_time"]
-            prev_conf = state["last_confidence"]
-            
-            # Check cooldown expiry (using per-event-type cooldown)
-            if elapsed >= cooldown:
-                state["last_time"] = now
-                state["last_confidence"] = confidence
-                return True
-            
-            # Check confidence increase
-            if confidence > prev_conf * (1 + confidence_increase_threshold):
-                state["last_time"] = now
-                state["last_confidence"] = confidence
-                logging.debug(
-                    f"Event {key} emitted: confidence increased "
-                    f"{prev_conf:.2f} -> {confidence:.2f}"
-                )
-                return True
-            
-            # Suppress duplicate
-            return False
+        if prev is None:
+            # First occurrence — emit and record
+            shard[event_type] = (now, confidence)
+            return True
+        
+        last_time, prev_conf = prev
+        
+        # Check cooldown expiry (using per-event-type cooldown)
+        if now - last_time >= self._get_cooldown(event_type):
+            shard[event_type] = (now, confidence)
+            return True
+        
+        # Check confidence increase
+        if confidence > prev_conf * (1 + confidence_increase_threshold):
+            shard[event_type] = (now, confidence)
+            logging.debug(
+                f"Event {camera_id}:{event_type} emitted: confidence increased "
+                f"{prev_conf:.2f} -> {confidence:.2f}"
+            )
+            return True
+        
+        # Suppress duplicate
+        return False
     
     def reset(self, camera_id: Optional[str] = None):
         """Clear cooldown state for a camera or all cameras."""
         with self._lock:
             if camera_id:
-                keys_to_remove = [k for k in self._state if k.startswith(f"{camera_id}:")]
-                for k in keys_to_remove:
-                    del self._state[k]
+                self._shards.pop(camera_id, None)
             else:
-                self._state.clear()
+                self._shards.clear()
     
     def get_stats(self) -> Dict[str, int]:
         """Get cooldown state statistics."""
         with self._lock:
-            return {"tracked_events": len(self._state)}
+            return {"tracked_events": sum(len(shard) for shard in list(self._shards.values()))}
 
 
 # Global cooldown manager (shared across all workers)
@@ -199,6 +225,10 @@ YOLO_CLASSES = {
     67: "cell phone",
     76: "scissors",
 }
+# Same map as an id-indexed array, for naming a whole box array at once
+YOLO_CLASS_NAMES = np.array(
+    [YOLO_CLASSES.get(i) for i in range(max(YOLO_CLASSES) + 1)], dtype=object
+)
 
 VEHICLE_CLASSES = {"car", "motorcycle", "bus", "truck"}
 WEAPON_CLASSES  = {"knife", "scissors"}
@@ -214,12 +244,16 @@ from registry import (
     COCO_WEAPON_CLASSES,
 )
 
+from fast_ops import first_overlap_pair, overlap_pairs, first_inside_pair
+from frame_prep import FramePreprocessor, predict
+
 from zones import ZONE_PROCESSORS
 from zones.base import TrackedObject, FrameMetadata, DetectionEvent
 
 # Lazy imports — only loaded when modules are present
 try:
     from detectors import WeaponDetector, FireSmokeDetector, PoseDetector
+    from detectors import batched
     _DETECTORS_AVAILABLE = True
 except ImportError:
     _DETECTORS_AVAILABLE = False
@@ -239,6 +273,76 @@ except ImportError:
     _BEHAVIORS_AVAILABLE = False
     logging.warning("behaviours.py not found — after-hours check disabled")
 
+try:
+    import torch
+    _CUDA_AVAILABLE = torch.cuda.is_available()
+except ImportError:
+    _CUDA_AVAILABLE = False
+
+
+def _run_on_stream(fn, frame: np.ndarray, stream) -> Any:
+    """fn(frame) with its kernels queued on `stream`; returns once they finish."""
+    with torch.cuda.stream(stream):
+        out = fn(frame)
+    stream.synchronize()
+    return out
+
+
+def _make_preprocessor(half: bool) -> Optional[FramePreprocessor]:
+    """Shared per-frame preprocessor, or None (CPU, disabled, or unavailable)."""
+    if not (SHARED_PREPROCESS and _CUDA_AVAILABLE):
+        return None
+    try:
+        return FramePreprocessor(half=half)
+    except Exception as e:
+        logging.warning(f"Shared frame preprocessing unavailable — {e}")
+        return None
+
+
+class StaticFrameGate:
+    """
+    Cheap "has the scene changed?" check run before inference.
+
+    Compares a 32×32 greyscale thumbnail with the one from the last frame
+    that was actually processed (not the previous frame, so slow drift
+    still accumulates into a change). The scene counts as changed when any
+    single block moves by `threshold` grey levels: a whole-frame mean
+    would hide a small subject moving.
+    """
+
+    THUMB = (32, 32)
+
+    def __init__(self, threshold: float = STATIC_SKIP_THRESHOLD,
+                 max_skip: int = STATIC_MAX_SKIP):
+        self.threshold = threshold
+        self.max_skip  = max_skip
+        self.skipped   = 0          # total frames skipped
+        self._run      = 0          # consecutive skips
+        self._ref      = None
+
+    def is_static(self, frame: np.ndarray) -> bool:
+        """True if `frame` can reuse the last result; otherwise it becomes the reference."""
+        if self.threshold <= 0:
+            return False
+        # Stride first: INTER_AREA over a full 1080p frame costs ~7 ms
+        step  = max(1, frame.shape[0] // 128)
+        thumb = cv2.cvtColor(
+            cv2.resize(frame[::step, ::step], self.THUMB, interpolation=cv2.INTER_AREA),
+            cv2.COLOR_BGR2GRAY,
+        )
+        if (self._ref is not None and self._run < self.max_skip
+                and cv2.absdiff(thumb, self._ref).max() < self.threshold):
+            self._run    += 1
+            self.skipped += 1
+            return True
+        self._ref = thumb
+        self._run = 0
+        return False
+
+    def reset(self):
+        self._ref = None
+        self._run = 0
+
 
 # ============================================================================
 # SHARED DETECTOR BUNDLE (SINGLETON)
@@ -300,13 +404,36 @@ class SharedDetectors:
                     "SharedDetectors: detectors.py missing — "
                     "weapon/fire/pose will not run"
                 )
-            
+
+            # result key → detector, for the ones that loaded
+            self._active = {
+                key: detector for key, detector in (
+                    ("weapons",    self._weapon_detector),
+                    ("fire_smoke", self._fire_smoke_detector),
+                    ("poses",      self._pose_detector),
+                ) if detector
+            }
+
+            # Three small models each leave most SMs idle — overlap them
+            # on their own CUDA streams
+            self._executor = None
+            self._streams  = {}
+            if _CUDA_AVAILABLE and len(self._active) > 1:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=len(self._active), thread_name_prefix="shared-detectors"
+                )
+                self._streams = {key: torch.cuda.Stream() for key in self._active}
+                logging.info("SharedDetectors: running on separate CUDA streams")
+
             SharedDetectors._initialized = True
 
-    def run(self, frame: np.ndarray) -> Dict[str, Any]:
+    def run(self, frame: np.ndarray, prepared: Any = None) -> Dict[str, Any]:
         """
         Run all shared detectors on a frame.
 
+        `prepared` is the frame_prep.PreparedFrame for this frame, if the
+        caller already built one.
+
         Returns a dict passed as `shared_detections` into each zone processor:
         {
             "weapons":    [ {class_name, confidence, bbox}, ... ],
@@ -316,15 +443,19 @@ class SharedDetectors:
         """
         result = {"weapons": [], "fire_smoke": [], "poses": []}
 
-        if self._weapon_detector:
-            result["weapons"]    = self._weapon_detector.detect(frame)
-
-        if self._fire_smoke_detector:
-            result["fire_smoke"] = self._fire_smoke_detector.detect(frame)
-
-        if self._pose_detector:
-            result["poses"]      = self._pose_detector.detect(frame)
+        if self._executor is None:
+            for key, detector in self._active.items():
+                result[key] = detector.detect(frame, prepared)
+            return result
 
+        futures = {
+            key: self._executor.submit(
+                _run_on_stream, partial(detector.detect, prepared=prepared), frame, self._streams[key]
+            )
+            for key, detector in self._active.items()
+        }
+        for key, future in futures.items():
+            result[key] = future.result()
         return result
     
     @property
@@ -349,6 +480,17 @@ def get_shared_detectors() -> SharedDetectors:
 # DETECTION PIPELINE (single camera)
 # ============================================================================
 
+def _bind_zone_processor(processor: Any):
+    """processor.process_frame as f(frame, objects, metadata, shared), passing shared only if accepted."""
+    process = processor.process_frame
+    params  = inspect.signature(process).parameters.values()
+    if any(p.name == "shared_detections" or p.kind is p.VAR_KEYWORD for p in params):
+        return lambda frame, objects, metadata, shared: process(
+            frame, objects, metadata, shared_detections=shared
+        )
+    return lambda frame, objects, metadata, shared: process(frame, objects, metadata)
+
+
 class DetectionPipeline:
     """
     Main detection pipeline for a single camera.
@@ -365,15 +507,41 @@ class DetectionPipeline:
         shared_detectors: Optional["SharedDetectors"] = None,
         reid_manager:     Optional[Any]               = None,
         after_hours:      Optional[Any]               = None,
+        fps:              Optional[float]             = None,
+        precision:        Optional[str]               = None,
     ):
         self.camera_id = camera_id
         self.zone      = zone
+        self.precision = (precision or YOLO_PRECISION).lower()
+        self._half     = self.precision == "fp16"
 
         self._model_registry   = get_model_registry()
         self._tracker_registry = get_tracker_registry()
 
         self._model        = self._model_registry.get_model(zone)
         self._model_config = self._model_registry.get_config(zone)
+        # The registry shares one model object (and ultralytics predictor)
+        # between zones on the same file; its calls go through one
+        # BatchedModel so cameras of those zones never drive it concurrently
+        model_file   = self._model_config.model_file
+        file_configs = [c for c in ZONE_MODEL_CONFIGS.values() if c.model_file == model_file]
+        if self._model is not None and _DETECTORS_AVAILABLE and len(file_configs) > 1:
+            self._model = batched(self._model, f"zone-{os.path.splitext(model_file)[0]}")
+        self._preprocessor = _make_preprocessor(self._half)
+        # Zone classes that also have a name, for the vectorised box filter
+        self._class_ids    = np.array(
+            sorted(set(self._model_config.classes) & YOLO_CLASSES.keys()), dtype=np.int64
+        )
+        # Filter applied inside ultralytics' NMS, so unwanted boxes never
+        # leave the GPU: loosest threshold and union of classes over every
+        # zone on this model file (same rule as MultiZonePipeline), so all
+        # callers of a shared model pass identical settings; the exact
+        # per-zone cut stays in _postprocess_boxes
+        file_configs = file_configs or [self._model_config]
+        self._nms_filter = {
+            "conf":    min(c.confidence_threshold for c in file_configs),
+            "classes": sorted(set().union(*(c.classes for c in file_configs)) & YOLO_CLASSES.keys()),
+        }
 
         if self._model is None:
             raise RuntimeError(
@@ -381,23 +549,35 @@ class DetectionPipeline:
                 "Ensure dependencies are installed and the project venv is active."
             )
 
-        self._tracker = self._tracker_registry.get_tracker(camera_id)
+        self._tracker = self._tracker_registry.get_tracker(camera_id, fps=fps)
 
         processor_class = ZONE_PROCESSORS.get(zone)
         if processor_class is None:
             raise ValueError(f"No zone processor found for zone: {zone}")
         self._zone_processor = processor_class(camera_id)
+        # Zone processors that predate shared_detections are called without it;
+        # decided once here instead of a try/except TypeError per frame
+        self._call_zone_processor = _bind_zone_processor(self._zone_processor)
 
         # Shared components (may be None if modules not installed)
         self._shared_detectors = shared_detectors
         self._reid_manager     = reid_manager
         self._after_hours      = after_hours
 
-        self._frame_idx = 0
+        self._frame_idx       = 0
+        self._last_detections = []    # zone-model detections of the last frame
+        self._last_shared     = {}    # shared-detector output of the last processed frame
+        # Reused for every frame; zone processors read it but never keep it
+        self._metadata = FrameMetadata(camera_id, 0, 0.0, (0, 0))
+        self._static_gate     = StaticFrameGate()
+
+        # school_ground weapon diagnostics, only when DEBUG logging is on
+        self._debug_school = (zone == "school_ground"
+                              and logging.getLogger().isEnabledFor(logging.DEBUG))
 
         logging.info(
             f"DetectionPipeline ready: camera={camera_id} zone={zone} "
-            f"model={self._model_config.model_file} "
+            f"model={self._model_config.model_file} ({self.precision}) "
             f"weapon={'✓' if shared_detectors and shared_detectors._weapon_detector else '✗'} "
             f"fire={'✓' if shared_detectors and shared_detectors._fire_smoke_detector else '✗'} "
             f"pose={'✓' if shared_detectors and shared_detectors._pose_detector else '✗'} "
@@ -412,26 +592,37 @@ class DetectionPipeline:
     def process_frame(self, frame: np.ndarray) -> List[Dict]:
         timestamp = time.time()
 
-        # 1. Zone-model YOLO inference
-        raw_detections = self._run_yolo_inference(frame)
+        # Unchanged scene: reuse the last model outputs (steps 1 and 3); the
+        # tracker and zone processor still run so tracks and buffers age
+        if self._static_gate.is_static(frame):
+            raw_detections = self._last_detections
+            shared         = self._last_shared
+        else:
+            # 0. Letterbox + upload once for the zone model and shared detectors
+            prepared = self._preprocessor(frame) if self._preprocessor else None
+
+            # 1. Zone-model YOLO inference
+            raw_detections = self._run_yolo_inference(frame, prepared=prepared)
+            self._last_detections = raw_detections
+
+            # 3. Shared detectors — weapon / fire+smoke / pose
+            #    Results are passed INTO the zone processor, not acted on directly.
+            shared = {}
+            if self._shared_detectors:
+                shared = self._shared_detectors.run(frame, prepared)
+            self._last_shared = shared
 
         # 2. Tracking — maintain object identity
         tracked_objects = self._run_tracking(raw_detections)
 
-        # 3. Shared detectors — weapon / fire+smoke / pose
-        #    Results are passed INTO the zone processor, not acted on directly.
-        shared = {}
-        if self._shared_detectors:
-            shared = self._shared_detectors.run(frame)
-
         # Debug: inspect shared detections for school_ground cameras
-        if self.zone == "school_ground" and self._frame_idx % 30 == 0:
+        if self._debug_school and self._frame_idx % 30 == 0:
             weapons = shared.get("weapons", []) if isinstance(shared, dict) else []
             max_conf = max((w.get("confidence", 0.0) for w in weapons), default=0.0)
             persons = [o for o in tracked_objects if o.class_name == "person"]
             coco_weapons = [o for o in tracked_objects if o.class_name in ("knife", "scissors")]
             all_classes = set(o.class_name for o in tracked_objects)
-            logging.info(
+            logging.debug(
                 f"[SCHOOL_GROUND_DEBUG] camera={self.camera_id} frame={self._frame_idx} "
                 f"weapons={len(weapons)} max_conf={max_conf:.2f} "
                 f"persons={len(persons)} coco_weapons={len(coco_weapons)} "
@@ -439,29 +630,14 @@ class DetectionPipeline:
             )
             # Log individual weapon detections for analysis
             for w in weapons:
-                logging.info(
+                logging.debug(
                     f"  [WEAPON_DET] class={w.get('class_name')} "
                     f"conf={w.get('confidence', 0):.2f} bbox={w.get('bbox')}"
                 )
 
         # 4. Zone processor — temporal buffer + suspicion scoring
-        metadata = FrameMetadata(
-            camera_id=self.camera_id,
-            frame_idx=self._frame_idx,
-            timestamp=timestamp,
-            frame_size=(frame.shape[1], frame.shape[0]),
-        )
-        # Zone processors that support shared_detections accept it via kwarg.
-        # Older zone processors that don't yet accept it still work fine.
-        try:
-            zone_events = self._zone_processor.process_frame(
-                frame, tracked_objects, metadata, shared_detections=shared
-            )
-        except TypeError:
-            # Backward compat: zone processor doesn't accept shared_detections yet
-            zone_events = self._zone_processor.process_frame(
-                frame, tracked_objects, metadata
-            )
+        metadata = self._frame_metadata(frame, timestamp)
+        zone_events = self._call_zone_processor(frame, tracked_objects, metadata, shared)
 
         # 5. After-hours filter — escalate severity if outside school hours
         if self._after_hours:
@@ -483,42 +659,71 @@ class DetectionPipeline:
     # Inference helpers
     # ------------------------------------------------------------------
 
-    def _run_yolo_inference(self, frame: np.ndarray) -> List[Dict]:
-        """Run zone model YOLO inference. Returns raw detections (NOT events)."""
-        results    = self._model(frame, verbose=False)
-        detections = []
+    def _run_yolo_inference(self, frame: np.ndarray, results: Any = None,
+                            prepared: Any = None) -> List[Dict]:
+        """
+        Run zone model YOLO inference. Returns raw detections (NOT events).
 
+        `results` is output already computed with this pipeline's model
+        (MultiZonePipeline shares one forward pass between zones).
+        """
+        if results is None:
+            results = self._predict(frame, prepared)
+        detections = []
         for result in results:
-            boxes = result.boxes
-            if boxes is None:
-                continue
-            for i in range(len(boxes)):
-                cls_id     = int(boxes.cls[i].item())
-                conf       = float(boxes.conf[i].item())
-                xyxy       = boxes.xyxy[i].cpu().numpy().astype(int).tolist()
-                class_name = YOLO_CLASSES.get(cls_id)
+            detections.extend(self._postprocess_boxes(result))
+        return detections
 
-                if class_name is None:
-                    continue
-                if conf < self._model_config.confidence_threshold:
-                    continue
-                if cls_id not in self._model_config.classes:
-                    continue
+    def _postprocess_boxes(self, result: Any) -> List[Dict]:
+        """
+        One ultralytics result → detections passing this zone's classes / threshold.
 
-                detections.append({
-                    "class_id":   cls_id,
-                    "class_name": class_name,
-                    "confidence": conf,
-                    "bbox":       xyxy,
-                })
+        NMS has already dropped most boxes (see _predict); the remaining
+        (N, 6) tensor comes to the host in one copy and is filtered again
+        there, for results shared with zones that use a looser filter.
+        """
+        boxes = result.boxes
+        if boxes is None or len(boxes) == 0:
+            return []
+        data = boxes.data.cpu().numpy()          # x1 y1 x2 y2 [track] conf cls
+        conf = data[:, -2]
+        cls  = data[:, -1].astype(np.int64)
+        keep = (conf >= self._model_config.confidence_threshold) & np.isin(cls, self._class_ids)
+        if not keep.any():
+            return []
+        cls = cls[keep]
+        return [
+            {
+                "class_id":   cls_id,
+                "class_name": name,
+                "confidence": c,
+                "bbox":       xyxy,
+            }
+            for cls_id, name, c, xyxy in zip(
+                cls.tolist(), YOLO_CLASS_NAMES[cls].tolist(),
+                conf[keep].tolist(), data[keep, :4].astype(int).tolist(),
+            )
+        ]
 
-        return detections
+    def _predict(self, frame: np.ndarray, prepared: Any = None,
+                 nms_filter: Optional[Dict[str, Any]] = None) -> Any:
+        """Zone-model output at this pipeline's precision, conf / classes filtered in NMS."""
+        return predict(self._model, frame, prepared, verbose=False, half=self._half,
+                       **(nms_filter or self._nms_filter))
 
     def _run_tracking(self, detections: List[Dict]) -> List[TrackedObject]:
         """Run tracker → return list of TrackedObject with stable IDs."""
-        tracked_data    = self._tracker.update(detections)
-        tracked_objects = []
+        tracked_data = self._tracker.update(detections)
+
+        # Both built-in trackers return TrackedObjectData lists
+        if tracked_data and type(tracked_data[0]) is TrackedObjectData:
+            return [
+                TrackedObject(td.object_id, td.class_name, td.bbox, td.confidence,
+                              td.motion_vector, td.timestamp)
+                for td in tracked_data
+            ]
 
+        tracked_objects = []
         for td in tracked_data:
             if isinstance(td, TrackedObjectData):
                 tracked_objects.append(TrackedObject(
@@ -539,17 +744,32 @@ class DetectionPipeline:
 
         return tracked_objects
 
+    def _frame_metadata(self, frame: np.ndarray, timestamp: float) -> FrameMetadata:
+        """The pipeline's FrameMetadata, updated in place for this frame."""
+        meta = self._metadata
+        meta.frame_idx = self._frame_idx
+        meta.timestamp = timestamp
+        width, height  = meta.frame_size
+        if width != frame.shape[1] or height != frame.shape[0]:
+            meta.frame_size = (frame.shape[1], frame.shape[0])
+        return meta
+
     def _format_events(
         self, zone_events: List[DetectionEvent], timestamp: float
     ) -> List[Dict]:
         """Format zone processor output into backend event schema."""
-        events = []
-        for event in zone_events:
-            events.append({
-                "event_id":      f"evt_{event.event_type}_{int(timestamp * 1000)}",
+        if not zone_events:
+            return []
+        # Per-frame constants, hoisted out of the per-event dict
+        stamp     = int(timestamp * 1000)
+        camera_id = self.camera_id
+        zone      = self.zone
+        return [
+            {
+                "event_id":      f"evt_{event.event_type}_{stamp}",
                 "tenant_id":     TENANT_ID,
-                "camera_id":     self.camera_id,
-                "zone":          self.zone,
+                "camera_id":     camera_id,
+                "zone":          zone,
                 "event_type":    event.event_type,
                 "confidence":    event.confidence,
                 "timestamp":     timestamp,
@@ -559,22 +779,40 @@ class DetectionPipeline:
                 # These fields are populated later by re-id enrichment
                 "global_person_id": None,
                 "after_hours":      event.metadata.get("after_hours", False) if event.metadata else False,
-            })
-        return events
+            }
+            for event in zone_events
+        ]
 
     # ------------------------------------------------------------------
     # Utilities
     # ------------------------------------------------------------------
 
     def get_detections_summary(self, frame: np.ndarray) -> Dict[str, int]:
+        """Class counts for `frame` — runs the zone model again; see get_last_summary()."""
+        return self._summarize(self._run_yolo_inference(frame))
+
+    @property
+    def static_skips(self) -> int:
+        """Frames skipped so far as unchanged (StaticFrameGate)."""
+        return self._static_gate.skipped
+
+    def get_last_summary(self) -> Dict[str, int]:
+        """Class counts from the last processed frame, without another inference."""
+        return self._summarize(self._last_detections)
+
+    @staticmethod
+    def _summarize(detections: List[Dict]) -> Dict[str, int]:
         summary = {}
-        for det in self._run_yolo_inference(frame):
+        for det in detections:
             name = det["class_name"]
             summary[name] = summary.get(name, 0) + 1
         return summary
 
     def reset(self):
         self._frame_idx = 0
+        self._static_gate.reset()
+        self._last_detections = []
+        self._last_shared     = {}
         self._tracker_registry.reset_tracker(self.camera_id)
         if hasattr(self._zone_processor, "temporal_buffer"):
             self._zone_processor.temporal_buffer = type(
@@ -586,6 +824,92 @@ class DetectionPipeline:
 # MULTI-ZONE PIPELINE
 # ============================================================================
 
+class ZoneGraphRunner:
+    """
+    Forward passes of several zone models captured in ONE CUDA graph.
+
+    Every frame is letterboxed to a fixed IMGSZ×IMGSZ into a static input
+    buffer and the graph is replayed — a single launch instead of one per
+    kernel, which is what dominates for the small yolov8n backbone. NMS
+    and box rescaling stay outside the graph; output is wrapped in
+    ultralytics Results so _run_yolo_inference consumes it unchanged.
+
+    Build only after the models have run eagerly once (ultralytics moves,
+    fuses and casts them to the inference device/dtype on first predict).
+    """
+
+    IMGSZ    = 640
+    IOU      = 0.7     # ultralytics predict() defaults
+    MAX_DET  = 300
+    WARMUP   = 3
+
+    def __init__(self, models: Dict[int, Any], nms_filters: Dict[int, Dict[str, Any]]):
+        from ultralytics.data.augment import LetterBox
+        from ultralytics.engine.results import Results
+        from ultralytics.utils import ops
+        try:
+            from ultralytics.utils.nms import non_max_suppression
+        except ImportError:
+            non_max_suppression = ops.non_max_suppression
+
+        self._letterbox   = LetterBox((self.IMGSZ, self.IMGSZ), auto=False)
+        self._results     = Results
+        self._nms         = non_max_suppression
+        self._scale_boxes = ops.scale_boxes
+
+        self._nets  = {key: model.model for key, model in models.items()}
+        self._names = {key: model.names for key, model in models.items()}
+        self._nms_filters = nms_filters
+
+        params = {(p.device, p.dtype) for p in
+                  (next(net.parameters()) for net in self._nets.values())}
+        if len(params) != 1:
+            raise RuntimeError(f"zone models disagree on device/dtype: {params}")
+        device, dtype = params.pop()
+        if device.type != "cuda":
+            raise RuntimeError(f"zone models are on {device}, not CUDA")
+
+        self._static_in = torch.zeros((1, 3, self.IMGSZ, self.IMGSZ), device=device, dtype=dtype)
+
+        # Warm up on a side stream so capture sees steady-state allocations
+        side = torch.cuda.Stream()
+        side.wait_stream(torch.cuda.current_stream())
+        with torch.no_grad(), torch.cuda.stream(side):
+            for _ in range(self.WARMUP):
+                for net in self._nets.values():
+                    net(self._static_in)
+        torch.cuda.current_stream().wait_stream(side)
+
+        # thread_local: other cameras' threads keep using the same (shared)
+        # models while this one captures
+        self._graph = torch.cuda.CUDAGraph()
+        with torch.no_grad(), torch.cuda.graph(self._graph, capture_error_mode="thread_local"):
+            self._static_out = {key: self._first(net(self._static_in))
+                                for key, net in self._nets.items()}
+
+    @staticmethod
+    def _first(output: Any) -> Any:
+        # Detect head returns (predictions, feature maps) in eval mode
+        return output[0] if isinstance(output, (list, tuple)) else output
+
+    def run(self, frame: np.ndarray) -> Dict[int, Any]:
+        """Replay the graph on `frame` → {model key: [Results]}."""
+        img = self._letterbox(image=frame)
+        x   = torch.from_numpy(np.ascontiguousarray(img[..., ::-1].transpose(2, 0, 1)))
+        self._static_in[0].copy_(x, non_blocking=True)
+        self._static_in.div_(255)
+        self._graph.replay()
+
+        out = {}
+        for key, pred in self._static_out.items():
+            nms_filter = self._nms_filters[key]
+            det = self._nms(pred, nms_filter["conf"], self.IOU,
+                            classes=nms_filter["classes"], max_det=self.MAX_DET)[0]
+            det[:, :4] = self._scale_boxes(self._static_in.shape[2:], det[:, :4], frame.shape)
+            out[key] = [self._results(frame, path="", names=self._names[key], boxes=det)]
+        return out
+
+
 class MultiZonePipeline:
     """
     Run a single video through ALL zone processors simultaneously.
@@ -597,7 +921,8 @@ class MultiZonePipeline:
 
     ALL_ZONES = ["outgate", "corridor", "school_ground", "classroom"]
 
-    def __init__(self, camera_id: str):
+    def __init__(self, camera_id: str, fps: Optional[float] = None,
+                 precision: Optional[str] = None):
         self.camera_id = camera_id
 
         # ── Shared components — singleton instances ───────────────────
@@ -623,52 +948,163 @@ class MultiZonePipeline:
                     shared_detectors=self._shared_detectors,
                     reid_manager=self._reid_manager,
                     after_hours=self._after_hours,
+                    fps=fps,
+                    precision=precision,
                 )
                 logging.info(f"MultiZonePipeline: {zone} pipeline ready")
             except Exception as e:
                 logging.warning(f"MultiZonePipeline: {zone} failed to init — {e}")
 
-        self._frame_idx = 0
+        # ── Zones grouped by loaded model ─────────────────────────────
+        # The registry hands zones with the same model file one shared
+        # object (corridor + school_ground → yolov8s), so each group needs
+        # a single forward pass per frame.
+        self._model_groups: Dict[int, List[str]] = {}
+        for zone, pipeline in self._pipelines.items():
+            self._model_groups.setdefault(id(pipeline._model), []).append(zone)
+
+        # NMS filter per group: loosest threshold, union of classes; each
+        # zone still applies its own in _postprocess_boxes
+        self._nms_filters: Dict[int, Dict[str, Any]] = {}
+        for key, zones in self._model_groups.items():
+            filters = [self._pipelines[zone]._nms_filter for zone in zones]
+            self._nms_filters[key] = {
+                "conf":    min(f["conf"] for f in filters),
+                "classes": sorted(set().union(*(f["classes"] for f in filters))),
+            }
+
+        # Distinct models overlap on their own CUDA streams
+        self._executor = None
+        self._streams  = {}
+        if _CUDA_AVAILABLE and len(self._model_groups) > 1:
+            self._executor = ThreadPoolExecutor(
+                max_workers=len(self._model_groups),
+                thread_name_prefix=f"multizone-{camera_id}",
+            )
+            self._streams = {key: torch.cuda.Stream() for key in self._model_groups}
+
+        # One letterboxed GPU tensor per frame for shared detectors + zone models
+        self._preprocessor = _make_preprocessor((precision or YOLO_PRECISION).lower() == "fp16")
+
+        # Captured after the first eager frame, when the models are on device
+        self._graph_runner = None
+        self._graph_failed = not (CUDA_GRAPHS and _CUDA_AVAILABLE and self._model_groups)
+
+        self._static_gate = StaticFrameGate()
+        self._last_shared = {}
+        self._frame_idx   = 0
         logging.info(
-            f"MultiZonePipeline ready: {len(self._pipelines)}/{len(self.ALL_ZONES)} zones"
+            f"MultiZonePipeline ready: {len(self._pipelines)}/{len(self.ALL_ZONES)} zones, "
+            f"{len(self._model_groups)} model(s)"
+            f"{' on CUDA streams' if self._executor else ''}"
         )
 
     def process_frame(self, frame: np.ndarray) -> List[Dict]:
         """
         Process frame through ALL zones.
 
-        Shared detectors run ONCE inside each DetectionPipeline.process_frame()
-        (the first zone to call shared_detectors.run() pays the cost; subsequent
-        zones reuse the cached result for this frame via the shared reference).
-
-        NOTE: To truly run shared detectors only once per frame, pass the
-        shared result explicitly. We do that here:
+        Shared detectors and each distinct zone model run ONCE for this
+        frame; the results are passed into every zone pipeline, which still
+        applies its own classes / threshold, tracker and processor.
         """
         all_events = []
 
-        # Run shared detectors once for this frame
-        shared = self._shared_detectors.run(frame) if self._shared_detectors else {}
-
-        for zone, pipeline in self._pipelines.items():
-            try:
-                # Temporarily inject pre-computed shared detections
-                # so each zone pipeline doesn't re-run the heavy models
-                events = pipeline._process_frame_with_shared(frame, shared)
-                for event in events:
-                    event["detected_by_zone"] = zone
-                all_events.extend(events)
-            except AttributeError:
-                # Fallback: pipeline doesn't have _process_frame_with_shared yet
-                events = pipeline.process_frame(frame)
-                for event in events:
-                    event["detected_by_zone"] = zone
-                all_events.extend(events)
-            except Exception as e:
-                logging.error(f"MultiZonePipeline {zone} error: {e}")
+        if self._static_gate.is_static(frame):
+            # Unchanged scene: no shared detectors or zone models; every zone
+            # reuses its last detections so trackers and buffers still age
+            shared        = self._last_shared
+            model_results = None
+        else:
+            # Preprocess and run shared detectors once for this frame
+            prepared = self._preprocessor(frame) if self._preprocessor else None
+            shared   = self._shared_detectors.run(frame, prepared) if self._shared_detectors else {}
+            self._last_shared = shared
+
+            # One forward pass per distinct zone model
+            model_results = self._run_zone_models(frame, prepared)
+
+        for key, zones in self._model_groups.items():
+            results = model_results.get(key) if model_results is not None else None
+            if isinstance(results, Exception):
+                logging.error(f"MultiZonePipeline {'/'.join(zones)} error: {results}")
+                continue
+            for zone in zones:
+                pipeline = self._pipelines[zone]
+                reused   = pipeline._last_detections if model_results is None else None
+                try:
+                    events = pipeline._process_frame_with_shared(
+                        frame, shared, results=results, detections=reused
+                    )
+                    for event in events:
+                        event["detected_by_zone"] = zone
+                    all_events.extend(events)
+                except Exception as e:
+                    logging.error(f"MultiZonePipeline {zone} error: {e}")
 
         self._frame_idx += 1
         return all_events
 
+    @property
+    def concurrent_models(self) -> int:
+        """Zone models running at the same time (1 unless overlapped on CUDA streams)."""
+        return len(self._model_groups) if self._executor else 1
+
+    def _run_zone_models(self, frame: np.ndarray, prepared: Any = None) -> Dict[int, Any]:
+        """Zone-model YOLO output per model group (an Exception if it failed)."""
+        if self._graph_runner is not None:
+            try:
+                return self._graph_runner.run(frame)
+            except Exception as e:
+                logging.warning(f"MultiZonePipeline {self.camera_id}: CUDA graph replay failed, "
+                                f"back to eager — {e}")
+                self._graph_runner = None
+                self._graph_failed = True
+
+        out = self._run_zone_models_eager(frame, prepared)
+        if not self._graph_failed:
+            self._capture_graph()
+        return out
+
+    def _capture_graph(self):
+        """Capture all zone models into one CUDA graph (once; eager on failure)."""
+        self._graph_failed = True
+        try:
+            self._graph_runner = ZoneGraphRunner({
+                key: self._pipelines[zones[0]]._model
+                for key, zones in self._model_groups.items()
+            }, self._nms_filters)
+            logging.info(f"MultiZonePipeline {self.camera_id}: "
+                         f"{len(self._model_groups)} zone model(s) captured in a CUDA graph")
+        except Exception as e:
+            logging.warning(f"MultiZonePipeline {self.camera_id}: CUDA graph capture "
+                            f"unavailable, staying eager — {e}")
+
+    def _run_zone_models_eager(self, frame: np.ndarray, prepared: Any = None) -> Dict[int, Any]:
+        predictors = {key: partial(self._pipelines[zones[0]]._predict, prepared=prepared,
+                                   nms_filter=self._nms_filters[key])
+                      for key, zones in self._model_groups.items()}
+
+        if self._executor is None:
+            out = {}
+            for key, run in predictors.items():
+                try:
+                    out[key] = run(frame)
+                except Exception as e:
+                    out[key] = e
+            return out
+
+        futures = {
+            key: self._executor.submit(_run_on_stream, run, frame, self._streams[key])
+            for key, run in predictors.items()
+        }
+        out = {}
+        for key, future in futures.items():
+            try:
+                out[key] = future.result()
+            except Exception as e:
+                out[key] = e
+        return out
+
     def get_detections_summary(self, frame: np.ndarray) -> Dict[str, int]:
         summary = {}
         for zone, pipeline in self._pipelines.items():
@@ -676,35 +1112,46 @@ class MultiZonePipeline:
                 summary[f"{zone}:{cls_name}"] = summary.get(f"{zone}:{cls_name}", 0) + count
         return summary
 
+    @property
+    def static_skips(self) -> int:
+        """Frames skipped so far as unchanged (StaticFrameGate)."""
+        return self._static_gate.skipped
+
+    def get_last_summary(self) -> Dict[str, int]:
+        """Per-zone class counts from the last processed frame (no inference)."""
+        return {
+            f"{zone}:{cls_name}": count
+            for zone, pipeline in self._pipelines.items()
+            for cls_name, count in pipeline.get_last_summary().items()
+        }
+
     def reset(self):
         self._frame_idx = 0
+        self._static_gate.reset()
+        self._last_shared = {}
         for p in self._pipelines.values():
             p.reset()
 
 
 # Patch DetectionPipeline with _process_frame_with_shared so MultiZonePipeline
 # can inject a pre-computed shared dict and skip re-running heavy models.
-def _process_frame_with_shared(self, frame: np.ndarray, shared: Dict) -> List[Dict]:
-    """Like process_frame() but accepts pre-computed shared detections."""
-    timestamp       = time.time()
-    raw_detections  = self._run_yolo_inference(frame)
-    tracked_objects = self._run_tracking(raw_detections)
-
-    metadata = FrameMetadata(
-        camera_id=self.camera_id,
-        frame_idx=self._frame_idx,
-        timestamp=timestamp,
-        frame_size=(frame.shape[1], frame.shape[0]),
-    )
+def _process_frame_with_shared(
+    self, frame: np.ndarray, shared: Dict, results: Any = None,
+    detections: Optional[List[Dict]] = None,
+) -> List[Dict]:
+    """
+    Like process_frame() but accepts pre-computed shared detections / YOLO
+    results, or zone detections to reuse as they are (static frames).
+    """
+    timestamp = time.time()
+    if detections is None:
+        detections = self._run_yolo_inference(frame, results)
+        self._last_detections = detections
+    tracked_objects = self._run_tracking(detections)
 
-    try:
-        zone_events = self._zone_processor.process_frame(
-            frame, tracked_objects, metadata, shared_detections=shared
-        )
-    except TypeError:
-        zone_events = self._zone_processor.process_frame(
-            frame, tracked_objects, metadata
-        )
+    metadata = self._frame_metadata(frame, timestamp)
+
+    zone_events = self._call_zone_processor(frame, tracked_objects, metadata, shared)
 
     if self._after_hours:
         zone_events = self._after_hours.filter(zone_events, self.zone)
@@ -724,6 +1171,14 @@ DetectionPipeline._process_frame_with_shared = _process_frame_with_shared
 # CAMERA WORKER
 # ============================================================================
 
+# One keep-alive connection pool for every camera's event sender. Connect
+# failures are retried; POSTs are not replayed after a read error.
+_SESSION = requests.Session()
+for _prefix in ("http://", "https://"):
+    _SESSION.mount(_prefix, HTTPAdapter(pool_connections=8, pool_maxsize=64,
+                                        max_retries=Retry(total=2, backoff_factor=0.1)))
+
+
 class CameraWorker:
     """
     Per-camera worker with production-ready safeguards.
@@ -735,9 +1190,31 @@ class CameraWorker:
     - Uses singleton SharedDetectors (no model reload per camera)
     - Event cooldown filtering (prevents flood)
     - Configurable FPS throttle
+    - Drain-to-latest on live sources (no backlog in the capture buffer)
+    - Events POSTed from a background thread (backend latency never stalls frames)
     - Safe shutdown handling (no silent thread termination)
     """
 
+    # Sources that produce frames in real time (vs. files, read at our pace)
+    LIVE_PREFIXES = ("rtsp://", "rtmp://", "http://", "https://", "udp://", "tcp://")
+    RING_SLOTS    = 4     # pre-allocated frames decoded into round-robin (≤3 in flight)
+    STATS_EVERY   = 30    # frames between WORKER_STATS log lines
+
+    # Preview box colours (BGR): event severity first, then detecting zone
+    PREVIEW_SEVERITY_COLORS = {
+        "weapon_detected":    (0, 0, 255),      # red
+        "fire_smoke_detected":(0, 128, 255),    # orange
+        "fight":              (0, 0, 200),      # dark red
+        "fall_detected":      (255, 0, 255),    # magenta
+        "after_hours_intrusion": (0, 0, 180),   # deep red
+    }
+    PREVIEW_ZONE_COLORS = {
+        "outgate":      (255, 165, 0),
+        "corridor":     (0,   255, 255),
+        "school_ground":(0,   255, 0),
+        "classroom":    (255, 0,   255),
+    }
+
     def __init__(
         self,
         camera_id:    str,
@@ -753,7 +1230,7 @@ class CameraWorker:
         self.max_fps      = max_fps or MAX_FPS_PER_CAMERA
 
         if zone.lower() == "all":
-            self._pipeline    = MultiZonePipeline(camera_id)
+            self._pipeline    = MultiZonePipeline(camera_id, fps=self.max_fps)
             self._is_multizone = True
         else:
             # Use singleton SharedDetectors — same instance for all cameras
@@ -765,6 +1242,7 @@ class CameraWorker:
                 shared_detectors=shared,
                 reid_manager=reid_mgr,
                 after_hours=after_hrs,
+                fps=self.max_fps,
             )
             self._is_multizone = False
 
@@ -774,9 +1252,26 @@ class CameraWorker:
         self._frame_count   = 0
         self._event_count   = 0
         self._suppressed_count = 0
-        self._last_frame_time  = 0.0
+        self._dropped_count    = 0
+        self._stats_countdown  = 0     # WORKER_STATS logged when it reaches 0
+        self._is_live          = (str(video_source).isdigit()
+                                  or str(video_source).lower().startswith(self.LIVE_PREFIXES))
+        self._last_frame_time  = 0.0   # time.monotonic()
         self._min_frame_interval = 1.0 / self.max_fps if self.max_fps > 0 else 0.0
 
+        # Event delivery: bounded queue → sender thread on the shared session
+        self._event_q = queue.Queue(maxsize=EVENT_QUEUE_SIZE)
+        self._sender  = None
+
+        # Decode stage: its own thread hands frames over through a 1-slot
+        # queue, so the next frame is read while this one is inferred
+        self._frame_q     = queue.Queue(maxsize=1)
+        self._decoder     = None
+
+        self._overlay_buf = None   # preview canvas, reused while the frame size holds
+        self._frame_ring  = []     # decode targets, allocated from the first frame
+        self._ring_idx    = 0
+
     def start(self):
         """Start the camera worker. Blocks until stop() is called."""
         try:
@@ -785,6 +1280,14 @@ class CameraWorker:
                 raise RuntimeError(f"Cannot open video: {self.video_source}")
             self._running = True
             self._shutdown_flag.clear()
+            self._sender = threading.Thread(
+                target=self._event_sender_loop, name=f"events-{self.camera_id}", daemon=True
+            )
+            self._sender.start()
+            self._decoder = threading.Thread(
+                target=self._decode_loop, name=f"decode-{self.camera_id}", daemon=True
+            )
+            self._decoder.start()
             logging.info(
                 f"CameraWorker started: {self.camera_id} ({self.zone}) "
                 f"[max_fps={self.max_fps}]"
@@ -807,6 +1310,11 @@ class CameraWorker:
     def _safe_cleanup(self):
         """Ensure all resources are released."""
         self._running = False
+        self._flush_events()
+        if self._decoder is not None:
+            # The decoder owns the capture until it exits
+            self._decoder.join(timeout=2.0)
+            self._decoder = None
         if self._cap:
             try:
                 self._cap.release()
@@ -819,13 +1327,49 @@ class CameraWorker:
             pass
         logging.info(
             f"CameraWorker stopped: {self.camera_id} "
-            f"(events={self._event_count}, suppressed={self._suppressed_count})"
+            f"(events={self._event_count}, suppressed={self._suppressed_count}, "
+            f"dropped={self._dropped_count})"
         )
 
-    def _process_loop(self):
+    def _read_latest(self):
+        """
+        cap.read(), but on live sources skip to the newest buffered frame.
+
+        While a frame is being processed the camera keeps producing and
+        OpenCV/FFmpeg queue the frames, so reading one per iteration falls
+        further behind. Grab until a quarter of the frame interval has
+        passed (a grab blocks once the buffer is empty), then decode only
+        the last one.
+
+        Frames are decoded into a ring of RING_SLOTS pre-allocated arrays
+        instead of a fresh allocation per frame. At most three are in use
+        at once — being processed, waiting in _frame_q, being decoded —
+        and nothing downstream keeps a frame beyond its iteration (zone
+        buffers store tracked objects).
+        """
+        if not self._cap.grab():
+            return False, None
+        if self._is_live:
+            deadline = time.monotonic() + self._min_frame_interval / 4
+            while time.monotonic() < deadline and self._cap.grab():
+                self._dropped_count += 1
+
+        slot = self._frame_ring[self._ring_idx] if self._frame_ring else None
+        ret, frame = self._cap.retrieve(slot)
+        if not ret:
+            return False, None
+        if frame is not slot:
+            # First frame or resolution change: (re)build the ring around it
+            self._frame_ring = [frame] + [np.empty_like(frame) for _ in range(self.RING_SLOTS - 1)]
+            self._ring_idx   = 0
+        self._ring_idx = (self._ring_idx + 1) % len(self._frame_ring)
+        return True, frame
+
+    def _decode_loop(self):
+        """Decode stage: throttled reads into _frame_q (blocks while the last frame is unclaimed)."""
         while self._running and not self._shutdown_flag.is_set():
-            # FPS throttle
-            now = time.time()
+            # FPS throttle (monotonic: immune to wall-clock / NTP steps)
+            now = time.monotonic()
             elapsed = now - self._last_frame_time
             if elapsed < self._min_frame_interval:
                 sleep_time = self._min_frame_interval - elapsed
@@ -836,11 +1380,31 @@ class CameraWorker:
             self._last_frame_time = now
 
             try:
-                ret, frame = self._cap.read()
+                ret, frame = self._read_latest()
                 if not ret:
                     self._cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
                     continue
+            except Exception as e:
+                logging.error(f"CameraWorker {self.camera_id} decode error: {e}", exc_info=True)
+                continue
+
+            while self._running and not self._shutdown_flag.is_set():
+                try:
+                    self._frame_q.put(frame, timeout=0.5)
+                    break
+                except queue.Full:
+                    continue
+
+    def _process_loop(self):
+        while self._running and not self._shutdown_flag.is_set():
+            try:
+                frame = self._frame_q.get(timeout=0.5)
+            except queue.Empty:
+                if self._decoder is not None and not self._decoder.is_alive():
+                    break
+                continue
 
+            try:
                 events = self._pipeline.process_frame(frame)
                 
                 # Apply event cooldown filtering
@@ -868,16 +1432,20 @@ class CameraWorker:
                 if self.show_preview:
                     self._show_preview(frame, filtered_events)
 
-                if self._frame_count % 30 == 0:
-                    summary = self._pipeline.get_detections_summary(frame)
+                if self._stats_countdown == 0:
+                    self._stats_countdown = self.STATS_EVERY
+                    summary = self._pipeline.get_last_summary()
                     stats = _event_cooldown.get_stats()
                     logging.info(
                         f"[WORKER_STATS] camera={self.camera_id} frame={self._frame_count} "
                         f"events={self._event_count} suppressed={self._suppressed_count} "
-                        f"tracked_cooldowns={stats['tracked_events']}"
+                        f"dropped={self._dropped_count} static_skipped={self._pipeline.static_skips} "
+                        f"tracked_cooldowns={stats['tracked_events']} "
+                        f"detections={summary}"
                     )
 
                 self._frame_count += 1
+                self._stats_countdown -= 1
                 
             except Exception as e:
                 logging.error(
@@ -888,6 +1456,37 @@ class CameraWorker:
                 continue
 
     def _send_event(self, event: Dict):
+        """Queue event for the sender thread (dropped with an error if the queue is full)."""
+        try:
+            self._event_q.put_nowait(event)
+        except queue.Full:
+            logging.error(
+                f"✗ [EVENT_QUEUE_FULL] id={event.get('event_id', 'null')} "
+                f"type={event.get('event_type', 'unknown')} camera={self.camera_id} — dropped"
+            )
+
+    def _event_sender_loop(self):
+        while True:
+            event = self._event_q.get()
+            try:
+                if event is None:
+                    return
+                self._post_event(event)
+            finally:
+                self._event_q.task_done()
+
+    def _flush_events(self, timeout: float = 10.0):
+        """Let queued events go out before shutdown, then stop the sender."""
+        if self._sender is None or not self._sender.is_alive():
+            return
+        try:
+            self._event_q.put(None, timeout=timeout)
+        except queue.Full:
+            logging.warning(f"CameraWorker {self.camera_id}: event queue still full at shutdown")
+            return
+        self._sender.join(timeout)
+
+    def _post_event(self, event: Dict):
         """Send event to backend via HTTP POST with detailed logging."""
         event_type = event.get("event_type", "unknown")
         event_id = event.get("event_id", "null")
@@ -900,7 +1499,7 @@ class CameraWorker:
         )
         
         try:
-            resp = requests.post(BACKEND_URL, json=event, timeout=5)
+            resp = _SESSION.post(BACKEND_URL, json=event, timeout=5)
             if resp.status_code == 200:
                 logging.info(
                     f"✓ [EVENT_DELIVERY_OK] id={event_id} type={event_type} "
@@ -930,31 +1529,24 @@ class CameraWorker:
             )
 
     def _show_preview(self, frame: np.ndarray, events: List[Dict]):
-        annotated  = frame.copy()
+        # Copy into a reused canvas rather than allocating a frame.copy()
+        # every frame (`frame` is a decode-ring slot, not ours to draw on)
+        if self._overlay_buf is None or self._overlay_buf.shape != frame.shape:
+            self._overlay_buf = np.empty_like(frame)
+        annotated  = self._overlay_buf
+        np.copyto(annotated, frame)
         zone_label = "Zone: ALL" if self._is_multizone else f"Zone: {self.zone}"
         cv2.putText(annotated, zone_label, (10, 30),
                     cv2.FONT_HERSHEY_SIMPLEX, 1.0, (255, 255, 255), 2)
 
-        zone_colors = {
-            "outgate":      (255, 165, 0),
-            "corridor":     (0,   255, 255),
-            "school_ground":(0,   255, 0),
-            "classroom":    (255, 0,   255),
-        }
-        # Colour-code by event severity
-        severity_colors = {
-            "weapon_detected":    (0, 0, 255),      # red
-            "fire_smoke_detected":(0, 128, 255),    # orange
-            "fight":              (0, 0, 200),      # dark red
-            "fall_detected":      (255, 0, 255),    # magenta
-            "after_hours_intrusion": (0, 0, 180),   # deep red
-        }
-
         if events:
+            # Boxes grouped by colour → one polylines call per colour
+            boxes_by_color: Dict[tuple, list] = {}
             for event in events:
                 etype  = event.get("event_type", "")
                 dzone  = event.get("detected_by_zone", self.zone)
-                color  = severity_colors.get(etype) or zone_colors.get(dzone, (0, 0, 255))
+                color  = (self.PREVIEW_SEVERITY_COLORS.get(etype)
+                          or self.PREVIEW_ZONE_COLORS.get(dzone, (0, 0, 255)))
                 label  = etype
 
                 # Show global_person_id if present (from Re-ID)
@@ -964,13 +1556,17 @@ class CameraWorker:
 
                 for bbox in event.get("bounding_boxes", []):
                     if len(bbox) == 4:
-                        cv2.rectangle(annotated,
-                                      (bbox[0], bbox[1]), (bbox[2], bbox[3]),
-                                      color, 2)
+                        boxes_by_color.setdefault(color, []).append(bbox)
                         cv2.putText(annotated, label,
-                                    (bbox[0], bbox[1] - 5),
+                                    (int(bbox[0]), int(bbox[1]) - 5),
                                     cv2.FONT_HERSHEY_SIMPLEX, 0.45, color, 1)
 
+            for color, boxes in boxes_by_color.items():
+                xyxy = np.asarray(boxes, dtype=np.int32)
+                # Rectangle corners, clockwise from top-left
+                corners = xyxy[:, [0, 1, 2, 1, 2, 3, 0, 3]].reshape(-1, 4, 2)
+                cv2.polylines(annotated, list(corners), True, color, 2)
+
             # After-hours banner
             if any(e.get("after_hours") for e in events):
                 cv2.putText(annotated, "⚠ AFTER HOURS", (10, 70),
@@ -990,66 +1586,172 @@ class CameraWorker:
 # ============================================================================
 
 _legacy_model = None
+_legacy_lock  = threading.Lock()
+
+# Classes run_inference() reports, in its dict order
+_LEGACY_CLASS_NAMES   = ("person", "car", "motorcycle", "bus", "truck", "cell phone")
+# VEHICLE_CLASSES as a tuple: a fixed merge order (set order varies between runs)
+_LEGACY_VEHICLE_NAMES = tuple(name for name in _LEGACY_CLASS_NAMES if name in VEHICLE_CLASSES)
+_LEGACY_CLASS_IDS     = np.array(
+    [cls_id for cls_id, name in YOLO_CLASSES.items() if name in _LEGACY_CLASS_NAMES],
+    dtype=np.int64,
+)
+
+
+class LegacyDetections(dict):
+    """
+    run_inference() output: {class_name: [{box, confidence}, ...]}, plus the
+    same detections per class as struct-of-arrays in `arrays`:
+    name → ((N,4) float64 boxes, (N,) float64 confidences), in list order.
+    """
+
+    __slots__ = ("arrays",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.arrays: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+
+
+# run_inference() result for frames with no boxes at all; shared, never mutated
+EMPTY_DETECTIONS = LegacyDetections((name, ()) for name in _LEGACY_CLASS_NAMES)
+EMPTY_DETECTIONS.arrays.update(
+    (name, (np.empty((0, 4)), np.empty(0))) for name in _LEGACY_CLASS_NAMES
+)
+
 
 def load_yolov8():
+    """
+    Corridor zone model for the legacy path.
+
+    Wrapped in a BatchedModel when detectors.py is available, so cameras
+    calling run_inference() at the same time share one batched predict.
+    """
     global _legacy_model
-    if _legacy_model is None:
-        registry      = get_model_registry()
-        _legacy_model = registry.get_model("corridor")
+    with _legacy_lock:
+        if _legacy_model is None:
+            registry = get_model_registry()
+            model    = registry.get_model("corridor")
+            if model is not None and _DETECTORS_AVAILABLE:
+                # Same wrapper as corridor's DetectionPipeline, if one exists
+                model = batched(model, "legacy")
+            _legacy_model = model
     return _legacy_model
 
 
-def run_inference(model, frame) -> Dict[str, List[Dict]]:
+def run_inference(model, frame, return_class_ids: bool = False):
+    """
+    Legacy YOLO pass → {class_name: [{box, confidence}, ...]}.
+
+    With return_class_ids=True also returns every raw COCO class id as an
+    int64 array, so callers can count with np.bincount instead of walking
+    the dict.
+
+    Frames without any box return the shared EMPTY_DETECTIONS (read-only).
+    """
     results    = model(frame, verbose=False)
-    detections: Dict[str, List[Dict]] = {
-        "person": [], "car": [], "motorcycle": [],
-        "bus": [], "truck": [], "cell phone": [],
-    }
+    if all(r.boxes is None or len(r.boxes) == 0 for r in results):
+        if return_class_ids:
+            return EMPTY_DETECTIONS, np.empty(0, dtype=np.int64)
+        return EMPTY_DETECTIONS
+    detections = LegacyDetections((name, []) for name in _LEGACY_CLASS_NAMES)
+    class_ids  = []
+    kept       = []
     for result in results:
         boxes = result.boxes
         if boxes is None:
             continue
-        for i in range(len(boxes)):
-            cls_id     = int(boxes.cls[i].item())
-            conf       = float(boxes.conf[i].item())
-            xyxy       = boxes.xyxy[i].cpu().numpy().astype(int).tolist()
-            class_name = YOLO_CLASSES.get(cls_id)
-            if class_name and class_name in detections:
-                detections[class_name].append({"box": xyxy, "confidence": conf})
+        # One device→host copy per result instead of .item() syncs per box
+        data = boxes.data.cpu().numpy()          # x1 y1 x2 y2 [track] conf cls
+        cls  = data[:, -1].astype(np.int64)
+        if return_class_ids:
+            class_ids.append(cls)
+        keep  = np.isin(cls, _LEGACY_CLASS_IDS)
+        names = YOLO_CLASS_NAMES[cls[keep]]
+        xyxy  = data[keep, :4].astype(int)
+        confs = data[keep, -2].astype(np.float64)
+        kept.append((names, xyxy, confs))
+        for name, conf, box in zip(names.tolist(), confs.tolist(), xyxy.tolist()):
+            detections[name].append({"box": box, "confidence": conf})
+    # SoA view for the event checks, built from the same arrays as the dicts
+    if len(kept) == 1:
+        names, xyxy, confs = kept[0]
+    elif kept:
+        names, xyxy, confs = (np.concatenate(parts) for parts in zip(*kept))
+    for name in _LEGACY_CLASS_NAMES:
+        if detections[name]:
+            mask = names == name
+            detections.arrays[name] = (xyxy[mask].astype(np.float64), confs[mask])
+        else:
+            detections.arrays[name] = (np.empty((0, 4)), np.empty(0))
+    if return_class_ids:
+        ids = np.concatenate(class_ids) if class_ids else np.empty(0, dtype=np.int64)
+        return detections, ids
     return detections
 
 
-from collections import deque
-
 class FrameHistory:
+    """
+    Per-camera summary of the last `max_frames` legacy frames, in
+    preallocated NumPy rings indexed by head % max_frames: person centres
+    (up to MAX_PERSONS per frame, int16), their count, the vehicle count
+    and the timestamp — no per-frame objects.
+    """
+
+    MAX_PERSONS = 64
+
     def __init__(self, max_frames: int = 10):
-        self.history: deque         = deque(maxlen=max_frames)
+        self.max_frames             = max_frames
+        self.centers                = np.zeros((max_frames, self.MAX_PERSONS, 2), dtype=np.int16)
+        self.n_persons              = np.zeros(max_frames, dtype=np.int8)
+        self.n_vehicles             = np.zeros(max_frames, dtype=np.uint8)
+        self.timestamps             = np.zeros(max_frames, dtype=np.float64)
+        self.head: int              = 0     # frames added so far; next slot is head % max_frames
         self.crowd_frame_count: int = 0
         self.fight_frame_count: int = 0
 
     def add_frame(self, detections: Dict[str, List[Dict]]):
-        self.history.append({"detections": detections, "timestamp": time.time()})
-
-    def get_recent_person_positions(self, n_frames: int = 3) -> List[List[Dict]]:
-        return [f["detections"].get("person", []) for f in list(self.history)[-n_frames:]]
+        boxes, _ = _class_arrays(detections, "person")
+        boxes    = boxes[:self.MAX_PERSONS]
+        slot     = self.head % self.max_frames
+        n        = len(boxes)
+        self.centers[slot, :n] = (boxes[:, :2] + boxes[:, 2:]) // 2
+        self.n_persons[slot]   = n
+        self.n_vehicles[slot]  = min(255, sum(len(detections.get(name, ())) for name in _LEGACY_VEHICLE_NAMES))
+        self.timestamps[slot]  = time.time()
+        self.head += 1
+
+    def get_recent_person_positions(self, n_frames: int = 3) -> List[np.ndarray]:
+        """Person centres of the last n frames, one (N,2) int16 array per frame, oldest first."""
+        n_frames = min(n_frames, self.head, self.max_frames)
+        slots    = [(self.head - k) % self.max_frames for k in range(n_frames, 0, -1)]
+        return [self.centers[slot, :self.n_persons[slot]].copy() for slot in slots]
 
 
 _frame_histories: Dict[str, FrameHistory] = {}
 
 def get_frame_history(camera_id: str) -> FrameHistory:
-    if camera_id not in _frame_histories:
-        _frame_histories[camera_id] = FrameHistory()
-    return _frame_histories[camera_id]
+    """One FrameHistory per camera; safe to call from several threads."""
+    history = _frame_histories.get(camera_id)
+    if history is None:
+        # setdefault is a single atomic dict op: racing first callers get the same object
+        history = _frame_histories.setdefault(camera_id, FrameHistory())
+    return history
 
 
 def detect_all_events(detections, zone, camera_id) -> List[Dict]:
     events  = []
     history = get_frame_history(camera_id)
     history.add_frame(detections)
+    if detections is EMPTY_DETECTIONS:
+        # What every check below would conclude on an empty frame
+        history.crowd_frame_count = history.fight_frame_count = 0
+        return events
 
     if zone == "outgate":
-        for fn in (_legacy_detect_vehicle, _legacy_detect_accident):
-            r = fn(detections)
+        # Both outgate checks share one merged vehicle list
+        vehicles = [det for vt in _LEGACY_VEHICLE_NAMES for det in detections.get(vt, ())]
+        for r in (_legacy_detect_vehicle(vehicles),
+                  _legacy_detect_accident(detections, vehicles)):
             if r:
                 events.append(r)
     elif zone in ("corridor", "school_ground"):
@@ -1065,8 +1767,7 @@ def detect_all_events(detections, zone, camera_id) -> List[Dict]:
     return events
 
 
-def _legacy_detect_vehicle(d):
-    veh = [det for vt in VEHICLE_CLASSES for det in d.get(vt, [])]
+def _legacy_detect_vehicle(veh):
     if not veh:
         return None
     best = max(veh, key=lambda x: x["confidence"])
@@ -1076,19 +1777,41 @@ def _legacy_detect_vehicle(d):
             "bounding_boxes": [v["box"] for v in veh]}
 
 
-def _legacy_detect_accident(d):
-    persons  = d.get("person", [])
-    vehicles = [det for vt in VEHICLE_CLASSES for det in d.get(vt, [])]
+def _legacy_arrays(dets):
+    """Detection dicts → (N,4) float64 boxes, (N,) float64 confidences for fast_ops."""
+    boxes = np.array([det["box"] for det in dets], dtype=np.float64).reshape(-1, 4)
+    confs = np.array([det["confidence"] for det in dets], dtype=np.float64)
+    return boxes, confs
+
+
+def _class_arrays(d, name):
+    """(boxes, confidences) for one class: LegacyDetections' SoA arrays, else packed from the dicts."""
+    arrays = getattr(d, "arrays", None)
+    if arrays is not None and name in arrays:
+        return arrays[name]
+    return _legacy_arrays(d.get(name, []))
+
+
+def _merged_arrays(d, names):
+    """_class_arrays() of several classes, concatenated in `names` order."""
+    boxes, confs = zip(*(_class_arrays(d, name) for name in names))
+    return np.concatenate(boxes), np.concatenate(confs)
+
+
+def _legacy_detect_accident(d, vehicles):
+    persons = d.get("person", [])
     if not persons or not vehicles:
         return None
-    for p in persons:
-        for v in vehicles:
-            if _boxes_overlap(p["box"], v["box"]):
-                avg = (p["confidence"] + v["confidence"]) / 2
-                if avg >= 0.5:
-                    return {"event_type": "gate_accident", "confidence": avg,
-                            "bounding_boxes": [p["box"], v["box"]]}
-    return None
+    # Person/vehicle IoU > 0.1 or centres < 100px apart, mean conf >= 0.5
+    i, j = first_overlap_pair(*_class_arrays(d, "person"),
+                              *_merged_arrays(d, _LEGACY_VEHICLE_NAMES),
+                              0.1, 100.0, 0.5)
+    if i < 0:
+        return None
+    p, v = persons[i], vehicles[j]
+    return {"event_type": "gate_accident",
+            "confidence": (p["confidence"] + v["confidence"]) / 2,
+            "bounding_boxes": [p["box"], v["box"]]}
 
 
 def _legacy_detect_crowd(d, history):
@@ -1096,16 +1819,17 @@ def _legacy_detect_crowd(d, history):
     if len(persons) < 4:
         history.crowd_frame_count = 0
         return None
-    centers  = np.array([((b["box"][0]+b["box"][2])//2, (b["box"][1]+b["box"][3])//2) for b in persons])
-    centroid = centers.mean(axis=0)
-    if np.linalg.norm(centers - centroid, axis=1).mean() > 150:
+    boxes, confs = _class_arrays(d, "person")
+    centers = (boxes[:, :2] + boxes[:, 2:]) // 2
+    offsets = centers - centers.mean(axis=0)
+    if np.sqrt((offsets * offsets).sum(axis=1)).mean() > 150:
         history.crowd_frame_count = 0
         return None
     history.crowd_frame_count += 1
     if history.crowd_frame_count < 3:
         return None
     return {"event_type": "crowd_formation",
-            "confidence": float(np.mean([p["confidence"] for p in persons])),
+            "confidence": float(confs.mean()),
             "bounding_boxes": [p["box"] for p in persons]}
 
 
@@ -1114,15 +1838,16 @@ def _legacy_detect_fight(d, history):
     if len(persons) < 2:
         history.fight_frame_count = 0
         return None
-    for i in range(len(persons)):
-        for j in range(i+1, len(persons)):
-            if _compute_iou(persons[i]["box"], persons[j]["box"]) > 0.15:
-                avg = (persons[i]["confidence"] + persons[j]["confidence"]) / 2
-                if avg >= 0.6:
-                    history.fight_frame_count += 1
-                    if history.fight_frame_count >= 3:
-                        return {"event_type": "fight", "confidence": avg,
-                                "bounding_boxes": [persons[i]["box"], persons[j]["box"]]}
+    # Every overlapping pair (IoU > 0.15, mean conf >= 0.6) counts once,
+    # in (i, j) order; the event fires on the pair that reaches 3.
+    pairs  = overlap_pairs(*_class_arrays(d, "person"), 0.15, 0.6)
+    needed = max(1, 3 - history.fight_frame_count)
+    if len(pairs) >= needed:
+        history.fight_frame_count += needed
+        i, j = pairs[needed - 1]
+        return {"event_type": "fight",
+                "confidence": (persons[i]["confidence"] + persons[j]["confidence"]) / 2,
+                "bounding_boxes": [persons[i]["box"], persons[j]["box"]]}
     history.fight_frame_count = 0
     return None
 
@@ -1132,50 +1857,48 @@ def _legacy_detect_mobile(d):
     phones  = d.get("cell phone", [])
     if not persons or not phones:
         return None
-    for person in persons:
-        for phone in phones:
-            if _box_inside(phone["box"], person["box"]):
-                avg = (person["confidence"] + phone["confidence"]) / 2
-                if avg >= 0.4:
-                    return {"event_type": "mobile_usage", "confidence": avg,
-                            "bounding_boxes": [person["box"], phone["box"]]}
-    return None
+    # First person/phone pair (in order) with the phone box inside the person's, mean conf >= 0.4
+    i, j = first_inside_pair(*_class_arrays(d, "person"), *_class_arrays(d, "cell phone"), 0.4)
+    if i < 0:
+        return None
+    person, phone = persons[i], phones[j]
+    return {"event_type": "mobile_usage",
+            "confidence": (person["confidence"] + phone["confidence"]) / 2,
+            "bounding_boxes": [person["box"], phone["box"]]}
 
 
-def _boxes_overlap(b1, b2):
-    return _compute_iou(b1, b2) > 0.1 or _distance_between(b1, b2) < 100
-
-def _compute_iou(b1, b2):
-    x1 = max(b1[0], b2[0]); y1 = max(b1[1], b2[1])
-    x2 = min(b1[2], b2[2]); y2 = min(b1[3], b2[3])
-    inter = max(0, x2-x1) * max(0, y2-y1)
-    a1 = (b1[2]-b1[0]) * (b1[3]-b1[1])
-    a2 = (b2[2]-b2[0]) * (b2[3]-b2[1])
-    union = a1 + a2 - inter
-    return inter/union if union > 0 else 0
-
-def _distance_between(b1, b2):
-    c1 = ((b1[0]+b1[2])//2, (b1[1]+b1[3])//2)
-    c2 = ((b2[0]+b2[2])//2, (b2[1]+b2[3])//2)
-    return np.hypot(c1[0]-c2[0], c1[1]-c2[1])
-
-def _box_inside(inner, outer):
-    return (inner[0] >= outer[0] and inner[1] >= outer[1]
-            and inner[2] <= outer[2] and inner[3] <= outer[3])
-
-def annotate_frame(frame, detections, zone):
-    annotated = frame.copy()
-    colors = {
-        "person": (0, 255, 0), "car": (255, 0, 0), "motorcycle": (255, 0, 0),
-        "bus": (255, 0, 0), "truck": (255, 0, 0), "cell phone": (0, 255, 255),
-    }
+_ANNOTATE_COLORS = {
+    "person": (0, 255, 0), "car": (255, 0, 0), "motorcycle": (255, 0, 0),
+    "bus": (255, 0, 0), "truck": (255, 0, 0), "cell phone": (0, 255, 255),
+}
+
+def annotate_frame(frame, detections, zone, out=None):
+    """
+    Draw legacy detections. In place on `frame` unless `out` is given, in
+    which case `frame` is copied into `out` (same shape) and drawn there.
+    """
+    if out is None:
+        annotated = frame
+    else:
+        annotated = out
+        np.copyto(annotated, frame)
+    # Boxes grouped by colour → one polylines call per colour (vehicles share one)
+    boxes_by_color: Dict[tuple, list] = {}
     for class_name, dets in detections.items():
-        color = colors.get(class_name, (128, 128, 128))
+        if not dets:
+            continue
+        color = _ANNOTATE_COLORS.get(class_name, (128, 128, 128))
+        boxes = boxes_by_color.setdefault(color, [])
         for det in dets:
             box = det["box"]; conf = det["confidence"]
-            cv2.rectangle(annotated, (box[0], box[1]), (box[2], box[3]), color, 2)
+            boxes.append(box)
             cv2.putText(annotated, f"{class_name}: {conf:.2f}", (box[0], box[1]-10),
                         cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 2)
+    for color, boxes in boxes_by_color.items():
+        xyxy = np.asarray(boxes, dtype=np.int32)
+        # Rectangle corners, clockwise from top-left
+        corners = xyxy[:, [0, 1, 2, 1, 2, 3, 0, 3]].reshape(-1, 4, 2)
+        cv2.polylines(annotated, list(corners), True, color, 2)
     cv2.putText(annotated, f"Zone: {zone}", (10, 30),
                 cv2.FONT_HERSHEY_SIMPLEX, 1.0, (255, 255, 255), 2)
     return annotated
@@ -1189,7 +1912,7 @@ def _fetch_backend_cameras(module: Optional[str] = None) -> List[Dict]:
     cameras_url = BACKEND_URL.replace("/event", "/api/cameras")
     params = {"module": module} if module else {}
     try:
-        resp = requests.get(cameras_url, params=params, timeout=10)
+        resp = _SESSION.get(cameras_url, params=params, timeout=10)
         resp.raise_for_status()
         data = resp.json()
     except Exception as exc:
@@ -1204,6 +1927,32 @@ def _fetch_backend_cameras(module: Optional[str] = None) -> List[Dict]:
     return active
 
 
+@lru_cache(maxsize=256)
+def _resolve_video_path(stripped: str) -> Optional[str]:
+    """Existing file for a relative/manual video_path, or None. Cached per path string."""
+    if os.path.isabs(stripped) and os.path.exists(stripped):
+        return stripped
+
+    # Resolve relative/manual file names against likely roots.
+    worker_dir = os.path.dirname(__file__)
+    backend_dir = BACKEND_ROOT
+    project_root = os.path.abspath(os.path.join(BACKEND_ROOT, ".."))
+    test_videos_dir = os.path.join(backend_dir, "test_videos")
+
+    candidates = [
+        os.path.abspath(stripped),
+        os.path.abspath(os.path.join(worker_dir, stripped)),
+        os.path.abspath(os.path.join(backend_dir, stripped)),
+        os.path.abspath(os.path.join(project_root, stripped)),
+        os.path.abspath(os.path.join(test_videos_dir, stripped)),
+    ]
+
+    for candidate in candidates:
+        if os.path.exists(candidate):
+            return candidate
+    return None
+
+
 def _resolve_camera_source(camera: Dict) -> Optional[Any]:
     video_path = camera.get("video_path")
     if video_path:
@@ -1211,26 +1960,9 @@ def _resolve_camera_source(camera: Dict) -> Optional[Any]:
             stripped = video_path.strip()
             if stripped.startswith(("rtsp://", "http://", "https://")):
                 return stripped
-            if os.path.isabs(stripped) and os.path.exists(stripped):
-                return stripped
-
-            # Resolve relative/manual file names against likely roots.
-            worker_dir = os.path.dirname(__file__)
-            backend_dir = BACKEND_ROOT
-            project_root = os.path.abspath(os.path.join(BACKEND_ROOT, ".."))
-            test_videos_dir = os.path.join(backend_dir, "test_videos")
-
-            candidates = [
-                os.path.abspath(stripped),
-                os.path.abspath(os.path.join(worker_dir, stripped)),
-                os.path.abspath(os.path.join(backend_dir, stripped)),
-                os.path.abspath(os.path.join(project_root, stripped)),
-                os.path.abspath(os.path.join(test_videos_dir, stripped)),
-            ]
-
-            for candidate in candidates:
-                if os.path.exists(candidate):
-                    return candidate
+            resolved = _resolve_video_path(stripped)
+            if resolved is not None:
+                return resolved
 
             logging.warning(
                 f"Camera {camera.get('id', 'unknown')}: video_path not found as file, using raw value: {stripped}"
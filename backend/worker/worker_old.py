@@ -6,10 +6,20 @@ import redis
 import base64
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 from collections import deque
 from typing import Dict, List, Tuple, Optional
 
+# libjpeg-turbo directly — cv2.imencode only uses it if OpenCV was built
+# against it (often not on Jetson)
+try:
+    from turbojpeg import TurboJPEG, TJSAMP_420
+    _tj = TurboJPEG()
+except Exception:
+    _tj = None
+
 # Load .env
 load_dotenv()
 
@@ -18,9 +28,13 @@ FRAME_FPS = int(os.getenv("FRAME_FPS", 5))
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 CAMERA_URL = os.getenv("CAMERA_URL", "0")
 QUEUE_NAME = os.getenv("FRAME_QUEUE", "frames")
+# Frames popped from QUEUE_NAME per YOLO forward pass in queue_worker()
+FRAME_BATCH = int(os.getenv("FRAME_BATCH", 4))
 BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:8000/event")
 TENANT_ID = os.getenv("TENANT_ID", "school1")
 CAMERA_ID = os.getenv("CAMERA_ID", "cam1")
+# Same switch as the zone models in registry.py: run YOLO_MODEL as an FP16 TensorRT engine
+TRT_ENABLED = os.getenv("SENTINEL_TRT_ZONES", "0") == "1"
 
 # Logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
@@ -52,6 +66,29 @@ VEHICLE_CLASSES = {"car", "motorcycle", "bus", "truck"}
 # ============================================================================
 _yolo_model = None
 
+def _fp16_engine(model_path: str) -> Optional[str]:
+    """
+    Cached '<name>.fp16.engine' for a .pt, exported on first use.
+
+    Returns None if the export fails (no TensorRT / GPU); the caller then
+    loads the .pt as before.
+    """
+    engine_path = os.path.splitext(model_path)[0] + ".fp16.engine"
+    if os.path.exists(engine_path):
+        return engine_path
+    try:
+        from ultralytics import YOLO
+        logging.info(f"Exporting FP16 TensorRT engine for {model_path} (one-time, may take minutes)...")
+        exported = YOLO(model_path).export(format="engine", half=True, workspace=4,
+                                           batch=8, dynamic=True)
+        os.replace(exported, engine_path)
+        logging.info(f"FP16 engine cached: {engine_path}")
+        return engine_path
+    except Exception as e:
+        logging.warning(f"FP16 engine export failed for {model_path} — using .pt: {e}")
+        return None
+
+
 def load_yolov8():
     """Load YOLOv8 model (singleton pattern)."""
     global _yolo_model
@@ -59,6 +96,8 @@ def load_yolov8():
         try:
             from ultralytics import YOLO
             model_path = os.getenv("YOLO_MODEL", "yolov8n.pt")
+            if TRT_ENABLED and model_path.endswith(".pt"):
+                model_path = _fp16_engine(model_path) or model_path
             _yolo_model = YOLO(model_path)
             logging.info(f"Loaded YOLOv8 model: {model_path}")
         except Exception as e:
@@ -67,6 +106,35 @@ def load_yolov8():
     return _yolo_model
 
 
+def _result_detections(result) -> Dict[str, List[Dict]]:
+    """One ultralytics Results (one frame) → {class_name: [{box, confidence}, ...]}."""
+    detections: Dict[str, List[Dict]] = {
+        "person": [],
+        "car": [],
+        "motorcycle": [],
+        "bus": [],
+        "truck": [],
+        "cell phone": [],
+    }
+    
+    boxes = result.boxes
+    if boxes is None:
+        return detections
+    for i in range(len(boxes)):
+        cls_id = int(boxes.cls[i].item())
+        conf = float(boxes.conf[i].item())
+        xyxy = boxes.xyxy[i].cpu().numpy().astype(int).tolist()
+        
+        class_name = YOLO_CLASSES.get(cls_id)
+        if class_name and class_name in detections:
+            detections[class_name].append({
+                "box": xyxy,  # [x1, y1, x2, y2]
+                "confidence": conf,
+            })
+    
+    return detections
+
+
 def run_inference(model, frame) -> Dict[str, List[Dict]]:
     """
     Run YOLOv8 inference and return structured detections.
@@ -79,33 +147,17 @@ def run_inference(model, frame) -> Dict[str, List[Dict]]:
             ...
         }
     """
-    results = model(frame, verbose=False)
-    detections: Dict[str, List[Dict]] = {
-        "person": [],
-        "car": [],
-        "motorcycle": [],
-        "bus": [],
-        "truck": [],
-        "cell phone": [],
-    }
-    
-    for result in results:
-        boxes = result.boxes
-        if boxes is None:
-            continue
-        for i in range(len(boxes)):
-            cls_id = int(boxes.cls[i].item())
-            conf = float(boxes.conf[i].item())
-            xyxy = boxes.xyxy[i].cpu().numpy().astype(int).tolist()
-            
-            class_name = YOLO_CLASSES.get(cls_id)
-            if class_name and class_name in detections:
-                detections[class_name].append({
-                    "box": xyxy,  # [x1, y1, x2, y2]
-                    "confidence": conf,
-                })
-    
-    return detections
+    return run_inference_batch(model, [frame])[0]
+
+
+def run_inference_batch(model, frames: List[np.ndarray]) -> List[Dict[str, List[Dict]]]:
+    """
+    run_inference() for several frames in one forward pass (ultralytics
+    letterboxes a list of frames into one batch). One detections dict per
+    frame, in order.
+    """
+    results = model(frames, verbose=False)
+    return [_result_detections(result) for result in results]
 
 
 # ============================================================================
@@ -489,20 +541,45 @@ def connect_redis():
         return None
 
 
-def encode_frame(frame):
+def encode_frame(frame) -> bytes:
+    """Frame → raw JPEG bytes (Redis stores binary values; no base64 needed)."""
+    if _tj is not None:
+        return _tj.encode(frame, quality=95, jpeg_subsample=TJSAMP_420)
     _, buffer = cv2.imencode('.jpg', frame)
-    return base64.b64encode(buffer).decode('utf-8')
+    return buffer.tobytes()
 
 
 def decode_frame(frame_data):
-    img_bytes = base64.b64decode(frame_data)
-    np_arr = np.frombuffer(img_bytes, np.uint8)
-    return cv2.imdecode(np_arr, cv2.IMREAD_COLOR)
+    """
+    JPEG bytes → BGR frame, or None if the data doesn't decode. Also
+    accepts the old base64 payloads ('/9j/…') older ingesters queued.
+    """
+    if not frame_data:
+        return None    # cv2.imdecode raises on an empty buffer
+    if isinstance(frame_data, str) or frame_data[:4] == b"/9j/":
+        try:
+            frame_data = base64.b64decode(frame_data)
+        except ValueError:
+            return None
+    if _tj is not None:
+        try:
+            return _tj.decode(frame_data)
+        except Exception:
+            # TurboJPEG raises on corrupt data; cv2 keeps the None-on-failure contract
+            pass
+    return cv2.imdecode(np.frombuffer(frame_data, np.uint8), cv2.IMREAD_COLOR)
+
+
+# Keep-alive pool shared by every send_event() call (connect failures retried)
+_session = requests.Session()
+for _prefix in ("http://", "https://"):
+    _session.mount(_prefix, HTTPAdapter(pool_connections=16, pool_maxsize=64,
+                                        max_retries=Retry(total=1, backoff_factor=0.1)))
 
 
 def send_event(event):
     try:
-        resp = requests.post(BACKEND_URL, json=event, timeout=2)
+        resp = _session.post(BACKEND_URL, json=event, timeout=2)
         logging.info(f"Event sent: {resp.status_code}")
     except Exception as e:
         logging.error(f"Failed to send event: {e}")
@@ -511,6 +588,38 @@ def send_event(event):
 # ============================================================================
 # MAIN WORKER FUNCTIONS
 # ============================================================================
+def _wait_for_deadline(next_t: float, interval: float) -> float:
+    """
+    Sleep until the frame deadline `next_t` + `interval` (monotonic) and
+    return it, so per-frame work is absorbed into the frame budget. When
+    already past it, restart from now instead of catching up in a burst.
+    """
+    next_t += interval
+    delay = next_t - time.monotonic()
+    if delay > 0:
+        time.sleep(delay)
+        return next_t
+    return time.monotonic()
+
+
+def _send_zone_events(detections: Dict[str, List[Dict]], zone: str, camera_id: str):
+    """Run the zone's event checks on one frame's detections and send what fires."""
+    for event_data in detect_all_events(detections, zone, camera_id):
+        event = {
+            "event_id": f"evt_{event_data['event_type']}_{int(time.time()*1000)}",
+            "tenant_id": TENANT_ID,
+            "camera_id": camera_id,
+            "zone": zone,
+            "event_type": event_data["event_type"],
+            "confidence": event_data["confidence"],
+            "timestamp": time.time(),
+            "bounding_boxes": event_data["bounding_boxes"],
+            "severity_score": event_data["confidence"],
+        }
+        logging.info(f"Event detected: {event_data['event_type']} (conf={event_data['confidence']:.2f})")
+        send_event(event)
+
+
 def zone_worker(zone: str, video_path: Optional[str] = None, camera_id: str = CAMERA_ID):
     """
     Main worker that processes frames for a specific zone.
@@ -543,6 +652,8 @@ def zone_worker(zone: str, video_path: Optional[str] = None, camera_id: str = CA
         return
     
     frame_count = 0
+    interval    = 1.0 / FRAME_FPS
+    next_t      = time.monotonic()
     while True:
         ret, frame = cap.read()
         if not ret:
@@ -555,27 +666,11 @@ def zone_worker(zone: str, video_path: Optional[str] = None, camera_id: str = CA
         # Run YOLO inference
         detections = run_inference(model, frame)
         
-        # Detect events for this zone
-        events = detect_all_events(detections, zone, camera_id)
-        
-        # Send detected events to backend
-        for event_data in events:
-            event = {
-                "event_id": f"evt_{event_data['event_type']}_{int(time.time()*1000)}",
-                "tenant_id": TENANT_ID,
-                "camera_id": camera_id,
-                "zone": zone,
-                "event_type": event_data["event_type"],
-                "confidence": event_data["confidence"],
-                "timestamp": time.time(),
-                "bounding_boxes": event_data["bounding_boxes"],
-                "severity_score": event_data["confidence"],
-            }
-            logging.info(f"Event detected: {event_data['event_type']} (conf={event_data['confidence']:.2f})")
-            send_event(event)
+        # Detect events for this zone and send them to backend
+        _send_zone_events(detections, zone, camera_id)
         
         frame_count += 1
-        time.sleep(1.0 / FRAME_FPS)
+        next_t = _wait_for_deadline(next_t, interval)
     
     cap.release()
     logging.info(f"Zone worker stopped for zone='{zone}'")
@@ -604,6 +699,8 @@ def stream_frames(rtsp_url=CAMERA_URL, fps=FRAME_FPS):
     
     frame_count = 0
     logging.info(f"Starting frame ingest at {fps} FPS")
+    interval = 1.0 / fps
+    next_t   = time.monotonic()
     while True:
         ret, frame = cap.read()
         if not ret:
@@ -612,11 +709,55 @@ def stream_frames(rtsp_url=CAMERA_URL, fps=FRAME_FPS):
         r.lpush(QUEUE_NAME, frame_data)
         frame_count += 1
         logging.info(f"Frame {frame_count} pushed to queue")
-        time.sleep(1.0 / fps)
+        next_t = _wait_for_deadline(next_t, interval)
     
     cap.release()
 
 
+def queue_worker(zone: str, camera_id: str = CAMERA_ID, batch_size: int = FRAME_BATCH):
+    """
+    Consume the frames stream_frames() pushes to Redis, batch_size at a
+    time: block for the oldest frame, take up to batch_size - 1 more that
+    are already queued, and run them through YOLO in one forward pass.
+    Detections are then handled frame by frame, in order.
+    """
+    r = connect_redis()
+    if r is None:
+        logging.error("Redis not available. Cannot consume frames.")
+        return
+    model = load_yolov8()
+    logging.info(f"Queue worker started for zone='{zone}', camera='{camera_id}', batch={batch_size}")
+    
+    while True:
+        # stream_frames() LPUSHes, so the oldest frames are on the right
+        item = r.brpop(QUEUE_NAME, timeout=1)
+        if item is None:
+            continue
+        payloads = [item[1]]
+        while len(payloads) < batch_size:
+            data = r.rpop(QUEUE_NAME)
+            if data is None:
+                break
+            payloads.append(data)
+        
+        # One bad payload costs its frame, not the consumer loop
+        frames = []
+        for data in payloads:
+            try:
+                frame = decode_frame(data)
+            except Exception as e:
+                logging.warning(f"Dropping undecodable frame from '{QUEUE_NAME}': {e}")
+                continue
+            if frame is None:
+                logging.warning(f"Dropping undecodable frame from '{QUEUE_NAME}'")
+                continue
+            frames.append(frame)
+        if not frames:
+            continue
+        for detections in run_inference_batch(model, frames):
+            _send_zone_events(detections, zone, camera_id)
+
+
 # Legacy compatibility
 def event_worker(event_type: str):
     """Legacy worker - maps old event types to zones."""
@@ -643,6 +784,9 @@ if __name__ == "__main__":
             zone = sys.argv[2]
             video = sys.argv[3] if len(sys.argv) > 3 else None
             zone_worker(zone, video)
+        elif sys.argv[1] == "queue":
+            # Batched consumer of the Redis frame queue: python worker.py queue <zone_type>
+            queue_worker(sys.argv[2])
         elif sys.argv[1] == "worker":
             # Legacy: python worker.py worker <event_type>
             event_worker(sys.argv[2])
@@ -20,9 +20,9 @@ import time
 import numpy as np
 
 
-@dataclass
+@dataclass(slots=True)
 class TrackedObject:
-    """Represents a tracked object from ByteTrack."""
+    """Represents a tracked object from ByteTrack (slotted: built for every track, every frame)."""
     object_id:    int
     class_name:   str
     bbox:         List[int]                     # [x1, y1, x2, y2]
@@ -42,7 +42,7 @@ class TrackedObject:
         return (self.bbox[2] - self.bbox[0]) * (self.bbox[3] - self.bbox[1])
 
 
-@dataclass
+@dataclass(slots=True)
 class FrameMetadata:
     """Metadata about the current frame being processed."""
     camera_id:  str